@@ -0,0 +1,114 @@
+import asyncio
+from datetime import datetime
+from typing import List
+
+import pytest
+
+from trading_backtester.backtester import Backtester
+from trading_backtester.data import CandlestickPhase, Data
+from trading_backtester.order import CloseOrder, OpenOrder, Order
+from trading_backtester.position import PositionType
+from trading_backtester.strategy import Strategy
+
+calls: List[str] = []
+
+
+class AsyncLongOnOpenCloseOnCloseStrategy(Strategy):
+    params = {"name": ""}
+
+    def __init__(self, **params):
+        super().__init__(**params)
+
+    async def collect_orders(
+        self, candlestick_phase: CandlestickPhase, price: float, date_time: datetime
+    ) -> List[Order]:
+        calls.append(self._params["name"])
+        await asyncio.sleep(0)  # stands in for a request to a model server
+
+        if candlestick_phase == CandlestickPhase.OPEN:
+            return [OpenOrder(size=1, position_type=PositionType.LONG)]
+
+        return [CloseOrder(size=1, position_type=PositionType.LONG)]
+
+
+@pytest.mark.parametrize(
+    "market_data",
+    [
+        [
+            (None, 10.0, 12.0, 10.0, 12.0, None),
+            (None, 12.0, 12.0, 9.0, 9.0, None),
+        ]
+    ],
+)
+def test_run_async(test_data: Data):
+    calls.clear()
+    backtest = Backtester(
+        data=test_data,
+        strategy=AsyncLongOnOpenCloseOnCloseStrategy,
+        money=100.0,
+    )
+    asyncio.run(backtest.run_async())
+
+    stats = backtest.get_statistics().get_stats()
+    assert stats["total_open_long_trades"] == 2
+    assert stats["total_close_long_trades"] == 2
+    assert stats["final_total_equity"] == pytest.approx(99.0, abs=0.01)
+
+
+@pytest.mark.parametrize(
+    "market_data",
+    [
+        [
+            (None, 10.0, 12.0, 10.0, 12.0, None),
+            (None, 12.0, 12.0, 9.0, 9.0, None),
+        ]
+    ],
+)
+def test_run_concurrently_interleaves_backtests(market_data):
+    calls.clear()
+    backtests = [
+        Backtester(
+            data=Data.from_array(market_data),
+            strategy=AsyncLongOnOpenCloseOnCloseStrategy,
+            money=100.0,
+            strategy_params={"name": name},
+        )
+        for name in ("first", "second")
+    ]
+    asyncio.run(Backtester.run_concurrently(backtests))
+
+    assert calls == ["first", "second"] * 4
+    for backtest in backtests:
+        stats = backtest.get_statistics().get_stats()
+        assert stats["final_total_equity"] == pytest.approx(99.0, abs=0.01)
+
+
+@pytest.mark.parametrize(
+    "market_data",
+    [
+        [
+            (None, 10.0, 12.0, 10.0, 12.0, None),
+            (None, 12.0, 12.0, 9.0, 9.0, None),
+        ]
+    ],
+)
+def test_run_concurrently_with_shared_data_fails(test_data: Data):
+    backtests = [
+        Backtester(data=test_data, strategy=AsyncLongOnOpenCloseOnCloseStrategy)
+        for _ in range(2)
+    ]
+
+    with pytest.raises(ValueError):
+        asyncio.run(Backtester.run_concurrently(backtests))
+    assert test_data.get_current_data_index() == 0
+
+
+@pytest.mark.parametrize(
+    "market_data",
+    [[(None, 10.0, 12.0, 10.0, 12.0, None)]],
+)
+def test_run_with_async_strategy_fails(test_data: Data):
+    backtest = Backtester(data=test_data, strategy=AsyncLongOnOpenCloseOnCloseStrategy)
+
+    with pytest.raises(TypeError):
+        backtest.run()
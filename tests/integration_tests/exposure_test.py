@@ -0,0 +1,95 @@
+from datetime import datetime
+from typing import List
+
+import numpy as np
+import pytest
+
+from trading_backtester.backtester import Backtester
+from trading_backtester.data import CandlestickPhase, Data
+from trading_backtester.order import CloseOrder, OpenOrder, Order
+from trading_backtester.position import PositionType
+from trading_backtester.stop_conditions import equity_below
+from trading_backtester.strategy import Strategy
+
+
+class LongUntilBelowSixStrategy(Strategy):
+    def __init__(self):
+        super().__init__()
+        self.opened = False
+
+    def collect_orders(
+        self, candlestick_phase: CandlestickPhase, price: float, date_time: datetime
+    ) -> List[Order]:
+        if candlestick_phase == CandlestickPhase.OPEN and not self.opened:
+            self.opened = True
+            return [OpenOrder(size=1, position_type=PositionType.LONG)]
+
+        if (
+            candlestick_phase == CandlestickPhase.CLOSE
+            and self._positions
+            and price < 6
+        ):
+            return [CloseOrder(size=1, position_type=PositionType.LONG)]
+
+        return []
+
+
+MARKET_DATA = [
+    (None, 10.0, 10.0, 10.0, 10.0, None),
+    (None, 10.0, 10.0, 8.0, 8.0, None),
+    (None, 8.0, 8.0, 5.0, 5.0, None),
+    (None, 5.0, 12.0, 5.0, 12.0, None),
+]
+
+
+@pytest.mark.parametrize("market_data", [MARKET_DATA])
+def test_exposure_log(test_data: Data):
+    backtest = Backtester(
+        data=test_data,
+        strategy=LongUntilBelowSixStrategy,
+        money=20.0,
+        record_exposure=True,
+    )
+    backtest.run()
+
+    exposure_log = backtest.get_exposure_log()
+    assert exposure_log is not None
+    assert exposure_log["cash"].tolist() == [20.0, 10.0, 10.0, 15.0, 15.0]
+    assert exposure_log["gross_exposure"].tolist() == [0.0, 10.0, 8.0, 0.0, 0.0]
+    assert exposure_log["net_exposure"].tolist() == [0.0, 10.0, 8.0, 0.0, 0.0]
+    assert exposure_log["open_positions"].tolist() == [0, 1, 1, 0, 0]
+    assert exposure_log["margin_used"].tolist() == [0.0, 10.0, 10.0, 0.0, 0.0]
+
+    stats = backtest.get_statistics().get_stats()
+    assert stats["exposure_time_percentage"] == pytest.approx(50.0)
+    assert stats["average_gross_exposure_percentage"] == pytest.approx(
+        np.mean([10.0 / 20.0, 8.0 / 18.0, 0.0, 0.0]) * 100
+    )
+    assert stats["turnover"] == pytest.approx(
+        (10.0 + 5.0) / np.mean([20.0, 20.0, 18.0, 15.0, 15.0])
+    )
+
+
+@pytest.mark.parametrize("market_data", [MARKET_DATA])
+def test_exposure_log_pruned(test_data: Data):
+    backtest = Backtester(
+        data=test_data,
+        strategy=LongUntilBelowSixStrategy,
+        money=20.0,
+        record_exposure=True,
+    )
+    backtest.run(stop_when=equity_below(19.0))
+
+    exposure_log = backtest.get_exposure_log()
+    assert exposure_log is not None
+    assert exposure_log["gross_exposure"].tolist() == [0.0, 10.0, 8.0, 8.0, 8.0]
+    assert exposure_log["open_positions"].tolist() == [0, 1, 1, 1, 1]
+
+
+@pytest.mark.parametrize("market_data", [MARKET_DATA])
+def test_exposure_not_recorded(test_data: Data):
+    backtest = Backtester(data=test_data, strategy=LongUntilBelowSixStrategy)
+    backtest.run()
+
+    assert backtest.get_exposure_log() is None
+    assert backtest.get_statistics().get_stats()["exposure_time_percentage"] is None
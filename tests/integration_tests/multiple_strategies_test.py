@@ -0,0 +1,112 @@
+from datetime import datetime
+from typing import List
+
+import numpy as np
+import pytest
+
+from trading_backtester.backtester import Backtester
+from trading_backtester.data import CandlestickPhase, Data
+from trading_backtester.order import CloseOrder, OpenOrder, Order
+from trading_backtester.position import PositionType
+from trading_backtester.strategy import Strategy
+
+
+class LongOnOpenCloseOnCloseStrategy(Strategy):
+    params = {"size": 1}
+
+    def __init__(self, **params):
+        super().__init__(**params)
+
+    def collect_orders(
+        self, candlestick_phase: CandlestickPhase, price: float, date_time: datetime
+    ) -> List[Order]:
+        if candlestick_phase == CandlestickPhase.OPEN:
+            return [
+                OpenOrder(size=self._params["size"], position_type=PositionType.LONG)
+            ]
+
+        return [
+            CloseOrder(size=self._positions.long_size, position_type=PositionType.LONG)
+        ]
+
+
+class ShortAndHoldStrategy(Strategy):
+    def collect_orders(
+        self, candlestick_phase: CandlestickPhase, price: float, date_time: datetime
+    ) -> List[Order]:
+        if len(self._positions) == 0:
+            return [OpenOrder(size=1, position_type=PositionType.SHORT)]
+
+        return []
+
+
+@pytest.mark.parametrize(
+    "market_data",
+    [
+        [
+            (None, 10.0, 12.0, 10.0, 12.0, None),
+            (None, 12.0, 12.0, 9.0, 9.0, None),
+            (None, 9.0, 11.0, 9.0, 11.0, None),
+        ]
+    ],
+)
+def test_multiple_strategies_share_account(test_data: Data):
+    backtest = Backtester(
+        data=test_data,
+        strategy=[LongOnOpenCloseOnCloseStrategy, ShortAndHoldStrategy],
+        money=100.0,
+        strategy_params=[{"size": 2}, None],
+    )
+    backtest.run()
+
+    stats = backtest.get_statistics().get_stats()
+    assert stats["total_open_long_trades"] == 3
+    assert stats["total_close_long_trades"] == 3
+    assert stats["total_open_short_trades"] == 1
+    assert stats["total_close_short_trades"] == 0
+
+    long_trades = backtest.get_strategy_trades(0)
+    short_trades = backtest.get_strategy_trades(1)
+    assert len(long_trades) == 6
+    assert len(short_trades) == 1
+    assert all(trade.position_type == PositionType.LONG for trade in long_trades)
+    assert short_trades[0].position_type == PositionType.SHORT
+
+    pnl_log = backtest.get_strategies_pnl_log()
+    assert pnl_log.shape == (2, 4)
+    # long: +4, -6, +4 ; short opened at 10: -2, +1, -1
+    assert np.allclose(pnl_log[0], [0.0, 4.0, -2.0, 2.0])
+    assert np.allclose(pnl_log[1], [0.0, -2.0, 1.0, -1.0])
+
+    equity_log = stats["final_total_equity"]
+    assert equity_log == pytest.approx(100.0 + pnl_log[:, -1].sum(), abs=0.01)
+
+
+@pytest.mark.parametrize(
+    "market_data",
+    [[(None, 10.0, 12.0, 10.0, 12.0, None)]],
+)
+def test_single_strategy_pnl_log(test_data: Data):
+    backtest = Backtester(
+        data=test_data, strategy=LongOnOpenCloseOnCloseStrategy, money=100.0
+    )
+    backtest.run()
+
+    assert np.allclose(backtest.get_strategies_pnl_log(), [[0.0, 2.0]])
+    assert all(trade.strategy_id == 0 for trade in backtest.get_strategy_trades(0))
+
+
+@pytest.mark.parametrize(
+    "market_data",
+    [[(None, 10.0, 12.0, 10.0, 12.0, None)]],
+)
+def test_invalid_strategy_params(test_data: Data):
+    with pytest.raises(ValueError):
+        Backtester(
+            data=test_data,
+            strategy=[LongOnOpenCloseOnCloseStrategy, ShortAndHoldStrategy],
+            strategy_params={"size": 2},
+        )
+
+    with pytest.raises(ValueError):
+        Backtester(data=test_data, strategy=[])
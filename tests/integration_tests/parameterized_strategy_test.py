@@ -0,0 +1,177 @@
+import os
+import pickle
+import subprocess
+import sys
+from datetime import datetime
+from typing import Any, List
+
+import numpy as np
+import pytest
+
+from trading_backtester.backtester import Backtester
+from trading_backtester.data import CandlestickPhase, Data
+from trading_backtester.indicator import Indicator
+from trading_backtester.order import CloseOrder, OpenOrder, Order
+from trading_backtester.position import PositionType
+from trading_backtester.strategy import Strategy, StrategyParams
+
+
+class SMAIndicator(Indicator):
+    def __init__(self, period: int):
+        super().__init__()
+        self.period = period
+
+    def _calc_indicator_values(self, data: Data) -> np.ndarray[Any, np.dtype[Any]]:
+        sma = np.convolve(data.close, np.ones(self.period) / self.period, mode="valid")
+        return np.concatenate([np.full(self.period - 1, np.nan), sma])
+
+
+class ParameterizedSMACrossoverStrategy(Strategy):
+    params = {"short_period": 2, "long_period": 3, "size": 1.0, "label": None}
+
+    def __init__(self, **params: Any):
+        super().__init__(**params)
+        self.short_sma = SMAIndicator(period=self._params["short_period"])
+        self.long_sma = SMAIndicator(period=self._params["long_period"])
+
+    def collect_orders(
+        self, candlestick_phase: CandlestickPhase, price: float, date_time: datetime
+    ) -> List[Order]:
+        if candlestick_phase == CandlestickPhase.OPEN:
+            return []
+
+        size = int(self._params["size"])
+        if (
+            self.short_sma[0] > self.long_sma[0]
+            and self.short_sma[-1] <= self.long_sma[-1]
+        ):
+            return [OpenOrder(size=size, position_type=PositionType.LONG)]
+        if (
+            self.short_sma[0] < self.long_sma[0]
+            and self.short_sma[-1] >= self.long_sma[-1]
+        ):
+            return [CloseOrder(size=size, position_type=PositionType.LONG)]
+
+        return []
+
+
+@pytest.mark.parametrize(
+    "market_data",
+    [
+        [
+            (None, 3.0, 3.0, 3.0, 3.0, None),
+            (None, 2.0, 2.0, 2.0, 2.0, None),
+            (None, 1.0, 1.0, 1.0, 1.0, None),
+            (None, 4.0, 4.0, 4.0, 4.0, None),
+            (None, 1.0, 1.0, 1.0, 1.0, None),
+            (None, 1.0, 1.0, 1.0, 1.0, None),
+        ]
+    ],
+)
+def test_parameterized_strategy(test_data: Data):
+    backtest = Backtester(
+        data=test_data,
+        strategy=ParameterizedSMACrossoverStrategy,
+        money=10.0,
+        strategy_params={"size": 2},
+    )
+    backtest.run()
+
+    stats = backtest.get_statistics().get_stats()
+    assert stats["total_open_long_trades"] == 1
+    assert stats["total_close_long_trades"] == 1
+    assert stats["final_money"] == pytest.approx(4.0, abs=0.01)
+
+
+def test_resolve_params_fills_defaults():
+    params = ParameterizedSMACrossoverStrategy.resolve_params({"short_period": 5})
+
+    assert dict(params) == {
+        "short_period": 5,
+        "long_period": 3,
+        "size": 1.0,
+        "label": None,
+    }
+    assert isinstance(
+        ParameterizedSMACrossoverStrategy.resolve_params({"size": 2})["size"], float
+    )
+
+
+def test_resolve_params_converts_numpy_numbers():
+    grid = [
+        ParameterizedSMACrossoverStrategy.resolve_params(
+            {"short_period": short_period, "size": size}
+        )
+        for short_period, size in zip(np.arange(5, 7), np.array([1, 2], np.int32))
+    ]
+
+    assert [type(params["short_period"]) for params in grid] == [int, int]
+    assert [type(params["size"]) for params in grid] == [float, float]
+    assert grid[0] == ParameterizedSMACrossoverStrategy.resolve_params(
+        {"short_period": 5, "size": 1.0}
+    )
+    assert {grid[1]: 1}[
+        ParameterizedSMACrossoverStrategy.resolve_params({"short_period": 6, "size": 2})
+    ] == 1
+
+
+def test_params_hashable_and_picklable():
+    params = ParameterizedSMACrossoverStrategy.resolve_params(
+        {"short_period": 5, "label": ("a", 1)}
+    )
+    same_params = ParameterizedSMACrossoverStrategy.resolve_params(
+        {"label": ("a", 1), "short_period": 5}
+    )
+
+    assert params == same_params
+    assert hash(params) == hash(same_params)
+    assert {params: 1}[same_params] == 1
+
+    unpickled_params = pickle.loads(pickle.dumps(params))
+    assert isinstance(unpickled_params, StrategyParams)
+    assert unpickled_params == params
+    assert hash(unpickled_params) == hash(params)
+
+
+def test_params_pickled_without_hash():
+    params = StrategyParams({"a": "x", "b": 2})
+    hash(params)
+
+    unpickled_params = pickle.loads(pickle.dumps(params))
+
+    assert unpickled_params._StrategyParams__hash is None
+    assert {StrategyParams({"b": 2, "a": "x"}): 1}[unpickled_params] == 1
+
+    # Hashes of strings differ between processes with different hash seeds
+    pickled_params = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "import pickle, sys\n"
+            "from trading_backtester.strategy import StrategyParams\n"
+            "params = StrategyParams({'a': 'x', 'b': 2})\n"
+            "hash(params)\n"
+            "sys.stdout.buffer.write(pickle.dumps(params))",
+        ],
+        capture_output=True,
+        check=True,
+        env={**os.environ, "PYTHONHASHSEED": "1"},
+    ).stdout
+    assert {StrategyParams({"a": "x", "b": 2}): 1}[pickle.loads(pickled_params)] == 1
+
+
+@pytest.mark.parametrize(
+    "params, error",
+    [
+        ({"unknown": 1}, ValueError),
+        ({"short_period": 2.5}, TypeError),
+        ({"short_period": True}, TypeError),
+        ({"short_period": np.float64(2.0)}, TypeError),
+        ({"size": np.bool_(True)}, TypeError),
+        ({"size": "1"}, TypeError),
+        ({"label": [1, 2]}, TypeError),
+    ],
+)
+def test_invalid_params(params, error):
+    with pytest.raises(error):
+        ParameterizedSMACrossoverStrategy.resolve_params(params)
@@ -0,0 +1,68 @@
+from datetime import datetime
+from typing import List
+
+import pytest
+
+from trading_backtester.backtester import Backtester
+from trading_backtester.data import CandlestickPhase, Data
+from trading_backtester.order import OpenOrder, Order
+from trading_backtester.position import PositionType
+from trading_backtester.stop_conditions import (
+    any_of,
+    equity_below,
+    max_drawdown_above,
+    too_few_trades,
+)
+from trading_backtester.strategy import Strategy
+
+
+class LongOnFirstOpenStrategy(Strategy):
+    def collect_orders(
+        self, candlestick_phase: CandlestickPhase, price: float, date_time: datetime
+    ) -> List[Order]:
+        if candlestick_phase == CandlestickPhase.CLOSE or len(self._positions) > 0:
+            return []
+
+        return [OpenOrder(size=1, position_type=PositionType.LONG)]
+
+
+MARKET_DATA = [
+    (None, 10.0, 10.0, 10.0, 10.0, None),
+    (None, 10.0, 10.0, 8.0, 8.0, None),
+    (None, 8.0, 8.0, 5.0, 5.0, None),
+    (None, 5.0, 12.0, 5.0, 12.0, None),
+]
+
+
+@pytest.mark.parametrize("market_data", [MARKET_DATA])
+def test_not_pruned(test_data: Data):
+    backtest = Backtester(data=test_data, strategy=LongOnFirstOpenStrategy, money=10.0)
+    backtest.run(stop_when=equity_below(1.0))
+
+    assert backtest.is_pruned() is False
+    assert backtest.get_pruned_data_index() is None
+    assert backtest.get_statistics().get_stats()["final_total_equity"] == 12.0
+
+
+@pytest.mark.parametrize("market_data", [MARKET_DATA])
+@pytest.mark.parametrize(
+    "stop_when, pruned_data_index, final_total_equity",
+    [
+        (equity_below(9.0), 1, 8.0),
+        (max_drawdown_above(40.0, percentage=True), 2, 5.0),
+        (too_few_trades(2, by_data_index=1), 1, 8.0),
+        (any_of(max_drawdown_above(4.0), equity_below(9.0)), 1, 8.0),
+    ],
+)
+def test_pruned(
+    test_data: Data, stop_when, pruned_data_index: int, final_total_equity: float
+):
+    backtest = Backtester(data=test_data, strategy=LongOnFirstOpenStrategy, money=10.0)
+    backtest.run(stop_when=stop_when)
+
+    assert backtest.is_pruned() is True
+    assert backtest.get_pruned_data_index() == pruned_data_index
+
+    stats = backtest.get_statistics().get_stats()
+    assert stats["final_total_equity"] == pytest.approx(final_total_equity)
+    assert stats["total_trades"] == 1
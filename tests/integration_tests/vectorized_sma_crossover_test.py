@@ -0,0 +1,143 @@
+from typing import Any, Optional
+
+import numpy as np
+import pytest
+
+from trading_backtester.backtester import Backtester
+from trading_backtester.data import CandlestickPhase, Data
+from trading_backtester.indicator import Indicator
+from trading_backtester.order import OrderAction
+from trading_backtester.order_arrays import OrderArrays
+from trading_backtester.position import PositionType
+from trading_backtester.strategy import Strategy
+
+
+class SMAIndicator(Indicator):
+    def __init__(self, period: int):
+        super().__init__()
+        self.period = period
+
+    def _calc_indicator_values(self, data: Data) -> np.ndarray[Any, np.dtype[Any]]:
+        sma = np.convolve(data.close, np.ones(self.period) / self.period, mode="valid")
+        return np.concatenate([np.full(self.period - 1, np.nan), sma])
+
+
+class VectorizedSMACrossoverStrategy(Strategy):
+    def __init__(self):
+        super().__init__()
+        self.short_sma = SMAIndicator(period=2)
+        self.long_sma = SMAIndicator(period=3)
+
+    def generate_orders(self, data: Data) -> Optional[OrderArrays]:
+        short_sma = self.short_sma.get_indicator_values()
+        long_sma = self.long_sma.get_indicator_values()
+
+        above = short_sma > long_sma
+        below = short_sma < long_sma
+        crossed_above = np.flatnonzero(above[1:] & (short_sma[:-1] <= long_sma[:-1]))
+        crossed_below = np.flatnonzero(below[1:] & (short_sma[:-1] >= long_sma[:-1]))
+
+        index = np.concatenate([crossed_above, crossed_below]) + 1
+        action = np.concatenate(
+            [
+                np.full(len(crossed_above), OrderAction.OPEN.value),
+                np.full(len(crossed_below), OrderAction.CLOSE.value),
+            ]
+        )
+
+        return OrderArrays(
+            index=index,
+            phase=CandlestickPhase.CLOSE,
+            action=action,
+            position_type=PositionType.LONG,
+            size=1,
+        )
+
+
+@pytest.mark.parametrize(
+    "market_data",
+    [
+        [
+            (None, 3.0, 3.0, 3.0, 3.0, None),
+            (None, 2.0, 2.0, 2.0, 2.0, None),
+            (None, 1.0, 1.0, 1.0, 1.0, None),
+            (None, 4.0, 4.0, 4.0, 4.0, None),  # cross above -> open long
+            (None, 1.0, 1.0, 1.0, 1.0, None),
+            (None, 1.0, 1.0, 1.0, 1.0, None),  # cross below -> close long
+        ]
+    ],
+)
+def test_vectorized_sma_crossover_strategy(test_data: Data):
+    backtest = Backtester(
+        data=test_data,
+        strategy=VectorizedSMACrossoverStrategy,
+        money=10.0,
+    )
+    backtest.run()
+
+    stats = backtest.get_statistics().get_stats()
+    assert stats["total_trades"] == 2
+    assert stats["total_open_long_trades"] == 1
+    assert stats["total_close_long_trades"] == 1
+    assert stats["final_money"] == pytest.approx(7.0, abs=0.01)
+    assert stats["final_assets_value"] == 0
+    assert stats["return"] == pytest.approx(-3.0, abs=0.01)
+
+
+def test_order_arrays_sorted_by_candlestick_and_phase():
+    order_arrays = OrderArrays(
+        index=[3, 1, 1],
+        phase=[
+            CandlestickPhase.OPEN.value,
+            CandlestickPhase.CLOSE.value,
+            CandlestickPhase.OPEN.value,
+        ],
+        action=OrderAction.OPEN,
+        position_type=[
+            PositionType.LONG.value,
+            PositionType.SHORT.value,
+            PositionType.LONG.value,
+        ],
+        size=[1, 2, 3],
+        stop_loss=[np.nan, 120.0, 90.0],
+    )
+
+    assert len(order_arrays) == 3
+    assert order_arrays.get_orders(0, CandlestickPhase.OPEN) == []
+
+    open_orders = order_arrays.get_orders(1, CandlestickPhase.OPEN)
+    assert len(open_orders) == 1
+    assert open_orders[0].size == 3
+    assert open_orders[0].position_type == PositionType.LONG
+    assert open_orders[0].stop_loss == 90.0
+    assert open_orders[0].limit_price is None
+
+    close_orders = order_arrays.get_orders(1, CandlestickPhase.CLOSE)
+    assert len(close_orders) == 1
+    assert close_orders[0].size == 2
+    assert close_orders[0].position_type == PositionType.SHORT
+
+    assert order_arrays.get_orders(3, CandlestickPhase.OPEN)[0].stop_loss is None
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"size": [1, 2, 3]},
+        {"size": 0},
+        {"action": OrderAction.CLOSE, "stop_loss": 10.0},
+        {"phase": 3},
+    ],
+)
+def test_order_arrays_invalid(kwargs):
+    arguments = {
+        "index": [0, 1],
+        "phase": CandlestickPhase.OPEN,
+        "action": OrderAction.OPEN,
+        "position_type": PositionType.LONG,
+        "size": 1,
+    }
+    arguments.update(kwargs)
+
+    with pytest.raises(ValueError):
+        OrderArrays(**arguments)
@@ -0,0 +1,74 @@
+from typing import List
+
+import pytest
+
+from trading_backtester.account import Account
+from trading_backtester.broker import Broker
+from trading_backtester.data import CandlestickPhase, Data
+from trading_backtester.order import CloseOrder, OpenOrder
+from trading_backtester.position import PositionType
+from trading_backtester.trade import Trade, TradeType
+
+
+@pytest.mark.parametrize(
+    "market_data",
+    [[(None, 10.0, 10.0, 10.0, 10.0, None), (None, 10.0, 15.0, 9.0, 12.0, None)]],
+)
+def test_close_long_fifo(
+    test_data: Data, test_account: Account, test_broker: Broker, trades_log: List[Trade]
+):
+    test_broker.process_new_orders([OpenOrder(size=2, position_type=PositionType.LONG)])
+    test_data.increment_data_index()
+
+    test_broker.process_new_orders(
+        [CloseOrder(size=1, position_type=PositionType.LONG, limit_price=11.0)]
+    )
+    test_broker.process_limit_orders()
+
+    assert len(trades_log) == 1
+    assert len(test_broker.get_limit_orders_view()) == 1
+
+    test_data.set_candlestick_phase(CandlestickPhase.CLOSE)
+    test_broker.process_limit_orders()
+
+    assert len(trades_log) == 2
+    assert trades_log[1].trade_type == TradeType.CLOSE
+    assert trades_log[1].position_type == PositionType.LONG
+    assert trades_log[1].close_price == pytest.approx(11.0, abs=0.01)
+    assert trades_log[1].close_size == 1
+    assert trades_log[1].market_order is False
+
+    assert len(test_broker.get_limit_orders_view()) == 0
+    assert test_broker.get_positions()[0].size == 1
+    assert test_account.current_money == pytest.approx(91.0, abs=0.01)
+
+
+@pytest.mark.parametrize(
+    "market_data",
+    [[(None, 10.0, 10.0, 10.0, 10.0, None), (None, 8.0, 9.0, 6.0, 7.0, None)]],
+)
+def test_close_short_specified_position(
+    test_data: Data, test_account: Account, test_broker: Broker, trades_log: List[Trade]
+):
+    test_broker.process_new_orders(
+        [
+            OpenOrder(size=1, position_type=PositionType.SHORT),
+            OpenOrder(size=1, position_type=PositionType.SHORT),
+        ]
+    )
+    second_position = test_broker.get_positions()[1]
+    test_broker.process_new_orders(
+        [CloseOrder(size=1, position_to_close=second_position, limit_price=8.0)]
+    )
+    test_data.increment_data_index()
+
+    test_broker.process_limit_orders()
+
+    assert len(trades_log) == 3
+    assert trades_log[2].trade_type == TradeType.CLOSE
+    assert trades_log[2].position_type == PositionType.SHORT
+    assert trades_log[2].close_price == pytest.approx(8.0, abs=0.01)
+
+    assert list(test_broker.get_positions()) == [test_broker.get_positions()[0]]
+    assert second_position not in test_broker.get_positions()
+    assert test_account.current_money == pytest.approx(92.0, abs=0.01)
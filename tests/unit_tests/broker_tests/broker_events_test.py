@@ -0,0 +1,175 @@
+from datetime import datetime
+from typing import List, Tuple
+
+import pytest
+
+from trading_backtester.broker import Broker
+from trading_backtester.data import CandlestickPhase, Data
+from trading_backtester.order import (
+    CloseOrder,
+    OpenOrder,
+    Order,
+    OrderRejectionReason,
+)
+from trading_backtester.position import PositionType
+from trading_backtester.strategy import Strategy
+from trading_backtester.trade import Trade, TradeType
+
+
+class RecordingStrategy(Strategy):
+    def __init__(self):
+        super().__init__()
+        self.events: List[Tuple[str, Trade]] = []
+        self.rejections: List[Tuple[Order, OrderRejectionReason]] = []
+
+    def collect_orders(
+        self, candlestick_phase: CandlestickPhase, price: float, date_time: datetime
+    ) -> List[Order]:
+        return []
+
+    def on_fill(self, trade: Trade) -> None:
+        self.events.append(("fill", trade))
+
+    def on_close(self, trade: Trade) -> None:
+        self.events.append(("close", trade))
+
+    def on_stop_loss(self, trade: Trade) -> None:
+        self.events.append(("stop_loss", trade))
+
+    def on_take_profit(self, trade: Trade) -> None:
+        self.events.append(("take_profit", trade))
+
+    def on_order_rejected(self, order: Order, reason: OrderRejectionReason) -> None:
+        self.rejections.append((order, reason))
+
+
+@pytest.fixture
+def strategy(test_broker: Broker) -> RecordingStrategy:
+    strategy = RecordingStrategy()
+    test_broker.set_strategy(strategy)
+    return strategy
+
+
+@pytest.mark.parametrize(
+    "market_data",
+    [[(None, 10.0, 10.0, 10.0, 10.0, None), (None, 12.0, 15.0, 5.0, 12.0, None)]],
+)
+def test_fill_and_close_events(
+    test_data: Data,
+    test_broker: Broker,
+    trades_log: List[Trade],
+    strategy: RecordingStrategy,
+):
+    test_broker.process_new_orders([OpenOrder(size=2, position_type=PositionType.LONG)])
+
+    assert [name for name, _ in strategy.events] == ["fill"]
+    assert strategy.events[0][1] is trades_log[0]
+    assert strategy.events[0][1].trade_type == TradeType.OPEN
+
+    test_data.set_candlestick_phase(CandlestickPhase.CLOSE)
+    test_broker.process_new_orders(
+        [CloseOrder(size=2, position_type=PositionType.LONG)]
+    )
+
+    assert [name for name, _ in strategy.events] == ["fill", "close"]
+    assert strategy.events[1][1] is trades_log[1]
+    assert strategy.rejections == []
+
+
+@pytest.mark.parametrize(
+    "market_data",
+    [[(None, 10.0, 10.0, 10.0, 10.0, None), (None, 10.0, 15.0, 5.0, 12.0, None)]],
+)
+def test_stop_loss_and_take_profit_events(
+    test_data: Data,
+    test_broker: Broker,
+    trades_log: List[Trade],
+    strategy: RecordingStrategy,
+):
+    test_broker.process_new_orders(
+        [
+            OpenOrder(size=1, position_type=PositionType.LONG, stop_loss=8.0),
+            OpenOrder(size=1, position_type=PositionType.LONG, take_profit=14.0),
+        ]
+    )
+
+    test_data.increment_data_index()
+    test_data.set_candlestick_phase(CandlestickPhase.CLOSE)
+    test_broker.process_stop_losses()
+    test_broker.process_take_profits()
+
+    assert [name for name, _ in strategy.events] == [
+        "fill",
+        "fill",
+        "stop_loss",
+        "take_profit",
+    ]
+    assert strategy.events[2][1].close_price == pytest.approx(8.0, abs=0.01)
+    assert strategy.events[3][1].close_price == pytest.approx(14.0, abs=0.01)
+
+
+@pytest.mark.parametrize(
+    "market_data",
+    [[(None, 10.0, 10.0, 10.0, 10.0, None)]],
+)
+def test_limit_order_fill_event(
+    test_broker: Broker,
+    strategy: RecordingStrategy,
+):
+    test_broker.process_new_orders(
+        [OpenOrder(size=1, position_type=PositionType.LONG, limit_price=11.0)]
+    )
+    test_broker.process_limit_orders()
+
+    assert [name for name, _ in strategy.events] == ["fill"]
+    assert strategy.events[0][1].market_order is False
+
+
+@pytest.mark.parametrize(
+    "market_data",
+    [[(None, 10.0, 10.0, 10.0, 10.0, None)]],
+)
+def test_rejected_orders(
+    test_broker: Broker,
+    trades_log: List[Trade],
+    strategy: RecordingStrategy,
+):
+    too_big_order = OpenOrder(size=100, position_type=PositionType.LONG)
+    nothing_to_close_order = CloseOrder(size=1, position_type=PositionType.SHORT)
+
+    test_broker.process_new_orders([too_big_order, nothing_to_close_order])
+
+    assert strategy.events == []
+    assert strategy.rejections == [
+        (too_big_order, OrderRejectionReason.INSUFFICIENT_MONEY),
+        (nothing_to_close_order, OrderRejectionReason.NO_POSITION_TO_CLOSE),
+    ]
+    assert len(trades_log) == 0
+
+
+@pytest.mark.parametrize(
+    "market_data",
+    [[(None, 10.0, 10.0, 10.0, 10.0, None), (None, 12.0, 12.0, 12.0, 12.0, None)]],
+)
+def test_close_limit_order_of_closed_position_rejected(
+    test_data: Data,
+    test_broker: Broker,
+    trades_log: List[Trade],
+    strategy: RecordingStrategy,
+):
+    test_broker.process_new_orders([OpenOrder(size=1, position_type=PositionType.LONG)])
+    position = test_broker.get_positions()[0]
+    close_limit_order = CloseOrder(size=1, position_to_close=position, limit_price=11.0)
+    test_broker.process_new_orders(
+        [close_limit_order, CloseOrder(size=1, position_type=PositionType.LONG)]
+    )
+
+    test_data.increment_data_index()
+    test_broker.process_limit_orders()
+
+    assert [name for name, _ in strategy.events] == ["fill", "close"]
+    assert strategy.rejections == [
+        (close_limit_order, OrderRejectionReason.POSITION_NOT_FOUND)
+    ]
+    assert len(test_broker.get_limit_orders_view()) == 0
+    assert len(trades_log) == 2
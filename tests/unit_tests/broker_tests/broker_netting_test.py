@@ -0,0 +1,162 @@
+from datetime import datetime
+from typing import List, Tuple
+
+import pytest
+
+from trading_backtester.account import Account
+from trading_backtester.broker import Broker
+from trading_backtester.commission import Commission
+from trading_backtester.data import CandlestickPhase, Data
+from trading_backtester.order import CloseOrder, OpenOrder, Order, OrderRejectionReason
+from trading_backtester.position import PositionMode, PositionType
+from trading_backtester.spread import Spread
+from trading_backtester.stats import Statistics
+from trading_backtester.strategy import Strategy
+from trading_backtester.trade import Trade, TradeType
+
+
+@pytest.fixture
+def netting_broker(
+    test_data: Data,
+    test_account: Account,
+    spread: Spread,
+    commission: Commission,
+    trades_log: List[Trade],
+) -> Broker:
+    return Broker(
+        data=test_data,
+        accout=test_account,
+        spread=spread,
+        commission=commission,
+        trades_log=trades_log,
+        statistics=Statistics(trades_log, test_account, test_data),
+        position_mode=PositionMode.NETTING,
+    )
+
+
+@pytest.mark.parametrize(
+    "market_data",
+    [[(None, 10.0, 10.0, 10.0, 10.0, None), (None, 20.0, 20.0, 20.0, 20.0, None)]],
+)
+def test_open_orders_merged_into_one_position(
+    test_data: Data, netting_broker: Broker, trades_log: List[Trade]
+):
+    netting_broker.process_new_orders(
+        [
+            OpenOrder(size=1, position_type=PositionType.LONG),
+            OpenOrder(size=1, position_type=PositionType.SHORT),
+        ]
+    )
+    test_data.increment_data_index()
+    netting_broker.process_new_orders(
+        [OpenOrder(size=3, position_type=PositionType.LONG, stop_loss=15.0)]
+    )
+
+    positions = netting_broker.get_positions()
+    assert len(positions) == 2
+    assert positions[0].position_type == PositionType.LONG
+    assert positions[0].size == 4
+    assert positions[0].open_price == pytest.approx(17.5, abs=0.01)
+    assert positions[0].stop_loss == 15.0
+    assert positions.aggregates.get_open_value(PositionType.LONG) == pytest.approx(70.0)
+
+    assert len(trades_log) == 3
+    assert all(trade.trade_type == TradeType.OPEN for trade in trades_log)
+
+
+@pytest.mark.parametrize(
+    "market_data",
+    [[(None, 10.0, 10.0, 10.0, 10.0, None), (None, 20.0, 20.0, 20.0, 20.0, None)]],
+)
+def test_partial_close_in_place(
+    test_data: Data,
+    test_account: Account,
+    netting_broker: Broker,
+    trades_log: List[Trade],
+):
+    netting_broker.process_new_orders(
+        [
+            OpenOrder(size=2, position_type=PositionType.LONG),
+            OpenOrder(size=2, position_type=PositionType.LONG),
+        ]
+    )
+    position = netting_broker.get_positions()[0]
+    test_data.increment_data_index()
+
+    netting_broker.process_new_orders(
+        [
+            CloseOrder(size=1, position_type=PositionType.LONG),
+            CloseOrder(size=2, position_to_close=position),
+        ]
+    )
+
+    assert netting_broker.get_positions()[0] is position
+    assert position.size == 1
+    assert position.open_price == pytest.approx(10.0, abs=0.01)
+    assert [trade.close_size for trade in trades_log[2:]] == [1, 2]
+    assert trades_log[2].open_price == pytest.approx(10.0, abs=0.01)
+    assert trades_log[2].close_price == pytest.approx(20.0, abs=0.01)
+    assert test_account.current_money == pytest.approx(120.0, abs=0.01)
+
+    netting_broker.process_new_orders(
+        [CloseOrder(size=5, position_type=PositionType.LONG)]
+    )
+
+    assert len(netting_broker.get_positions()) == 0
+    assert trades_log[-1].close_size == 1
+    assert netting_broker.get_assets_value() == 0.0
+
+
+class RejectionsRecordingStrategy(Strategy):
+    def __init__(self):
+        super().__init__()
+        self.rejections: List[Tuple[Order, OrderRejectionReason]] = []
+
+    def collect_orders(
+        self, candlestick_phase: CandlestickPhase, price: float, date_time: datetime
+    ) -> List[Order]:
+        return []
+
+    def on_order_rejected(self, order: Order, reason: OrderRejectionReason) -> None:
+        self.rejections.append((order, reason))
+
+
+@pytest.mark.parametrize(
+    "market_data",
+    [[(None, 50.0, 50.0, 50.0, 50.0, None), (None, 40.0, 40.0, 40.0, 40.0, None)]],
+)
+def test_order_with_levels_invalid_for_net_position_rejected(
+    test_data: Data,
+    test_account: Account,
+    netting_broker: Broker,
+    trades_log: List[Trade],
+):
+    strategy = RejectionsRecordingStrategy()
+    netting_broker.set_strategy(strategy)
+    netting_broker.process_new_orders(
+        [OpenOrder(size=1, position_type=PositionType.LONG)]
+    )
+    test_data.increment_data_index()
+
+    # Valid for the fill price (40), but not for the average open price (45)
+    invalid_order = OpenOrder(size=1, position_type=PositionType.LONG, take_profit=42.0)
+    netting_broker.process_new_orders([invalid_order])
+
+    position = netting_broker.get_positions()[0]
+    assert strategy.rejections == [(invalid_order, OrderRejectionReason.INVALID_LEVELS)]
+    assert position.size == 1
+    assert position.open_price == 50.0
+    assert position.take_profit is None
+    assert netting_broker.get_positions().aggregates.get_open_value(
+        PositionType.LONG
+    ) == pytest.approx(50.0)
+    assert test_account.current_money == pytest.approx(50.0)
+    assert len(trades_log) == 1
+
+    netting_broker.process_new_orders(
+        [OpenOrder(size=1, position_type=PositionType.LONG, take_profit=46.0)]
+    )
+
+    assert position.size == 2
+    assert position.take_profit == 46.0
+    assert test_account.current_money == pytest.approx(10.0)
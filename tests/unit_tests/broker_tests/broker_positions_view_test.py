@@ -0,0 +1,105 @@
+import pytest
+
+from trading_backtester.broker import Broker
+from trading_backtester.data import CandlestickPhase, Data
+from trading_backtester.order import CloseOrder, OpenOrder
+from trading_backtester.position import PositionType
+
+
+@pytest.mark.parametrize("market_data", [[(None, 10.0, 10.0, 10.0, 20.0, None)]])
+def test_view_reflects_positions(test_data: Data, test_broker: Broker):
+    positions = test_broker.get_positions_view()
+
+    assert len(positions) == 0
+    assert positions.long_size == 0
+    assert positions.short_size == 0
+    assert positions.average_long_open_price is None
+    assert positions.average_short_open_price is None
+
+    test_broker.process_new_orders(
+        [
+            OpenOrder(size=1, position_type=PositionType.LONG),
+            OpenOrder(size=2, position_type=PositionType.SHORT),
+        ]
+    )
+    test_data.set_candlestick_phase(CandlestickPhase.CLOSE)
+    test_broker.process_new_orders([OpenOrder(size=3, position_type=PositionType.LONG)])
+
+    assert test_broker.get_positions_view() is positions
+    assert len(positions) == 3
+    assert positions.count(positions[0]) == 1
+    assert not hasattr(positions[0], "reduce")
+    assert not hasattr(positions[0], "increase")
+    assert positions[0].position_type == PositionType.LONG
+    assert positions[-1].size == 3
+    assert [position.size for position in positions] == [1, 2, 3]
+    assert [position.size for position in reversed(positions)] == [3, 2, 1]
+    assert positions.long_size == 4
+    assert positions.short_size == 2
+    assert positions.average_long_open_price == pytest.approx(17.5, abs=0.01)
+    assert positions.average_short_open_price == pytest.approx(10.0, abs=0.01)
+
+
+@pytest.mark.parametrize("market_data", [[(None, 10.0, 10.0, 10.0, 20.0, None)]])
+def test_view_aggregates_after_close(test_data: Data, test_broker: Broker):
+    positions = test_broker.get_positions_view()
+    test_broker.process_new_orders(
+        [
+            OpenOrder(size=2, position_type=PositionType.LONG),
+            OpenOrder(size=1, position_type=PositionType.SHORT),
+        ]
+    )
+    test_data.set_candlestick_phase(CandlestickPhase.CLOSE)
+    test_broker.process_new_orders([OpenOrder(size=2, position_type=PositionType.LONG)])
+
+    test_broker.process_new_orders(
+        [CloseOrder(size=3, position_type=PositionType.LONG)]
+    )
+
+    assert len(positions) == 2
+    assert positions.long_size == 1
+    assert positions.average_long_open_price == pytest.approx(20.0, abs=0.01)
+
+    test_broker.process_new_orders(
+        [
+            CloseOrder(size=1, position_to_close=positions[0]),
+            CloseOrder(size=1, position_type=PositionType.LONG),
+        ]
+    )
+
+    assert len(positions) == 0
+    assert positions.long_size == 0
+    assert positions.short_size == 0
+    assert positions.average_long_open_price is None
+    assert positions.average_short_open_price is None
+
+
+@pytest.mark.parametrize(
+    "market_data",
+    [[(None, 10.0, 10.0, 10.0, 10.0, None), (None, 20.0, 20.0, 20.0, 20.0, None)]],
+)
+def test_assets_value_matches_positions(test_data: Data, test_broker: Broker):
+    test_broker.process_new_orders(
+        [
+            OpenOrder(size=2, position_type=PositionType.LONG),
+            OpenOrder(size=3, position_type=PositionType.SHORT),
+        ]
+    )
+    test_data.increment_data_index()
+    test_broker.process_new_orders(
+        [
+            OpenOrder(size=1, position_type=PositionType.SHORT),
+            CloseOrder(size=1, position_type=PositionType.SHORT),
+        ]
+    )
+
+    for price in (5.0, 20.0, 35.0):
+        expected_value = sum(
+            position.calc_value(price) for position in test_broker.get_positions()
+        )
+        assert test_broker.get_assets_value_at_price(price) == pytest.approx(
+            expected_value
+        )
+    assert test_broker.get_assets_value() == pytest.approx(
+        test_broker.get_assets_value_at_price(20.0)
+    )
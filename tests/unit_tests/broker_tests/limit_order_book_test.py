@@ -0,0 +1,55 @@
+from trading_backtester.limit_order_book import LimitOrderBook, LimitOrdersView
+from trading_backtester.order import CloseOrder, OpenOrder
+from trading_backtester.position import PositionType
+
+
+def test_pop_triggered_in_placement_order():
+    book = LimitOrderBook()
+    sell_short = OpenOrder(size=1, position_type=PositionType.SHORT, limit_price=9.0)
+    buy_long = OpenOrder(size=1, position_type=PositionType.LONG, limit_price=11.0)
+    far_buy_long = OpenOrder(size=1, position_type=PositionType.LONG, limit_price=5.0)
+    close_long = CloseOrder(size=1, position_type=PositionType.LONG, limit_price=10.0)
+    close_short = CloseOrder(size=1, position_type=PositionType.SHORT, limit_price=20.0)
+    for order in (sell_short, buy_long, far_buy_long, close_long, close_short):
+        book.add(order)
+
+    assert book.pop_triggered(buy_price=10.0, sell_price=10.0) == [
+        sell_short,
+        buy_long,
+        close_long,
+        close_short,
+    ]
+    assert list(book) == [far_buy_long]
+    assert book.pop_triggered(buy_price=10.0, sell_price=10.0) == []
+
+
+def test_cancel():
+    book = LimitOrderBook()
+    view = LimitOrdersView(book)
+    first_order = OpenOrder(size=1, position_type=PositionType.LONG, limit_price=11.0)
+    second_order = OpenOrder(size=1, position_type=PositionType.LONG, limit_price=12.0)
+    book.add(first_order)
+    book.add(second_order)
+
+    assert view.cancel(first_order) is True
+    assert view.cancel(first_order) is False
+    assert first_order not in view
+    assert len(view) == 1
+
+    assert book.pop_triggered(buy_price=10.0, sell_price=0.0) == [second_order]
+    assert view.cancel(second_order) is False
+
+
+def test_cancelled_orders_are_dropped():
+    book = LimitOrderBook()
+    orders = [
+        OpenOrder(size=1, position_type=PositionType.LONG, limit_price=float(price))
+        for price in range(100)
+    ]
+    for order in orders:
+        book.add(order)
+    for order in orders[:-1]:
+        book.cancel(order)
+
+    assert len(book) == 1
+    assert book.pop_triggered(buy_price=0.0, sell_price=0.0) == [orders[-1]]
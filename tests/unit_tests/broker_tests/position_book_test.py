@@ -0,0 +1,127 @@
+import numpy as np
+import pytest
+
+from trading_backtester.position import Position, PositionType
+from trading_backtester.position_book import PositionBook
+
+
+def create_position(position_type: PositionType, size: int = 1) -> Position:
+    return Position(position_type, 10.0, np.datetime64("2025-01-01"), size)
+
+
+def test_keeps_opening_order():
+    book = PositionBook()
+    first_long = create_position(PositionType.LONG)
+    first_short = create_position(PositionType.SHORT)
+    second_long = create_position(PositionType.LONG)
+
+    book.add(first_long)
+    book.add(first_short)
+    book.add(second_long)
+
+    assert len(book) == 3
+    assert list(book) == [first_long, first_short, second_long]
+    assert list(reversed(book)) == [second_long, first_short, first_long]
+    assert book[0] is first_long
+    assert book[1] is first_short
+    assert book[-1] is second_long
+    assert book[0:2] == [first_long, first_short]
+    assert book.get_first(PositionType.LONG) is first_long
+    assert book.get_first(PositionType.SHORT) is first_short
+
+    with pytest.raises(IndexError):
+        book[3]
+
+
+def test_remove():
+    book = PositionBook()
+    first_long = create_position(PositionType.LONG, size=3)
+    second_long = create_position(PositionType.LONG)
+    book.add(first_long)
+    book.add(second_long)
+
+    assert book.aggregates.get_size(PositionType.LONG) == 4
+
+    book.remove(first_long)
+
+    assert list(book) == [second_long]
+    assert book.get_first(PositionType.LONG) is second_long
+    assert book.get_first(PositionType.SHORT) is None
+    assert book.aggregates.get_size(PositionType.LONG) == 1
+    assert book.aggregates.get_open_value(PositionType.LONG) == pytest.approx(10.0)
+
+    assert first_long not in book
+
+    with pytest.raises(ValueError):
+        book.remove(first_long)
+
+
+def test_pop_triggered_stop_losses():
+    book = PositionBook()
+    first_long = Position(PositionType.LONG, 10.0, np.datetime64("2025-01-01"), 1, 8.0)
+    second_long = Position(PositionType.LONG, 10.0, np.datetime64("2025-01-01"), 1, 9.0)
+    third_long = Position(PositionType.LONG, 10.0, np.datetime64("2025-01-01"), 1, 5.0)
+    short = Position(PositionType.SHORT, 10.0, np.datetime64("2025-01-01"), 1, 12.0)
+    for position in (first_long, second_long, third_long, short):
+        book.add(position)
+
+    assert book.pop_triggered_stop_losses(9.5, 11.0) == []
+    assert book.pop_triggered_stop_losses(8.0, 12.0) == [first_long, second_long, short]
+    assert book.pop_triggered_stop_losses(8.0, 12.0) == []
+
+    third_long.update_stop_loss(6.0)
+    assert book.pop_triggered_stop_losses(6.5, 20.0) == []
+    assert book.pop_triggered_stop_losses(6.0, 20.0) == [third_long]
+
+
+def test_pop_triggered_take_profits_skips_outdated_entries():
+    book = PositionBook()
+    long = Position(PositionType.LONG, 10.0, np.datetime64("2025-01-01"), 2, None, 12.0)
+    short = Position(
+        PositionType.SHORT, 10.0, np.datetime64("2025-01-01"), 1, None, 8.0
+    )
+    book.add(long)
+    book.add(short)
+
+    long.update_take_profit(15.0)
+    book.remove(short)
+
+    assert book.pop_triggered_take_profits(14.0, 8.0) == []
+    assert book.pop_triggered_take_profits(15.0, 8.0) == [long]
+
+    book.remove(long)
+    long.update_take_profit(11.0)
+    assert book.pop_triggered_take_profits(19.0, 0.0) == []
+
+
+def test_reduce_in_place_and_export():
+    book = PositionBook()
+    long = Position(PositionType.LONG, 10.0, np.datetime64("2025-01-01"), 3, 8.0)
+    short = Position(
+        PositionType.SHORT, 12.0, np.datetime64("2025-01-02"), 2, None, 9.0
+    )
+    book.add(long)
+    book.add(short)
+
+    book.reduce(long, 2)
+
+    assert book[0] is long
+    assert long.size == 1
+    assert book.aggregates.get_size(PositionType.LONG) == 1
+    assert book.to_list() == [long, short]
+
+    arrays = book.to_arrays()
+    assert arrays["position_type"].tolist() == [
+        PositionType.LONG.value,
+        PositionType.SHORT.value,
+    ]
+    assert arrays["open_price"].tolist() == [10.0, 12.0]
+    assert arrays["open_datetime"][1] == np.datetime64("2025-01-02")
+    assert arrays["size"].tolist() == [1, 2]
+    assert np.array_equal(arrays["stop_loss"], [8.0, np.nan], equal_nan=True)
+    assert np.array_equal(arrays["take_profit"], [np.nan, 9.0], equal_nan=True)
+
+    with pytest.raises(ValueError):
+        book.reduce(long, 1)
+    with pytest.raises(AttributeError):
+        long.extra = 1
@@ -0,0 +1,126 @@
+import os
+from typing import Any, Set
+
+import numpy as np
+import pytest
+
+from trading_backtester.data import Data
+from trading_backtester.indicator import Indicator
+from trading_backtester.indicator_store import IndicatorStore
+
+
+class CountingIndicator(Indicator):
+    calculations = 0
+
+    def __init__(self, period: int):
+        super().__init__()
+        self.period = period
+
+    def _calc_indicator_values(self, data: Data) -> np.ndarray[Any, np.dtype[Any]]:
+        CountingIndicator.calculations += 1
+        return data.close * self.period
+
+
+class NotCacheableIndicator(Indicator):
+    def __init__(self):
+        super().__init__()
+        self.weights = [1.0, 2.0]
+
+    def _calc_indicator_values(self, data: Data) -> np.ndarray[Any, np.dtype[Any]]:
+        return data.close
+
+
+def put_and_get_path(store: IndicatorStore, key: str, values: Any) -> str:
+    known_files: Set[str] = set(os.listdir(store.directory))
+    store.put(key, values)
+    new_files = set(os.listdir(store.directory)) - known_files
+    assert len(new_files) == 1
+    return os.path.join(store.directory, new_files.pop())
+
+
+def test_put_and_get(tmp_path):
+    store = IndicatorStore(str(tmp_path))
+
+    store.put("key", np.array([1.0, 2.0, np.nan]))
+    values = store.get("key")
+
+    assert isinstance(values, np.memmap)
+    assert np.array_equal(values, [1.0, 2.0, np.nan], equal_nan=True)
+    assert store.get("other_key") is None
+
+
+def test_object_values_are_not_stored(tmp_path):
+    store = IndicatorStore(str(tmp_path))
+
+    store.put("key", np.array([[1.0], "a"], dtype=object))
+
+    assert store.get("key") is None
+    assert store.get_size() == 0
+
+
+def test_evicts_least_recently_used(tmp_path):
+    values = np.zeros(100, dtype=float)
+    store = IndicatorStore(str(tmp_path))
+
+    first_path = put_and_get_path(store, "first", values)
+    second_path = put_and_get_path(store, "second", values)
+    os.utime(first_path, (1000, 1000))
+    os.utime(second_path, (2000, 2000))
+    entry_size = os.path.getsize(first_path)
+
+    store = IndicatorStore(str(tmp_path), max_size=2 * entry_size)
+    assert store.get("first") is not None  # "first" becomes the most recently used
+    store.put("third", values)
+
+    assert store.get("first") is not None
+    assert store.get("second") is None
+    assert store.get("third") is not None
+    assert store.get_size() == 2 * entry_size
+
+
+def test_invalid_max_size(tmp_path):
+    with pytest.raises(ValueError):
+        IndicatorStore(str(tmp_path), max_size=0)
+
+
+@pytest.mark.parametrize(
+    "market_data",
+    [
+        [
+            (None, 100.0, 100.0, 120.0, 110.0, None),
+            (None, 101.0, 101.0, 121.0, 111.0, None),
+        ]
+    ],
+)
+def test_indicator_calculated_once(tmp_path, test_data: Data):
+    store = IndicatorStore(str(tmp_path))
+    CountingIndicator.calculations = 0
+
+    first_indicator = CountingIndicator(period=2)
+    first_indicator.prepare_indicator(test_data, store)
+    second_indicator = CountingIndicator(period=2)
+    second_indicator.prepare_indicator(test_data, store)
+
+    assert CountingIndicator.calculations == 1
+    assert np.array_equal(second_indicator.get_indicator_values(), [220.0, 222.0])
+
+    other_period_indicator = CountingIndicator(period=3)
+    other_period_indicator.prepare_indicator(test_data, store)
+
+    assert CountingIndicator.calculations == 2
+    assert np.array_equal(other_period_indicator.get_indicator_values(), [330.0, 333.0])
+
+
+@pytest.mark.parametrize(
+    "market_data",
+    [[(None, 100.0, 100.0, 120.0, 110.0, None)]],
+)
+def test_not_cacheable_indicator(tmp_path, test_data: Data):
+    store = IndicatorStore(str(tmp_path))
+    indicator = NotCacheableIndicator()
+
+    indicator.prepare_indicator(test_data, store)
+
+    assert indicator.get_cache_key() is None
+    assert store.get_size() == 0
+    assert np.array_equal(indicator.get_indicator_values(), [110.0])
@@ -86,3 +86,91 @@ def test_multiple_values_per_candle_indicator_next_candlestick(test_data: Data):
     test_data.increment_data_index()
 
     assert np.array_equal(indicator.get_current_indicator_value(), [101.0, 111.0])
+
+
+class DeclaredWarmUpIndicator(Indicator):
+    def __init__(self):
+        super().__init__(warm_up_period=2)
+
+    def _calc_indicator_values(self, data: Data) -> np.ndarray[Any, np.dtype[Any]]:
+        return np.column_stack((data.open, data.close))
+
+
+@pytest.mark.parametrize(
+    "market_data",
+    [
+        [
+            (None, np.nan, 100.0, 120.0, 110.0, None),
+            (None, 101.0, 101.0, 121.0, np.nan, None),
+            (None, np.nan, 102.0, 122.0, np.nan, None),
+            (None, 103.0, 103.0, 123.0, 113.0, None),
+            (None, np.nan, 104.0, 124.0, 114.0, None),
+        ]
+    ],
+)
+def test_multiple_values_per_candle_indicator_skip_until_all_columns_valid(
+    test_data: Data,
+):
+    indicator = MultipleValuesPerCandleIndicator()
+
+    indicator.prepare_indicator(test_data)
+
+    assert indicator.candlesticks_to_skip() == 3
+
+
+@pytest.mark.parametrize(
+    "market_data",
+    [
+        [
+            (None, np.nan, 100.0, 120.0, 110.0, None),
+            (None, 101.0, 101.0, 121.0, np.nan, None),
+        ]
+    ],
+)
+def test_multiple_values_per_candle_indicator_all_rows_with_nan(test_data: Data):
+    indicator = MultipleValuesPerCandleIndicator()
+
+    indicator.prepare_indicator(test_data)
+
+    assert indicator.candlesticks_to_skip() == 0
+
+
+@pytest.mark.parametrize(
+    "market_data",
+    [
+        [
+            (None, 100.0, 100.0, 120.0, 110.0, None),
+            (None, 101.0, 101.0, 121.0, 111.0, None),
+            (None, 102.0, 102.0, 122.0, 112.0, None),
+        ]
+    ],
+)
+def test_multiple_values_per_candle_indicator_declared_warm_up(test_data: Data):
+    indicator = DeclaredWarmUpIndicator()
+
+    indicator.prepare_indicator(test_data)
+
+    assert indicator.candlesticks_to_skip() == 2
+
+
+class ObjectValuesIndicator(Indicator):
+    def _calc_indicator_values(self, data: Data) -> np.ndarray[Any, np.dtype[Any]]:
+        return np.array(data.open.tolist(), dtype=object)
+
+
+@pytest.mark.parametrize(
+    "market_data",
+    [
+        [
+            (None, np.nan, 100.0, 120.0, 110.0, None),
+            (None, np.nan, 101.0, 121.0, 111.0, None),
+            (None, 102.0, 102.0, 122.0, 112.0, None),
+        ]
+    ],
+)
+def test_object_values_indicator_warm_up_detected(test_data: Data):
+    indicator = ObjectValuesIndicator()
+
+    indicator.prepare_indicator(test_data)
+
+    assert indicator.candlesticks_to_skip() == 2
@@ -40,3 +40,53 @@ def test_drawdown_after_increased_equity(test_account: Account):
     assert statistics.get_stats()["max_drawdown_percentage"] == pytest.approx(
         33.33, abs=0.01
     )
+
+
+@pytest.mark.parametrize(
+    "equity_log, expected_duration",
+    [
+        ([1000, 1100, 1200], 0),
+        ([1000, 900, 950, 1000, 1100, 1000], 2),
+        ([1000, 900, 1100, 1000, 900, 800], 3),
+    ],
+)
+def test_max_drawdown_duration(
+    test_account: Account, equity_log: list, expected_duration: int
+):
+    statistics = Statistics(
+        trades=[], account=test_account, equity_log=np.array(equity_log)
+    )
+
+    assert statistics.get_stats()["max_drawdown_duration"] == expected_duration
+
+
+def test_selected_metrics(test_account: Account):
+    statistics = Statistics(
+        trades=[], account=test_account, equity_log=np.array([1000, 800, 1200])
+    )
+
+    stats = statistics.get_stats(metrics=["return", "max_drawdown"])
+
+    assert stats == {"return": 200, "max_drawdown": 200}
+    assert list(statistics.get_stats()) == statistics.get_metrics_names()
+
+    with pytest.raises(ValueError):
+        statistics.get_stats(metrics=["unknown"])
+
+
+def test_cached_metrics_invalidated(test_account: Account):
+    equity_log = np.array([1000.0, 800.0, 1200.0])
+    statistics = Statistics(trades=[], account=test_account, equity_log=equity_log)
+
+    assert statistics.get_stats(metrics=["return"])["return"] == 200
+
+    equity_log[-1] = 1500.0
+    assert statistics.get_stats(metrics=["return"])["return"] == 200
+
+    statistics.invalidate()
+    assert statistics.get_stats(metrics=["return"])["return"] == 500
+
+    statistics.add_commission(5.0)
+    assert statistics.get_stats(metrics=["total_commission"]) == {
+        "total_commission": 5.0
+    }
@@ -0,0 +1,162 @@
+from datetime import datetime
+
+import numpy as np
+import pytest
+
+from trading_backtester.account import Account
+from trading_backtester.data import Data
+from trading_backtester.stats import Statistics
+
+DATA = Data.from_array(
+    [(datetime(2024, 1, day), 1.0, 1.0, 1.0, 1.0, None) for day in [1, 2, 3, 4]]
+)
+# Benchmark without the candlestick of the 2nd day
+BENCHMARK = Data.from_array(
+    [
+        (datetime(2024, 1, 1), 10.0, 11.0, 10.0, 11.0, None),
+        (datetime(2024, 1, 3), 11.0, 12.0, 11.0, 12.0, None),
+        (datetime(2024, 1, 4), 12.0, 13.0, 12.0, 13.0, None),
+    ]
+)
+EQUITY_LOG = np.array([100.0, 110.0, 115.0, 120.0, 130.0])
+
+
+def expected_beta(equity: np.ndarray, benchmark: np.ndarray) -> float:
+    equity_returns = np.diff(equity) / equity[:-1]
+    benchmark_returns = np.diff(benchmark) / benchmark[:-1]
+    return np.cov(equity_returns, benchmark_returns)[0, 1] / np.var(
+        benchmark_returns, ddof=1
+    )
+
+
+def test_benchmark_forward_filled(test_account: Account):
+    statistics = Statistics(
+        trades=[],
+        equity_log=EQUITY_LOG,
+        account=test_account,
+        benchmark=BENCHMARK,
+        data=DATA,
+    )
+
+    stats = statistics.get_stats()
+
+    assert stats["beta"] == pytest.approx(
+        expected_beta(EQUITY_LOG, np.array([10.0, 11.0, 11.0, 12.0, 13.0]))
+    )
+    assert stats["buy_and_hold_return_percentage"] == pytest.approx(30.0)
+
+
+def test_benchmark_intersection(test_account: Account):
+    statistics = Statistics(
+        trades=[],
+        equity_log=EQUITY_LOG,
+        account=test_account,
+        benchmark=BENCHMARK,
+        data=DATA,
+        benchmark_alignment="intersection",
+    )
+
+    stats = statistics.get_stats()
+
+    assert stats["beta"] == pytest.approx(
+        expected_beta(
+            np.array([100.0, 110.0, 120.0, 130.0]),
+            np.array([10.0, 11.0, 12.0, 13.0]),
+        )
+    )
+    assert stats["alpha"] == pytest.approx(0.3 - stats["beta"] * 0.3)
+
+
+def test_benchmark_starting_after_data(test_account: Account):
+    benchmark = Data.from_array(
+        [
+            (datetime(2023, 12, 31, 12), 8.0, 8.0, 8.0, 9.0, None),
+            (datetime(2024, 1, 2), 9.0, 10.0, 9.0, 10.0, None),
+            (datetime(2024, 1, 3), 10.0, 10.0, 10.0, 10.0, None),
+            (datetime(2024, 1, 4), 10.0, 12.0, 10.0, 12.0, None),
+            (datetime(2024, 1, 5), 12.0, 15.0, 12.0, 15.0, None),
+        ]
+    )
+    statistics = Statistics(
+        trades=[],
+        equity_log=EQUITY_LOG,
+        account=test_account,
+        benchmark=benchmark,
+        data=DATA,
+    )
+
+    # Before the first candlestick, the last close before it is used, later candlesticks are ignored
+    assert statistics.get_stats()["beta"] == pytest.approx(
+        expected_beta(EQUITY_LOG, np.array([9.0, 9.0, 10.0, 10.0, 12.0]))
+    )
+    assert statistics.get_stats()["buy_and_hold_return_percentage"] == pytest.approx(
+        (12.0 - 9.0) / 9.0 * 100
+    )
+
+
+def test_multiple_benchmarks(test_account: Account):
+    statistics = Statistics(
+        trades=[],
+        equity_log=EQUITY_LOG,
+        account=test_account,
+        benchmark={"index": BENCHMARK, "asset": DATA},
+        data=DATA,
+    )
+
+    benchmarks_stats = statistics.get_benchmarks_stats()
+
+    assert statistics.get_benchmarks_names() == ["index", "asset"]
+    assert benchmarks_stats["index"]["beta"] == statistics.get_stats()["beta"]
+    assert benchmarks_stats["asset"] == {
+        "beta": None,
+        "alpha": None,
+        "buy_and_hold_return_percentage": 0.0,
+    }
+    assert np.isnan(statistics.rolling("beta", 2, benchmark="asset")).all()
+    with pytest.raises(ValueError):
+        statistics.rolling("beta", 2, benchmark="unknown")
+
+
+@pytest.mark.parametrize(
+    "market_data",
+    [[(None, 5.0, 10.0, 5.0, 10.0, None), (None, 10.0, 10.0, 10.0, 10.0, None)]],
+)
+def test_benchmark_without_datetimes_of_different_length(
+    test_account: Account, test_data: Data
+):
+    with pytest.raises(ValueError):
+        Statistics(
+            trades=[],
+            equity_log=EQUITY_LOG,
+            account=test_account,
+            benchmark=test_data,
+        )
+
+
+def test_unknown_benchmark_alignment(test_account: Account):
+    with pytest.raises(ValueError):
+        Statistics(
+            trades=[],
+            equity_log=EQUITY_LOG,
+            account=test_account,
+            benchmark=BENCHMARK,
+            data=DATA,
+            benchmark_alignment="resample",
+        )
+
+
+def test_benchmark_without_common_datetimes(test_account: Account):
+    benchmark = Data.from_array(
+        [(datetime(2024, 2, day), 10.0, 10.0, 10.0, 10.0, None) for day in [1, 2]]
+    )
+    statistics = Statistics(
+        trades=[],
+        equity_log=EQUITY_LOG,
+        account=test_account,
+        benchmark=benchmark,
+        data=DATA,
+        benchmark_alignment="intersection",
+    )
+
+    assert statistics.get_stats()["buy_and_hold_return_percentage"] is None
+    assert "Buy and hold return: N/A%" in str(statistics)
@@ -0,0 +1,134 @@
+import numpy as np
+import pytest
+
+from trading_backtester import bootstrap
+from trading_backtester.account import Account
+from trading_backtester.position import PositionType
+from trading_backtester.stats import Statistics
+from trading_backtester.trade import CloseTrade
+
+EQUITY_LOG = np.array([100.0, 110.0, 99.0, 120.0, 90.0, 95.0, 130.0, 125.0, 140.0])
+
+
+def test_paths_metrics():
+    paths_equity = np.array([[100.0, 110.0, 55.0, 66.0], [100.0, 100.0, 100.0, 100.0]])
+    returns = np.array([0.1, -0.5, 0.2])
+
+    metrics = bootstrap.calc_paths_metrics(paths_equity, periods_per_year=4)
+
+    assert metrics[0, 0] == pytest.approx(-34.0)
+    assert metrics[0, 1] == pytest.approx(50.0)
+    assert metrics[0, 2] == pytest.approx(returns.mean() / returns.std(ddof=1) * 2)
+    assert metrics[1, 0] == 0.0
+    assert metrics[1, 1] == 0.0
+    assert np.isnan(metrics[1, 2])
+
+
+def test_bootstrap_reproducible(test_account: Account):
+    statistics = Statistics(trades=[], account=test_account, equity_log=EQUITY_LOG)
+
+    intervals = statistics.bootstrap(n=1000, seed=42)
+
+    assert intervals == statistics.bootstrap(n=1000, seed=42)
+    assert list(intervals) == [
+        "return_percentage",
+        "max_drawdown_percentage",
+        "sharpe_ratio",
+    ]
+    for lower, upper in intervals.values():
+        assert lower <= upper
+    lower, upper = intervals["return_percentage"]
+    assert lower < 40.0 < upper
+
+
+def test_bootstrap_independent_of_processes(
+    test_account: Account, monkeypatch: pytest.MonkeyPatch
+):
+    monkeypatch.setattr(bootstrap, "BATCH_ELEMENTS", 64)
+    statistics = Statistics(trades=[], account=test_account, equity_log=EQUITY_LOG)
+
+    assert statistics.bootstrap(n=100, seed=1) == statistics.bootstrap(
+        n=100, seed=1, processes=2
+    )
+
+
+def test_bootstrap_full_blocks_keep_return(test_account: Account):
+    statistics = Statistics(trades=[], account=test_account, equity_log=EQUITY_LOG)
+
+    # Every path is a rotation of the returns, so the compounded return doesn't change
+    intervals = statistics.bootstrap(
+        n=100, method="block", block_size=len(EQUITY_LOG) - 1, seed=0
+    )
+
+    assert intervals["return_percentage"] == pytest.approx((40.0, 40.0))
+
+
+def test_bootstrap_trades(test_account: Account):
+    # 20 trades of 1 unit bought at 100 with 1000 of money, so every trade moves the equity by about 1%
+    profits_losses = np.array([15.0, -5.0, 10.0, 20.0, -10.0] * 4) - 0.75
+    trades = [
+        CloseTrade(
+            position_type=PositionType.LONG,
+            open_datetime=np.datetime64("NaT", "ns"),
+            open_price=100.0,
+            close_datetime=np.datetime64("NaT", "ns"),
+            close_price=100.0 + profit_loss,
+            close_size=1,
+            market_order=True,
+        )
+        for profit_loss in profits_losses
+    ]
+    equity_log = np.concatenate(([1000.0], 1000.0 + np.cumsum(profits_losses)))
+    statistics = Statistics(trades=trades, account=test_account, equity_log=equity_log)
+
+    intervals = statistics.bootstrap(n=1000, method="trades", seed=0)
+    stats = statistics.get_stats()
+
+    return_lower, return_upper = intervals["return_percentage"]
+    assert return_lower < stats["return_percentage"] < return_upper < 25.0
+    max_drawdown_lower, max_drawdown_upper = intervals["max_drawdown_percentage"]
+    assert max_drawdown_lower < stats["max_drawdown_percentage"] < max_drawdown_upper
+    assert max_drawdown_upper < 10.0
+
+
+def test_bootstrap_trades_profit_loss_added_to_initial_equity(test_account: Account):
+    trades = [
+        CloseTrade(
+            position_type=position_type,
+            open_datetime=np.datetime64("NaT", "ns"),
+            open_price=100.0,
+            close_datetime=np.datetime64("NaT", "ns"),
+            close_price=110.0,
+            close_size=1,
+            market_order=True,
+        )
+        for position_type in [PositionType.LONG, PositionType.SHORT]
+    ]
+    statistics = Statistics(
+        trades=trades,
+        account=test_account,
+        equity_log=np.array([1000.0, 1010.0, 1000.0]),
+    )
+
+    lower, upper = statistics.bootstrap(n=1000, method="trades", seed=0)[
+        "return_percentage"
+    ]
+
+    assert lower == pytest.approx(-2.0)
+    assert upper == pytest.approx(2.0)
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"method": "unknown"},
+        {"n": 0},
+        {"confidence": 1.0},
+        {"method": "trades"},
+    ],
+)
+def test_bootstrap_invalid(test_account: Account, kwargs: dict):
+    statistics = Statistics(trades=[], account=test_account, equity_log=EQUITY_LOG)
+
+    with pytest.raises(ValueError):
+        statistics.bootstrap(**kwargs)
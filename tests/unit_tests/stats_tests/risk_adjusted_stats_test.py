@@ -0,0 +1,147 @@
+from datetime import datetime, timedelta
+
+import numpy as np
+import pytest
+
+from trading_backtester.account import Account
+from trading_backtester.data import Data
+from trading_backtester.stats import Statistics
+
+
+def test_sharpe_and_sortino_ratio(test_account: Account):
+    equity_log = np.array([100.0, 110.0, 99.0, 108.9])
+    statistics = Statistics(
+        trades=[], account=test_account, equity_log=equity_log, periods_per_year=4
+    )
+    returns = np.array([0.1, -0.1, 0.1])
+
+    stats = statistics.get_stats()
+
+    assert stats["sharpe_ratio"] == pytest.approx(
+        returns.mean() / returns.std(ddof=1) * 2
+    )
+    assert stats["sortino_ratio"] == pytest.approx(
+        returns.mean() / np.sqrt(0.01 / 3) * 2
+    )
+    assert stats["volatility_percentage"] == pytest.approx(
+        returns.std(ddof=1) * 2 * 100
+    )
+    assert stats["omega_ratio"] == pytest.approx(2.0)
+
+
+def test_cagr_and_calmar_ratio(test_account: Account):
+    equity_log = np.array([100.0, 80.0, 121.0])
+    statistics = Statistics(
+        trades=[], account=test_account, equity_log=equity_log, periods_per_year=2
+    )
+
+    stats = statistics.get_stats()
+
+    assert stats["cagr_percentage"] == pytest.approx(21.0)
+    assert stats["calmar_ratio"] == pytest.approx(21.0 / 20.0)
+
+
+def test_cagr_after_bankruptcy(test_account: Account):
+    equity_log = np.array([100.0, 50.0, 0.0, 0.0])
+    statistics = Statistics(trades=[], account=test_account, equity_log=equity_log)
+
+    stats = statistics.get_stats()
+
+    assert stats["cagr_percentage"] == -100.0
+    assert stats["sharpe_ratio"] is not None
+
+
+def test_flat_equity_ratios_not_available(test_account: Account):
+    equity_log = np.array([100.0, 100.0, 100.0])
+    statistics = Statistics(trades=[], account=test_account, equity_log=equity_log)
+
+    stats = statistics.get_stats()
+
+    assert stats["volatility_percentage"] == 0.0
+    assert stats["cagr_percentage"] == 0.0
+    assert stats["sharpe_ratio"] is None
+    assert stats["sortino_ratio"] is None
+    assert stats["calmar_ratio"] is None
+    assert stats["omega_ratio"] is None
+    assert stats["tail_ratio"] is None
+    assert "Sharpe ratio: N/A" in str(statistics)
+
+
+def test_tail_ratio(test_account: Account):
+    equity_log = np.cumprod(np.concatenate(([100.0], 1 + np.linspace(-0.1, 0.2, 31))))
+    statistics = Statistics(trades=[], account=test_account, equity_log=equity_log)
+
+    assert statistics.get_stats()["tail_ratio"] == pytest.approx(
+        abs(np.percentile(np.linspace(-0.1, 0.2, 31), 95))
+        / abs(np.percentile(np.linspace(-0.1, 0.2, 31), 5))
+    )
+
+
+@pytest.mark.parametrize(
+    "spacing, expected_periods_per_year",
+    [
+        (timedelta(days=1), 365.25 * 4 / 5),
+        (timedelta(hours=1), 365.25 * 24 * 4 / 5),
+        (timedelta(weeks=1), 365.25 / 7 * 4 / 5),
+    ],
+)
+def test_periods_per_year_inferred_from_data(
+    test_account: Account, spacing: timedelta, expected_periods_per_year: float
+):
+    start = datetime(2024, 1, 1)
+    data = Data.from_array(
+        [
+            (start + i * spacing, 1.0, 1.0, 1.0, 1.0, None)
+            for i in [0, 1, 2, 3, 5]  # a gap lowers the number of periods per year
+        ]
+    )
+    equity_log = np.array([100.0, 110.0, 99.0, 108.9, 100.0, 105.0])
+    statistics = Statistics(
+        trades=[], account=test_account, equity_log=equity_log, data=data
+    )
+    returns = np.diff(equity_log) / equity_log[:-1]
+
+    assert statistics.get_stats()["volatility_percentage"] == pytest.approx(
+        returns.std(ddof=1) * np.sqrt(expected_periods_per_year) * 100
+    )
+
+
+def test_periods_per_year_of_business_days(test_account: Account):
+    datetimes = np.arange(
+        np.datetime64("2023-01-02"), np.datetime64("2024-01-01"), dtype="datetime64[D]"
+    )
+    datetimes = datetimes[np.is_busday(datetimes)]
+    data = Data.from_array(
+        [(date_time, 1.0, 1.0, 1.0, 1.0, None) for date_time in datetimes]
+    )
+    equity_log = np.linspace(1000.0, 990.0, len(data) + 1)
+    statistics = Statistics(
+        trades=[], account=test_account, equity_log=equity_log, data=data
+    )
+    returns = np.diff(equity_log) / equity_log[:-1]
+
+    stats = statistics.get_stats()
+
+    # A year of business days is about 260 periods, and the whole log spans about a year
+    assert stats["cagr_percentage"] == pytest.approx(-1.0, abs=0.01)
+    assert stats["volatility_percentage"] == pytest.approx(
+        returns.std(ddof=1) * np.sqrt(len(data) - 1) * 100, rel=0.01
+    )
+
+
+@pytest.mark.parametrize(
+    "market_data",
+    [[(None, 1.0, 1.0, 1.0, 1.0, None), (None, 1.0, 1.0, 1.0, 1.0, None)]],
+)
+def test_periods_per_year_default_without_datetimes(
+    test_account: Account, test_data: Data
+):
+    equity_log = np.array([100.0, 110.0, 121.0])
+    statistics = Statistics(
+        trades=[], account=test_account, equity_log=equity_log, data=test_data
+    )
+
+    # 2 periods out of 252 trading days in a year
+    assert statistics.get_stats()["cagr_percentage"] == pytest.approx(
+        (1.21 ** (252 / 2) - 1) * 100
+    )
@@ -0,0 +1,112 @@
+import numpy as np
+import pytest
+
+from trading_backtester.account import Account
+from trading_backtester.data import Data
+from trading_backtester.stats import Statistics
+
+EQUITY_LOG = np.array([100.0, 110.0, 99.0, 120.0, 90.0, 95.0, 130.0, 125.0, 140.0])
+
+
+def test_rolling_return(test_account: Account):
+    statistics = Statistics(trades=[], account=test_account, equity_log=EQUITY_LOG)
+
+    rolling_return = statistics.rolling("return_percentage", 2)
+
+    assert len(rolling_return) == len(EQUITY_LOG)
+    assert np.isnan(rolling_return[:2]).all()
+    assert rolling_return[2:] == pytest.approx(
+        (EQUITY_LOG[2:] / EQUITY_LOG[:-2] - 1) * 100
+    )
+
+
+@pytest.mark.parametrize("window", [1, 2, 3, 4, 8])
+def test_rolling_drawdown(test_account: Account, window: int):
+    statistics = Statistics(trades=[], account=test_account, equity_log=EQUITY_LOG)
+
+    rolling_drawdown = statistics.rolling("drawdown_percentage", window)
+
+    expected = [
+        (EQUITY_LOG[i - window : i + 1].max() - EQUITY_LOG[i])
+        / EQUITY_LOG[i - window : i + 1].max()
+        * 100
+        for i in range(window, len(EQUITY_LOG))
+    ]
+    assert np.isnan(rolling_drawdown[:window]).all()
+    assert rolling_drawdown[window:] == pytest.approx(expected)
+
+
+@pytest.mark.parametrize("window", [2, 3, 5])
+def test_rolling_sharpe_ratio(test_account: Account, window: int):
+    statistics = Statistics(
+        trades=[], account=test_account, equity_log=EQUITY_LOG, periods_per_year=4
+    )
+    returns = np.diff(EQUITY_LOG) / EQUITY_LOG[:-1]
+
+    rolling_sharpe_ratio = statistics.rolling("sharpe_ratio", window)
+
+    expected = [
+        returns[i - window : i].mean() / returns[i - window : i].std(ddof=1) * 2
+        for i in range(window, len(EQUITY_LOG))
+    ]
+    assert np.isnan(rolling_sharpe_ratio[:window]).all()
+    assert rolling_sharpe_ratio[window:] == pytest.approx(expected)
+
+
+def test_rolling_sharpe_ratio_constant_returns(test_account: Account):
+    equity_log = np.array([100.0, 100.0, 100.0, 110.0])
+    statistics = Statistics(trades=[], account=test_account, equity_log=equity_log)
+
+    rolling_sharpe_ratio = statistics.rolling("sharpe_ratio", 2)
+
+    assert np.isnan(rolling_sharpe_ratio[:3]).all()
+    assert rolling_sharpe_ratio[3] > 0
+
+
+@pytest.mark.parametrize(
+    "market_data",
+    [
+        [
+            (None, 10.0, 10.0, 10.0, 11.0, None),
+            (None, 11.0, 11.0, 11.0, 10.0, None),
+            (None, 10.0, 10.0, 10.0, 12.0, None),
+            (None, 12.0, 12.0, 12.0, 12.0, None),
+            (None, 12.0, 12.0, 12.0, 9.0, None),
+        ]
+    ],
+)
+def test_rolling_beta(test_account: Account, test_data: Data):
+    equity_log = np.array([100.0, 105.0, 101.0, 110.0, 112.0, 100.0])
+    statistics = Statistics(
+        trades=[], account=test_account, equity_log=equity_log, benchmark=test_data
+    )
+    returns = np.diff(equity_log) / equity_log[:-1]
+    benchmark = np.array([10.0, 11.0, 10.0, 12.0, 12.0, 9.0])
+    benchmark_returns = np.diff(benchmark) / benchmark[:-1]
+
+    rolling_beta = statistics.rolling("beta", 3)
+
+    expected = [
+        np.cov(returns[i - 3 : i], benchmark_returns[i - 3 : i])[0, 1]
+        / np.var(benchmark_returns[i - 3 : i], ddof=1)
+        for i in range(3, len(equity_log))
+    ]
+    assert np.isnan(rolling_beta[:3]).all()
+    assert rolling_beta[3:] == pytest.approx(expected)
+
+
+def test_rolling_window_longer_than_equity_log(test_account: Account):
+    statistics = Statistics(trades=[], account=test_account, equity_log=EQUITY_LOG)
+
+    assert np.isnan(statistics.rolling("return_percentage", 20)).all()
+
+
+@pytest.mark.parametrize(
+    "metric, window",
+    [("unknown", 2), ("return_percentage", 0), ("sharpe_ratio", 1), ("beta", 2)],
+)
+def test_rolling_invalid(test_account: Account, metric: str, window: int):
+    statistics = Statistics(trades=[], account=test_account, equity_log=EQUITY_LOG)
+
+    with pytest.raises(ValueError):
+        statistics.rolling(metric, window)
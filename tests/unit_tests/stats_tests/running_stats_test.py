@@ -0,0 +1,75 @@
+from typing import List
+
+import numpy as np
+import pytest
+
+from trading_backtester.account import Account
+from trading_backtester.position import PositionType
+from trading_backtester.stats import Statistics
+from trading_backtester.trade import CloseTrade, OpenTrade, Trade
+
+
+def create_trades() -> List[Trade]:
+    trades: List[Trade] = []
+    for position_type, close_price in [
+        (PositionType.LONG, 110.0),
+        (PositionType.SHORT, 120.0),
+        (PositionType.SHORT, 90.0),
+    ]:
+        trades.append(
+            OpenTrade(
+                position_type=position_type,
+                open_datetime=np.datetime64("2025-01-01"),
+                price=100.0,
+                size=1,
+                market_order=True,
+            )
+        )
+        trades.append(
+            CloseTrade(
+                position_type=position_type,
+                open_datetime=np.datetime64("2025-01-01"),
+                open_price=100.0,
+                close_datetime=np.datetime64("2025-01-02"),
+                close_price=close_price,
+                close_size=1,
+                market_order=True,
+            )
+        )
+
+    return trades
+
+
+def test_running_stats(test_account: Account):
+    equity_log = np.array([1000.0, 1100.0, 900.0, 950.0, 950.0, 1200.0, 1000.0])
+    trades = create_trades()
+    statistics = Statistics(trades=trades, account=test_account, equity_log=equity_log)
+
+    statistics.update_equity(1000.0)
+    statistics.update_equity(1100.0)
+    statistics.update_equity(900.0)
+
+    running_stats = statistics.get_running_stats()
+    assert running_stats["peak_equity"] == 1100.0
+    assert running_stats["current_drawdown"] == 200.0
+    assert running_stats["current_drawdown_duration"] == 1
+    assert running_stats["total_trades"] == 0
+
+    statistics.update_equity(950.0, count=2)
+    statistics.update_equity(1200.0)
+    statistics.update_equity(1000.0)
+    for trade in trades:
+        statistics.record_trade(trade)
+
+    running_stats = statistics.get_running_stats()
+    assert running_stats["max_drawdown"] == 200.0
+    assert running_stats["max_drawdown_duration"] == 3
+    assert running_stats["current_drawdown_duration"] == 1
+    assert running_stats["total_trades"] == 6
+    assert running_stats["profitable_trades_num"] == 2
+    assert running_stats["profitable_trades_percentage"] == pytest.approx(66.67, 0.01)
+
+    recalculated_stats = Statistics(
+        trades=list(trades), account=test_account, equity_log=equity_log
+    ).get_stats()
+    assert statistics.get_stats() == pytest.approx(recalculated_stats)
@@ -0,0 +1,134 @@
+from datetime import datetime
+
+import numpy as np
+import pytest
+
+from trading_backtester.data import Data
+from trading_backtester.position import PositionType
+from trading_backtester.trade import CloseTrade, OpenTrade, TradeType
+from trading_backtester.trade_log import TradeLog
+
+
+def test_append_and_read_trades():
+    trade_log = TradeLog(capacity=1)
+    trade_log.append(
+        OpenTrade(
+            position_type=PositionType.LONG,
+            open_datetime=np.datetime64("2025-01-01"),
+            price=100.0,
+            size=2,
+            market_order=True,
+        )
+    )
+    trade_log.append(
+        CloseTrade(
+            position_type=PositionType.SHORT,
+            open_datetime=np.datetime64("2025-01-01"),
+            open_price=100.0,
+            close_datetime=np.datetime64("2025-01-02"),
+            close_price=90.0,
+            close_size=1,
+            market_order=False,
+            strategy_id=3,
+        )
+    )
+
+    assert len(trade_log) == 2
+    assert trade_log.trade_type.tolist() == [
+        TradeType.OPEN.value,
+        TradeType.CLOSE.value,
+    ]
+    assert np.array_equal(trade_log.close_price, [np.nan, 90.0], equal_nan=True)
+    assert trade_log.strategy_id.tolist() == [-1, 3]
+
+    open_trade = trade_log[0]
+    assert open_trade.trade_type == TradeType.OPEN
+    assert open_trade.position_type == PositionType.LONG
+    assert open_trade.open_size == 2
+    assert open_trade.close_datetime is None
+    assert open_trade.close_price is None
+    assert open_trade.close_size is None
+    assert open_trade.market_order is True
+    assert open_trade.strategy_id is None
+
+    close_trade = trade_log[-1]
+    assert close_trade.open_size is None
+    assert close_trade.close_datetime == np.datetime64("2025-01-02")
+    assert close_trade.close_size == 1
+    assert close_trade.market_order is False
+    assert close_trade.strategy_id == 3
+    assert close_trade.calc_profit_loss() == pytest.approx(10.0)
+
+    assert [trade.trade_type for trade in reversed(trade_log)] == [
+        TradeType.CLOSE,
+        TradeType.OPEN,
+    ]
+    with pytest.raises(IndexError):
+        trade_log[2]
+
+
+def test_from_trades():
+    trades = [
+        OpenTrade(
+            position_type=PositionType.SHORT,
+            open_datetime=np.datetime64("2025-01-01"),
+            price=float(price),
+            size=1,
+            market_order=True,
+        )
+        for price in range(100)
+    ]
+
+    trade_log = TradeLog.from_trades(trades)
+
+    assert len(trade_log) == 100
+    assert trade_log.open_price.tolist() == [trade.open_price for trade in trades]
+    assert [trade.open_price for trade in trade_log[10:12]] == [10.0, 11.0]
+
+
+def test_calc_excursions():
+    data = Data.from_array(
+        [
+            (datetime(2025, 1, 1), 100.0, 105.0, 95.0, 100.0, None),
+            (datetime(2025, 1, 2), 100.0, 120.0, 90.0, 110.0, None),
+            (datetime(2025, 1, 3), 110.0, 115.0, 80.0, 100.0, None),
+            (datetime(2025, 1, 4), 100.0, 130.0, 100.0, 125.0, None),
+        ]
+    )
+    trade_log = TradeLog()
+    for position_type, open_day, close_day in [
+        (PositionType.LONG, 1, 2),
+        (PositionType.SHORT, 2, 4),
+        (PositionType.LONG, 4, 4),
+    ]:
+        trade_log.append(
+            CloseTrade(
+                position_type=position_type,
+                open_datetime=np.datetime64(f"2025-01-0{open_day}"),
+                open_price=100.0,
+                close_datetime=np.datetime64(f"2025-01-0{close_day}"),
+                close_price=100.0,
+                close_size=1,
+                market_order=True,
+            )
+        )
+    trade_log.append(
+        OpenTrade(
+            position_type=PositionType.LONG,
+            open_datetime=np.datetime64("2025-01-03"),
+            price=100.0,
+            size=1,
+            market_order=True,
+        )
+    )
+
+    mae_percentage, mfe_percentage = trade_log.calc_excursions(data)
+
+    assert np.array_equal(mae_percentage, [10.0, 30.0, 0.0, np.nan], equal_nan=True)
+    assert np.array_equal(mfe_percentage, [20.0, 20.0, 30.0, np.nan], equal_nan=True)
+
+
+@pytest.mark.parametrize("market_data", [[(None, 100.0, 105.0, 95.0, 100.0, None)]])
+def test_calc_excursions_without_datetimes(test_data: Data):
+    with pytest.raises(ValueError):
+        TradeLog().calc_excursions(test_data)
@@ -1,11 +1,15 @@
+from datetime import datetime
 from typing import List
 
 import numpy as np
+import pytest
 
 from trading_backtester.account import Account
+from trading_backtester.data import Data
 from trading_backtester.position import PositionType
 from trading_backtester.stats import Statistics
 from trading_backtester.trade import CloseTrade, OpenTrade, Trade
+from trading_backtester.trade_log import TradeLog
 
 
 def test_open_long_position(test_account: Account):
@@ -195,3 +199,81 @@ def test_open_and_close_short_position(test_account: Account):
     assert stats["total_close_long_trades"] == 0
     assert stats["total_open_short_trades"] == 1
     assert stats["total_close_short_trades"] == 1
+
+
+def test_trades_returns(test_account: Account):
+    trades = TradeLog.from_trades(
+        [
+            CloseTrade(
+                position_type=position_type,
+                open_datetime=np.datetime64("2025-01-01"),
+                open_price=100,
+                close_datetime=np.datetime64("2025-01-02"),
+                close_price=close_price,
+                close_size=1,
+                market_order=True,
+            )
+            for position_type, close_price in [
+                (PositionType.LONG, 110),
+                (PositionType.LONG, 95),
+                (PositionType.SHORT, 80),
+                (PositionType.SHORT, 130),
+            ]
+        ]
+    )
+    statistics = Statistics(
+        trades=trades, account=test_account, equity_log=np.array([1000])
+    )
+
+    stats = statistics.get_stats()
+
+    assert stats["total_close_long_trades"] == 2
+    assert stats["total_close_short_trades"] == 2
+    assert stats["profitable_trades_num"] == 2
+    assert stats["profitable_trades_percentage"] == pytest.approx(50.0)
+    assert stats["best_trade_return_percentage"] == pytest.approx(20.0)
+    assert stats["worst_trade_return_percentage"] == pytest.approx(-30.0)
+
+
+def test_trades_excursions(test_account: Account):
+    data = Data.from_array(
+        [
+            (datetime(2025, 1, 1), 100.0, 110.0, 95.0, 100.0, None),
+            (datetime(2025, 1, 2), 100.0, 104.0, 90.0, 100.0, None),
+        ]
+    )
+    trades: List[Trade] = [
+        CloseTrade(
+            position_type=position_type,
+            open_datetime=np.datetime64("2025-01-01"),
+            open_price=100.0,
+            close_datetime=np.datetime64("2025-01-02"),
+            close_price=100.0,
+            close_size=1,
+            market_order=True,
+        )
+        for position_type in [PositionType.LONG, PositionType.SHORT]
+    ]
+    statistics = Statistics(
+        trades=trades,
+        account=test_account,
+        equity_log=np.array([100.0, 100.0, 100.0]),
+        data=data,
+    )
+
+    stats = statistics.get_stats()
+
+    assert stats["average_mae_percentage"] == pytest.approx(10.0)
+    assert stats["max_mae_percentage"] == pytest.approx(10.0)
+    assert stats["average_mfe_percentage"] == pytest.approx(10.0)
+    assert stats["max_mfe_percentage"] == pytest.approx(10.0)
+
+
+def test_trades_excursions_without_data(test_account: Account):
+    statistics = Statistics(
+        trades=[], account=test_account, equity_log=np.array([100.0])
+    )
+
+    assert statistics.get_stats()["average_mae_percentage"] is None
+    with pytest.raises(ValueError):
+        statistics.get_trades_excursions()
@@ -1,4 +1,6 @@
-from typing import List, Optional, Type
+import asyncio
+import inspect
+from typing import Any, Generator, List, Mapping, Optional, Sequence, Type, Union
 
 import numpy as np
 
@@ -6,41 +8,71 @@ from .account import Account
 from .broker import Broker
 from .commission import Commission, CommissionType
 from .data import CandlestickPhase, Data
+from .exposure_log import EXPOSURE_LOG_TYPE
+from .indicator_store import IndicatorStore
 from .market import Market
+from .order import Order
+from .order_arrays import OrderArrays
 from .plotting import Plotting
+from .position import PositionMode, PositionType
 from .spread import Spread, SpreadType
 from .stats import Statistics
+from .stop_conditions import StopCondition
 from .strategy import Strategy
 from .trade import Trade
+from .trade_log import TradeLog
 
 
 class Backtester:
     """Main class for the backtester.
 
     This class is responsible for running the backtest and collecting statistics.
+    Several strategies may be tested together in a single pass over the data,
+    sharing one account, with trades and profit/loss attributed to each strategy.
     """
 
     def __init__(
         self,
         data: Data,
-        strategy: Type[Strategy],
+        strategy: Union[Type[Strategy], Sequence[Type[Strategy]]],
         money: float = 1000.0,
         spread: Optional[Spread] = None,
         commission: Optional[Commission] = None,
-        benchmark: Optional[Data] = None,
+        benchmark: Optional[Union[Data, Mapping[str, Data]]] = None,
+        indicator_store: Optional[IndicatorStore] = None,
+        strategy_params: Optional[
+            Union[Mapping[str, Any], Sequence[Optional[Mapping[str, Any]]]]
+        ] = None,
+        position_mode: PositionMode = PositionMode.HEDGING,
+        benchmark_alignment: str = "ffill",
+        record_exposure: bool = False,
     ):
         """Initializes a Backtester object.
 
         Args:
             data (Data): The data object containing market data.
-                strategy (Type[Strategy]): The trading strategy to be tested.
-            User should pass the type of the strategy class, not an instance.
+            strategy (Union[Type[Strategy], Sequence[Type[Strategy]]]): The trading strategy to be tested.
+                User should pass the type of the strategy class, not an instance.
+                If a sequence of strategies is passed, all of them trade together on the shared account.
             money (float): The initial amount of money for the account. Default is 1000.0.
             spread (Optional[Spread]): The spread object.
             commission (Optional[Commission]): The commission object.
-            benchmark (Optional[Data]): Optional benchmark data for comparison (for example for beta, alpha indicators).
+            benchmark (Optional[Union[Data, Mapping[str, Data]]]): Optional benchmark data for comparison (for example for beta, alpha indicators), or several benchmarks by name.
+            indicator_store (Optional[IndicatorStore]): Optional on-disk store, so indicators' values are calculated once and reused by later runs.
+            strategy_params (Optional[Union[Mapping[str, Any], Sequence[Optional[Mapping[str, Any]]]]]): Values of the parameters declared by the strategy (see `Strategy.params`). Optional.
+                If a sequence of strategies is passed, it should be a sequence of parameters for each strategy.
+            position_mode (PositionMode): Whether every fill opens a separate position (hedging) or fills are merged into one position per type (netting). Default is hedging.
+            benchmark_alignment (str): How benchmarks are aligned with the data by datetime, "ffill" (forward-fill missing benchmark prices) or "intersection" (only datetimes present in both). Default is "ffill".
+            record_exposure (bool): Whether to record the exposure log (cash, exposures, open positions and margin used after each candlestick). Default is False.
         """
 
+        strategies_types = (
+            list(strategy) if isinstance(strategy, Sequence) else [strategy]
+        )
+        strategies_params = self.__get_strategies_params(
+            strategies_types, strategy, strategy_params
+        )
+
         self.__data = data
         self.__account = Account(initial_money=money)
         if commission is None:
@@ -49,58 +81,182 @@ class Backtester:
             spread = Spread(SpreadType.FIXED, 0.0)
         self.__equity_log = np.zeros(len(self.__data) + 1, dtype=float)
         self.__equity_log[0] = money
-        self.__trades_log: List[Trade] = []
+        self.__strategies_pnl_log: Optional[np.ndarray[Any, np.dtype[Any]]] = (
+            np.zeros((len(strategies_types), len(self.__data) + 1), dtype=float)
+            if len(strategies_types) > 1
+            else None
+        )
+        self.__exposure_log: Optional[np.ndarray[Any, np.dtype[Any]]] = None
+        if record_exposure:
+            self.__exposure_log = np.zeros(
+                len(self.__data) + 1, dtype=EXPOSURE_LOG_TYPE
+            )
+            self.__exposure_log[0]["cash"] = money
+        self.__trades_log = TradeLog()
         self.__statistics = Statistics(
             trades=self.__trades_log,
             equity_log=self.__equity_log,
             account=self.__account,
             benchmark=benchmark,
+            data=self.__data,
+            benchmark_alignment=benchmark_alignment,
+            exposure_log=self.__exposure_log,
         )
-        self.__broker = Broker(
-            self.__data,
-            self.__account,
-            spread,
-            commission,
-            self.__trades_log,
-            self.__statistics,
-        )
+        self.__statistics.update_equity(money)
 
         self.__is_bankruptcy = False
-
-        self.__strategy = strategy()
-        self.__strategy.set_account(self.__account)
-        self.__strategy.set_positions(self.__broker.get_positions())
-        self.__strategy.set_market(Market(self.__data))
-        self.__strategy.prepare_indicators(self.__data)
-
-    def run(self) -> None:
+        self.__pruned_data_index: Optional[int] = None
+
+        self.__strategies: List[Strategy] = []
+        self.__brokers: List[Broker] = []
+        self.__orders_arrays: List[Optional[OrderArrays]] = []
+        market = Market(self.__data)
+
+        for strategy_id, (strategy_type, params) in enumerate(
+            zip(strategies_types, strategies_params)
+        ):
+            broker = Broker(
+                self.__data,
+                self.__account,
+                spread,
+                commission,
+                self.__trades_log,
+                self.__statistics,
+                strategy_id=strategy_id,
+                position_mode=position_mode,
+            )
+            strategy_instance = strategy_type(**strategy_type.resolve_params(params))
+            strategy_instance.set_account(self.__account)
+            strategy_instance.set_positions(broker.get_positions_view())
+            strategy_instance.set_limit_orders(broker.get_limit_orders_view())
+            strategy_instance.set_market(market)
+            broker.set_strategy(strategy_instance)
+            strategy_instance.prepare_indicators(self.__data, indicator_store)
+
+            self.__brokers.append(broker)
+            self.__strategies.append(strategy_instance)
+            self.__orders_arrays.append(strategy_instance.generate_orders(self.__data))
+
+        self.__candlesticks_to_skip = [
+            strategy_instance.candletsticks_to_skip()
+            for strategy_instance in self.__strategies
+        ]
+
+    def run(self, stop_when: Optional[StopCondition] = None) -> None:
         """Runs the backtest.
 
         This method executes the trading strategy.
+        Strategies with asynchronous `collect_orders` should be run with `run_async` instead.
+
+        Args:
+            stop_when (Optional[StopCondition]): The condition checked after every candlestick (see `stop_conditions` module).
+                Optional, if met, the backtest is stopped early and marked as pruned.
         """
 
-        for i in range(self.__strategy.candletsticks_to_skip()):
-            self.__equity_log[i + 1] = self.__equity_log[0]
-            self.__data.increment_data_index()
+        steps = self.__run_steps(stop_when)
+        try:
+            strategy = next(steps)
+            while True:
+                new_orders = strategy.collect_orders(
+                    self.__data.get_candlestick_phase(),
+                    self.__data.get_current_price(),
+                    self.__data.get_current_datatime(),
+                )
+                if inspect.isawaitable(new_orders):
+                    if inspect.iscoroutine(new_orders):
+                        new_orders.close()
+                    raise TypeError(
+                        "Strategy's collect_orders is asynchronous, use run_async instead."
+                    )
+                strategy = steps.send(new_orders)
+        except StopIteration:
+            pass
+
+    async def run_async(self, stop_when: Optional[StopCondition] = None) -> None:
+        """Runs the backtest, awaiting asynchronous strategies.
+
+        Strategies may implement `collect_orders` as a coroutine (e.g. to query a model server),
+        synchronous strategies are supported as well. While a strategy awaits, the event loop runs other tasks,
+        so many backtests run concurrently (see `run_concurrently`) overlap their I/O latency.
 
-        for i in range(self.__strategy.candletsticks_to_skip(), len(self.__data)):
-            self.__process_candlestick_phase(CandlestickPhase.OPEN)
+        Args:
+            stop_when (Optional[StopCondition]): The condition checked after every candlestick (see `stop_conditions` module).
+                Optional, if met, the backtest is stopped early and marked as pruned.
+        """
 
-            if self.__is_bankruptcy:
-                self.process_bankruptcy(i)
-                break
+        steps = self.__run_steps(stop_when)
+        try:
+            strategy = next(steps)
+            while True:
+                new_orders = strategy.collect_orders(
+                    self.__data.get_candlestick_phase(),
+                    self.__data.get_current_price(),
+                    self.__data.get_current_datatime(),
+                )
+                if inspect.isawaitable(new_orders):
+                    new_orders = await new_orders
+                strategy = steps.send(new_orders)
+        except StopIteration:
+            pass
 
-            self.__process_candlestick_phase(CandlestickPhase.CLOSE)
+    @staticmethod
+    async def run_concurrently(
+        backtesters: Sequence["Backtester"], max_concurrency: Optional[int] = None
+    ) -> None:
+        """Runs many backtests concurrently on the current event loop.
 
-            if self.__is_bankruptcy:
-                self.process_bankruptcy(i)
-                break
+        Data keeps the current candlestick of the backtest running on it,
+        so every backtester must be created with its own Data object (e.g. `Data.from_array` called for each backtest).
 
-            self.__equity_log[i + 1] = (
-                self.__account.current_money + self.__broker.get_assets_value()
+        Args:
+            backtesters (Sequence[Backtester]): The backtesters to run.
+            max_concurrency (Optional[int]): The maximum number of backtests running at the same time. Optional, if not provided, all backtests run at once.
+
+        Raises:
+            ValueError: If several backtesters share the same Data object, or max_concurrency is less than 1.
+        """
+
+        if len({id(backtester.__data) for backtester in backtesters}) < len(
+            backtesters
+        ):
+            raise ValueError(
+                "Backtesters run concurrently must not share the same Data object."
             )
 
-            self.__data.increment_data_index()
+        if max_concurrency is None:
+            await asyncio.gather(
+                *(backtester.run_async() for backtester in backtesters)
+            )
+            return
+
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be greater than 0.")
+
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def run_limited(backtester: "Backtester") -> None:
+            async with semaphore:
+                await backtester.run_async()
+
+        await asyncio.gather(*(run_limited(backtester) for backtester in backtesters))
+
+    def is_pruned(self) -> bool:
+        """Returns whether the backtest was stopped early by its stop condition.
+
+        Returns:
+            bool: True if the backtest was pruned.
+        """
+
+        return self.__pruned_data_index is not None
+
+    def get_pruned_data_index(self) -> Optional[int]:
+        """Returns the index of the candlestick after which the backtest was stopped by its stop condition.
+
+        Returns:
+            Optional[int]: The index of the last processed candlestick. None if the backtest was not pruned.
+        """
+
+        return self.__pruned_data_index
 
     def get_statistics(self) -> Statistics:
         """Returns the statistics of the backtest.
@@ -124,24 +280,102 @@ class Backtester:
 
         return Plotting(self.__data, self.__trades_log, self.__equity_log)
 
+    def get_strategy_trades(self, strategy_id: int) -> List[Trade]:
+        """Returns the trades made by the given strategy.
+
+        Should be called after the backtest is run.
+
+        Args:
+            strategy_id (int): The identifier of the strategy - its index in the strategies passed to the backtester.
+
+        Returns:
+            List[Trade]: The trades made by the strategy.
+        """
+
+        return [
+            self.__trades_log[index]
+            for index in np.flatnonzero(self.__trades_log.strategy_id == strategy_id)
+        ]
+
+    def get_strategies_pnl_log(self) -> np.ndarray[Any, np.dtype[Any]]:
+        """Returns the profit/loss log of each strategy.
+
+        Row `i` is the profit/loss of the strategy with identifier `i` after each candlestick,
+        (realized and unrealized, commissions included), aligned with the equity log.
+        Sum of all rows and the initial money equals the equity log.
+        After bankruptcy, the rows keep the values of the last completed candlestick.
+
+        Should be called after the backtest is run.
+
+        Returns:
+            np.ndarray[Any, np.dtype[Any]]: The profit/loss log with a row for each strategy.
+        """
+
+        if self.__strategies_pnl_log is None:
+            return (self.__equity_log - self.__equity_log[0])[np.newaxis, :]
+
+        return self.__strategies_pnl_log
+
+    def get_exposure_log(self) -> Optional[np.ndarray[Any, np.dtype[Any]]]:
+        """Returns the exposure log (see `EXPOSURE_LOG_TYPE`), aligned with the equity log.
+
+        Entries are recorded after each candlestick at its close price.
+        After bankruptcy, the entries are zeros; after the backtest is stopped early, they keep the last values.
+
+        Should be called after the backtest is run.
+
+        Returns:
+            Optional[np.ndarray[Any, np.dtype[Any]]]: The exposure log. None if the exposure isn't recorded.
+        """
+
+        return self.__exposure_log
+
+    def __record_exposure(self, log_index: int) -> None:
+        if self.__exposure_log is None:
+            return
+
+        price = self.__data.get_current_price()
+        long_size = 0
+        short_size = 0
+        margin_used = 0.0
+        open_positions = 0
+        for broker in self.__brokers:
+            positions = broker.get_positions()
+            aggregates = positions.aggregates
+            long_size += aggregates.get_size(PositionType.LONG)
+            short_size += aggregates.get_size(PositionType.SHORT)
+            margin_used += aggregates.get_open_value(
+                PositionType.LONG
+            ) + aggregates.get_open_value(PositionType.SHORT)
+            open_positions += len(positions)
+
+        entry = self.__exposure_log[log_index]
+        entry["cash"] = self.__account.current_money
+        entry["gross_exposure"] = (long_size + short_size) * price
+        entry["net_exposure"] = (long_size - short_size) * price
+        entry["open_positions"] = open_positions
+        entry["margin_used"] = margin_used
+
+    def __get_assets_value(self) -> float:
+        return sum(broker.get_assets_value() for broker in self.__brokers)
+
+    def __get_assets_value_at_price(self, price: float) -> float:
+        return sum(broker.get_assets_value_at_price(price) for broker in self.__brokers)
+
     def __check_bankruptcy(self) -> bool:
-        if (self.__account.current_money + self.__broker.get_assets_value()) <= 0.0:
+        if (self.__account.current_money + self.__get_assets_value()) <= 0.0:
             return True
 
         if self.__data.get_candlestick_phase() == CandlestickPhase.CLOSE:
             if (
                 self.__account.current_money
-                + self.__broker.get_assets_value_at_price(
-                    self.__data.get_current_low_price()
-                )
+                + self.__get_assets_value_at_price(self.__data.get_current_low_price())
             ) <= 0.0:
                 return True
 
             if (
                 self.__account.current_money
-                + self.__broker.get_assets_value_at_price(
-                    self.__data.get_current_high_price()
-                )
+                + self.__get_assets_value_at_price(self.__data.get_current_high_price())
             ) <= 0.0:
                 return True
 
@@ -149,21 +383,133 @@ class Backtester:
 
     def process_bankruptcy(self, data_index: int) -> None:
         self.__equity_log[data_index + 1 :] = 0.0
+        self.__statistics.update_equity(
+            0.0, count=len(self.__equity_log) - (data_index + 1)
+        )
+        if self.__strategies_pnl_log is not None:
+            self.__strategies_pnl_log[:, data_index + 1 :] = self.__strategies_pnl_log[
+                :, data_index : data_index + 1
+            ]
+        if self.__exposure_log is not None:
+            self.__exposure_log[data_index + 1 :] = 0
+
+    def __prune(self, data_index: int) -> None:
+        # The rest of the equity log is filled with the equity at the moment of stopping
+        self.__pruned_data_index = data_index
+        self.__equity_log[data_index + 2 :] = self.__equity_log[data_index + 1]
+        self.__statistics.update_equity(
+            self.__equity_log[data_index + 1],
+            count=len(self.__equity_log) - (data_index + 2),
+        )
+        if self.__strategies_pnl_log is not None:
+            self.__strategies_pnl_log[:, data_index + 2 :] = self.__strategies_pnl_log[
+                :, data_index + 1 : data_index + 2
+            ]
+        if self.__exposure_log is not None:
+            self.__exposure_log[data_index + 2 :] = self.__exposure_log[data_index + 1]
+
+    def __run_steps(
+        self, stop_when: Optional[StopCondition]
+    ) -> Generator[Strategy, List[Order], None]:
+        # Yields the strategy whose orders should be collected for the current phase,
+        # the collected orders are sent back. Shared by the synchronous and asynchronous runs.
+        candlesticks_to_skip = min(self.__candlesticks_to_skip)
+
+        for i in range(candlesticks_to_skip):
+            self.__equity_log[i + 1] = self.__equity_log[0]
+            self.__data.increment_data_index()
+        if self.__exposure_log is not None:
+            self.__exposure_log[1 : candlesticks_to_skip + 1] = self.__exposure_log[0]
+        self.__statistics.update_equity(
+            self.__equity_log[0], count=candlesticks_to_skip
+        )
 
-    def __process_candlestick_phase(self, phase: CandlestickPhase) -> None:
+        for i in range(candlesticks_to_skip, len(self.__data)):
+            yield from self.__process_candlestick_phase(CandlestickPhase.OPEN)
+
+            if self.__is_bankruptcy:
+                self.process_bankruptcy(i)
+                break
+
+            yield from self.__process_candlestick_phase(CandlestickPhase.CLOSE)
+
+            if self.__is_bankruptcy:
+                self.process_bankruptcy(i)
+                break
+
+            self.__equity_log[i + 1] = (
+                self.__account.current_money + self.__get_assets_value()
+            )
+            self.__statistics.update_equity(self.__equity_log[i + 1])
+            self.__record_exposure(i + 1)
+            if self.__strategies_pnl_log is not None:
+                for strategy_id, broker in enumerate(self.__brokers):
+                    self.__strategies_pnl_log[strategy_id, i + 1] = (
+                        broker.get_cash_flow() + broker.get_assets_value()
+                    )
+
+            if stop_when is not None and stop_when(self.__statistics, i):
+                self.__prune(i)
+                break
+
+            self.__data.increment_data_index()
+
+    def __process_candlestick_phase(
+        self, phase: CandlestickPhase
+    ) -> Generator[Strategy, List[Order], None]:
         self.__data.set_candlestick_phase(phase)
 
         if self.__check_bankruptcy():
             self.__is_bankruptcy = True
             return
 
-        self.__broker.process_stop_losses()
-        self.__broker.process_take_profits()
+        data_index = self.__data.get_current_data_index()
+
+        for strategy, broker, order_arrays, candlesticks_to_skip in zip(
+            self.__strategies,
+            self.__brokers,
+            self.__orders_arrays,
+            self.__candlesticks_to_skip,
+        ):
+            if data_index < candlesticks_to_skip:
+                continue
+
+            broker.process_stop_losses()
+            broker.process_take_profits()
+
+            if order_arrays is None:
+                new_orders = yield strategy
+            else:
+                new_orders = order_arrays.get_orders(data_index, phase)
+            broker.process_new_orders(new_orders=new_orders)
+            broker.process_limit_orders()
+
+    @staticmethod
+    def __get_strategies_params(
+        strategies_types: List[Type[Strategy]],
+        strategy: Union[Type[Strategy], Sequence[Type[Strategy]]],
+        strategy_params: Optional[
+            Union[Mapping[str, Any], Sequence[Optional[Mapping[str, Any]]]]
+        ],
+    ) -> List[Optional[Mapping[str, Any]]]:
+        if len(strategies_types) == 0:
+            raise ValueError("At least one strategy must be provided.")
+
+        if not isinstance(strategy, Sequence):
+            if strategy_params is not None and not isinstance(strategy_params, Mapping):
+                raise ValueError(
+                    "strategy_params must be a mapping for a single strategy."
+                )
+            return [strategy_params]
 
-        new_orders = self.__strategy.collect_orders(
-            phase,
-            self.__data.get_current_price(),
-            self.__data.get_current_datatime(),
-        )
-        self.__broker.process_new_orders(new_orders=new_orders)
-        self.__broker.process_limit_orders()
+        if strategy_params is None:
+            return [None] * len(strategies_types)
+
+        if isinstance(strategy_params, Mapping) or len(strategy_params) != len(
+            strategies_types
+        ):
+            raise ValueError(
+                "strategy_params must be a sequence with parameters for each strategy."
+            )
+
+        return list(strategy_params)
@@ -0,0 +1,155 @@
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, List, Optional, Sequence
+
+import numpy as np
+
+BOOTSTRAP_METRICS = ("return_percentage", "max_drawdown_percentage", "sharpe_ratio")
+"""Names of metrics calculated for every resampled path, in the order of columns returned by `resample_metrics`."""
+
+# Number of samples held in memory at once by a single batch (about 32 MB of floats)
+BATCH_ELEMENTS = 1 << 22
+
+
+def resample_metrics(
+    samples: np.ndarray[Any, np.dtype[Any]],
+    n: int,
+    periods_per_year: float,
+    block_size: Optional[int] = None,
+    seed: Optional[int] = None,
+    processes: Optional[int] = None,
+    initial_equity: Optional[float] = None,
+) -> np.ndarray[Any, np.dtype[Any]]:
+    """Resamples returns or profits/losses with replacement and calculates metrics of the resampled equity paths.
+
+    Every path has as many samples as the original ones. Returns are compounded from the starting value of 1,
+    profits/losses (if the initial equity is provided) are added to the initial equity.
+    Paths are generated in batches of NumPy arrays, each batch with its own random generator
+    spawned from the seed, so the results for a given seed don't depend on the number of processes.
+
+    Args:
+        samples (np.ndarray[Any, np.dtype[Any]]): The returns (fractions, e.g. 0.01 for 1%) or profits/losses to resample.
+        n (int): The number of paths.
+        periods_per_year (float): The number of samples per year, used to annualize the Sharpe ratio.
+        block_size (Optional[int]): The length of blocks of consecutive returns resampled together
+            (circular block bootstrap), preserving autocorrelation. Optional, if not provided, samples are resampled one by one.
+        seed (Optional[int]): The seed of random generators. Optional, if not provided, results are not reproducible.
+        processes (Optional[int]): The number of processes the batches are split across. Optional, if not provided, runs in the current process.
+        initial_equity (Optional[float]): The initial equity the profits/losses are added to.
+            Optional, if not provided, samples are returns.
+
+    Returns:
+        np.ndarray[Any, np.dtype[Any]]: Array of shape (n, len(BOOTSTRAP_METRICS)) with metrics of every path.
+    """
+
+    batch_size = max(1, BATCH_ELEMENTS // max(len(samples), 1))
+    sizes = [min(batch_size, n - start) for start in range(0, n, batch_size)]
+    seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+
+    if processes is None or processes <= 1 or len(sizes) == 1:
+        return _resample_batches(
+            samples, sizes, seeds, periods_per_year, block_size, initial_equity
+        )
+
+    chunks = np.array_split(np.arange(len(sizes)), min(processes, len(sizes)))
+    with ProcessPoolExecutor(max_workers=len(chunks)) as executor:
+        results = executor.map(
+            _resample_batches,
+            [samples] * len(chunks),
+            [[sizes[i] for i in chunk] for chunk in chunks],
+            [[seeds[i] for i in chunk] for chunk in chunks],
+            [periods_per_year] * len(chunks),
+            [block_size] * len(chunks),
+            [initial_equity] * len(chunks),
+        )
+        return np.concatenate(list(results))
+
+
+def calc_paths_metrics(
+    paths_equity: np.ndarray[Any, np.dtype[Any]], periods_per_year: float
+) -> np.ndarray[Any, np.dtype[Any]]:
+    """Calculates metrics of equity paths, vectorized over all paths.
+
+    Args:
+        paths_equity (np.ndarray[Any, np.dtype[Any]]): Array of shape (paths, samples + 1) with equity of every path,
+            starting with the initial equity.
+        periods_per_year (float): The number of samples per year, used to annualize the Sharpe ratio.
+
+    Returns:
+        np.ndarray[Any, np.dtype[Any]]: Array of shape (paths, len(BOOTSTRAP_METRICS)) with metrics of every path.
+            The Sharpe ratio is NaN for paths with constant returns.
+    """
+
+    paths_num, returns_num = paths_equity.shape[0], paths_equity.shape[1] - 1
+    previous_equity = paths_equity[:, :-1]
+    peaks = np.maximum.accumulate(paths_equity, axis=1)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        # Returns after bankruptcy (equity dropped to zero or below) are zero instead of undefined
+        paths_returns = np.where(
+            previous_equity > 0, np.diff(paths_equity, axis=1) / previous_equity, 0.0
+        )
+        drawdowns = np.where(peaks > 0, (peaks - paths_equity) / peaks, 0.0)
+        stds = (
+            paths_returns.std(axis=1, ddof=1)
+            if returns_num > 1
+            else np.zeros(paths_num)
+        )
+        sharpe_ratios = np.where(
+            stds > 0,
+            paths_returns.mean(axis=1) / stds * np.sqrt(periods_per_year),
+            np.nan,
+        )
+
+    initial_equity = paths_equity[:, 0]
+    return np.column_stack(
+        [
+            (paths_equity[:, -1] - initial_equity) / initial_equity * 100,
+            drawdowns.max(axis=1) * 100,
+            sharpe_ratios,
+        ]
+    )
+
+
+def _resample_batches(
+    samples: np.ndarray[Any, np.dtype[Any]],
+    sizes: Sequence[int],
+    seeds: Sequence[np.random.SeedSequence],
+    periods_per_year: float,
+    block_size: Optional[int],
+    initial_equity: Optional[float],
+) -> np.ndarray[Any, np.dtype[Any]]:
+    metrics: List[np.ndarray[Any, np.dtype[Any]]] = []
+    for size, seed in zip(sizes, seeds):
+        generator = np.random.default_rng(seed)
+        indices = _sample_indices(generator, size, len(samples), block_size)
+        paths_samples = samples[indices]
+
+        paths_equity = np.empty((size, len(samples) + 1))
+        if initial_equity is None:
+            paths_equity[:, 0] = 1.0
+            np.cumprod(1 + paths_samples, axis=1, out=paths_equity[:, 1:])
+        else:
+            paths_equity[:, 0] = initial_equity
+            np.cumsum(paths_samples, axis=1, out=paths_equity[:, 1:])
+            paths_equity[:, 1:] += initial_equity
+
+        metrics.append(calc_paths_metrics(paths_equity, periods_per_year))
+
+    return np.concatenate(metrics)
+
+
+def _sample_indices(
+    generator: np.random.Generator,
+    size: int,
+    length: int,
+    block_size: Optional[int],
+) -> np.ndarray[Any, np.dtype[Any]]:
+    if block_size is None or block_size <= 1:
+        return generator.integers(0, length, size=(size, length))
+
+    # Circular block bootstrap: blocks start at random indices and wrap around the end of returns
+    blocks_num = -(-length // block_size)
+    starts = generator.integers(0, length, size=(size, blocks_num, 1))
+    indices = (starts + np.arange(block_size)) % length
+
+    return indices.reshape(size, blocks_num * block_size)[:, :length]
@@ -1,13 +1,17 @@
-from typing import List, Tuple
+from typing import List, Optional, Tuple, Union
 
 from .account import Account
 from .commission import Commission
 from .data import Data
-from .order import CloseOrder, Order, OrderAction
-from .position import Position, PositionType
+from .limit_order_book import LimitOrderBook, LimitOrdersView
+from .order import CloseOrder, Order, OrderAction, OrderRejectionReason
+from .position import Position, PositionMode, PositionsView, PositionType
+from .position_book import PositionBook
 from .spread import Spread
 from .stats import Statistics
+from .strategy import Strategy
 from .trade import CloseTrade, OpenTrade, Trade
+from .trade_log import TradeLog
 
 
 class Broker:
@@ -23,8 +27,10 @@ class Broker:
         accout: Account,
         spread: Spread,
         commission: Commission,
-        trades_log: List[Trade],
+        trades_log: Union[List[Trade], TradeLog],
         statistics: Statistics,
+        strategy_id: Optional[int] = None,
+        position_mode: PositionMode = PositionMode.HEDGING,
     ):
         """Initializes a Broker object.
 
@@ -33,28 +39,80 @@ class Broker:
             accout (Account): The account object representing the user's account.
             spread (float): The spread value for the broker.
             commission (Optional[Commission]): The commission object representing the broker's fees.
-            trades_log (List[Trade]): The list of trades made during the backtest, that will be filled.
+            trades_log (Union[List[Trade], TradeLog]): The log of trades made during the backtest, that will be filled.
             statistics (Statistics): The statistics object.
+            strategy_id (Optional[int]): The identifier of the strategy the broker trades for. Optional, used to attribute trades when several strategies share the account.
+            position_mode (PositionMode): Whether every fill opens a separate position (hedging) or fills are merged into one position per type (netting). Default is hedging.
         """
 
         self.__data = data
         self.__account = accout
         self.__spread = spread
         self.__commission = commission
-        self.__positions: List[Position] = []
-        self.__limit_orders: List[Order] = []
+        self.__positions = PositionBook()
+        self.__positions_view = PositionsView(
+            self.__positions, self.__positions.aggregates
+        )
+        self.__limit_orders = LimitOrderBook()
+        self.__limit_orders_view = LimitOrdersView(self.__limit_orders)
         self.__trades_log = trades_log
         self.__statistics = statistics
+        self.__strategy: Optional[Strategy] = None
+        self.__strategy_id = strategy_id
+        self.__position_mode = position_mode
+        self.__cash_flow = 0.0
+
+    def set_strategy(self, strategy: Strategy) -> None:
+        """Sets reference to the strategy, which is notified about orders' events.
+
+        Args:
+            strategy (Strategy): The strategy whose events' handlers are called.
+        """
+
+        self.__strategy = strategy
 
-    def get_positions(self) -> List[Position]:
-        """Returns the list of positions held by the user.
+    def get_positions(self) -> PositionBook:
+        """Returns the book of positions held by the user.
 
         Returns:
-            List[Position]: The list of positions held by the user.
+            PositionBook: The book of positions held by the user, in opening order.
         """
 
         return self.__positions
 
+    def get_cash_flow(self) -> float:
+        """Returns the total amount of money moved by the broker from and to the account.
+
+        Negative when the broker spent more money (opening positions, commissions) than it received from closing positions.
+        Together with the assets value it gives the profit/loss of the broker's trading.
+
+        Returns:
+            float: The total cash flow of the broker.
+        """
+
+        return self.__cash_flow
+
+    def get_positions_view(self) -> PositionsView:
+        """Returns the read-only view of the positions held by the user.
+
+        The view is not a copy, it always reflects the current positions,
+        and provides positions' aggregates kept up to date by the broker.
+
+        Returns:
+            PositionsView: The view of the positions held by the user.
+        """
+
+        return self.__positions_view
+
+    def get_limit_orders_view(self) -> LimitOrdersView:
+        """Returns the view of the pending limit orders, that allows cancelling them.
+
+        Returns:
+            LimitOrdersView: The view of the pending limit orders.
+        """
+
+        return self.__limit_orders_view
+
     def get_assets_value(self) -> float:
         """Returns the total value of the assets held by the user.
 
@@ -62,11 +120,7 @@ class Broker:
             float: The total value of the assets held by the user.
         """
 
-        assets_value = 0.0
-        for position in self.__positions:
-            assets_value += position.calc_value(self.__data.get_current_price())
-
-        return assets_value
+        return self.__positions.aggregates.calc_value(self.__data.get_current_price())
 
     def get_assets_value_at_price(self, price: float) -> float:
         """Returns the total value of the assets held by the user at a given price.
@@ -74,15 +128,11 @@ class Broker:
         Args:
             price (float): The price at which to calculate the value of the assets.
 
-        Args:
-            price (float): The price at which to calculate the value of the assets.
+        Returns:
+            float: The total value of the assets held by the user at the given price.
         """
 
-        assets_value = 0.0
-        for position in self.__positions:
-            assets_value += position.calc_value(price)
-
-        return assets_value
+        return self.__positions.aggregates.calc_value(price)
 
     def process_new_orders(self, new_orders: List[Order]) -> None:
         """Processes new orders and executes them if possible.
@@ -98,19 +148,24 @@ class Broker:
 
         for order in new_orders:
             if order.limit_price is not None:
-                self.__limit_orders.append(order)
+                self.__limit_orders.add(order)
                 continue
 
             if order.action == OrderAction.CLOSE:
                 adjusted_price = self.__adjust_close_price_by_spread(
                     price, order.position_type
                 )
-                self.__process_close_order(order, adjusted_price)
+                close_trades = self.__process_close_order(order, adjusted_price)
+                if self.__strategy is not None:
+                    for trade in close_trades:
+                        self.__strategy.on_close(trade)
             elif order.action == OrderAction.OPEN:
                 adjusted_price = self.__adjust_open_price_by_spread(
                     price, order.position_type
                 )
-                self.__process_open_order(order, adjusted_price)
+                open_trade = self.__process_open_order(order, adjusted_price)
+                if self.__strategy is not None and open_trade is not None:
+                    self.__strategy.on_fill(open_trade)
 
     def process_stop_losses(self) -> None:
         """Processes stop loss orders and closes positions if necessary."""
@@ -120,14 +175,11 @@ class Broker:
 
         close_orders: List[Tuple[CloseOrder, float]] = []
 
-        for position in self.__positions:
-            if position.stop_loss is None:
-                continue
-
-            if not self.__check_stop_loss_price(
-                position.stop_loss, low_price, high_price, position.position_type
-            ):
-                continue
+        for position in self.__positions.pop_triggered_stop_losses(
+            self.__adjust_close_price_by_spread(low_price, PositionType.LONG),
+            self.__adjust_close_price_by_spread(high_price, PositionType.SHORT),
+        ):
+            assert position.stop_loss is not None
 
             price = self.__get_stop_loss_order_price(
                 position.stop_loss, low_price, high_price, position.position_type
@@ -141,7 +193,10 @@ class Broker:
             close_orders.append((order, price))
 
         for order, price in close_orders:
-            self.__process_close_order(order, price)
+            close_trades = self.__process_close_order(order, price)
+            if self.__strategy is not None:
+                for trade in close_trades:
+                    self.__strategy.on_stop_loss(trade)
 
     def process_take_profits(self) -> None:
         """Processes take profit orders and closes positions if necessary."""
@@ -151,14 +206,11 @@ class Broker:
 
         close_orders: List[Tuple[CloseOrder, float]] = []
 
-        for position in self.__positions:
-            if position.take_profit is None:
-                continue
-
-            if not self.__check_take_profit_price(
-                position.take_profit, low_price, high_price, position.position_type
-            ):
-                continue
+        for position in self.__positions.pop_triggered_take_profits(
+            self.__adjust_close_price_by_spread(high_price, PositionType.LONG),
+            self.__adjust_close_price_by_spread(low_price, PositionType.SHORT),
+        ):
+            assert position.take_profit is not None
 
             price = self.__get_take_profit_order_price(
                 position.take_profit, low_price, high_price, position.position_type
@@ -171,7 +223,10 @@ class Broker:
             close_orders.append((order, price))
 
         for order, price in close_orders:
-            self.__process_close_order(order, price)
+            close_trades = self.__process_close_order(order, price)
+            if self.__strategy is not None:
+                for trade in close_trades:
+                    self.__strategy.on_take_profit(trade)
 
     def process_limit_orders(self) -> None:
         """Processes limit orders and executes them if possible."""
@@ -180,108 +235,167 @@ class Broker:
         low_price = self.__data.get_current_low_price()
         high_price = self.__data.get_current_high_price()
 
-        orders_to_remove: List[Order] = []
-
-        for order in self.__limit_orders:
+        for order in self.__limit_orders.pop_triggered(
+            self.__adjust_open_price_by_spread(price, PositionType.LONG),
+            self.__adjust_open_price_by_spread(price, PositionType.SHORT),
+        ):
             assert order.limit_price is not None
-            if order.action == OrderAction.OPEN:
-                if not self.__check_limit_price(
-                    order.limit_price, price, order.position_type
-                ):
-                    continue
 
-                order_price = self.__get_limit_order_price(
-                    order.limit_price, low_price, high_price, order.position_type
-                )
-                self.__process_open_order(order, order_price)
-                orders_to_remove.append(order)
-
-        for order in orders_to_remove:
-            self.__limit_orders.remove(order)
-
-    def __process_open_order(self, order: Order, price: float) -> None:
+            order_price = self.__get_limit_order_price(
+                order.limit_price,
+                low_price,
+                high_price,
+                LimitOrderBook.is_buy_order(order),
+            )
+            if order.action == OrderAction.OPEN:
+                open_trade = self.__process_open_order(order, order_price)
+                if self.__strategy is not None and open_trade is not None:
+                    self.__strategy.on_fill(open_trade)
+            elif order.action == OrderAction.CLOSE:
+                close_trades = self.__process_close_order(order, order_price)
+                if self.__strategy is not None:
+                    for trade in close_trades:
+                        self.__strategy.on_close(trade)
+
+    def __process_open_order(self, order: Order, price: float) -> Optional[Trade]:
         money = order.size * price
         commission = self.__commission.calc_commission_value(price) * order.size
         total_cost = money + commission
 
         if not self.__account.has_enough_money(total_cost):
-            return
+            if self.__strategy is not None:
+                self.__strategy.on_order_rejected(
+                    order, OrderRejectionReason.INSUFFICIENT_MONEY
+                )
+            return None
 
-        self.__positions.append(
-            Position(
-                order.position_type,
-                price,
-                self.__data.get_current_numpy_datetime(),
-                order.size,
-                order.stop_loss,
-                order.take_profit,
-            )
+        net_position = (
+            self.__positions.get_first(order.position_type)
+            if self.__position_mode == PositionMode.NETTING
+            else None
         )
-        self.__account.update_money(-total_cost)
-        self.__statistics.add_commission(commission)
+        if net_position is not None and not self.__are_net_levels_valid(
+            net_position, order, price
+        ):
+            if self.__strategy is not None:
+                self.__strategy.on_order_rejected(
+                    order, OrderRejectionReason.INVALID_LEVELS
+                )
+            return None
 
-        self.__trades_log.append(
-            OpenTrade(
-                order.position_type,
-                self.__data.get_current_numpy_datetime(),
-                price,
-                order.size,
-                market_order=(order.limit_price is None),
+        if net_position is None:
+            self.__positions.add(
+                Position(
+                    order.position_type,
+                    price,
+                    self.__data.get_current_numpy_datetime(),
+                    order.size,
+                    order.stop_loss,
+                    order.take_profit,
+                )
             )
+        else:
+            self.__positions.increase(net_position, price, order.size)
+            if order.stop_loss is not None:
+                net_position.update_stop_loss(order.stop_loss)
+            if order.take_profit is not None:
+                net_position.update_take_profit(order.take_profit)
+        self.__update_money(-total_cost)
+        self.__statistics.add_commission(commission)
+
+        open_trade = OpenTrade(
+            order.position_type,
+            self.__data.get_current_numpy_datetime(),
+            price,
+            order.size,
+            market_order=(order.limit_price is None),
+            strategy_id=self.__strategy_id,
+        )
+        self.__trades_log.append(open_trade)
+        self.__statistics.record_trade(open_trade)
+
+        return open_trade
+
+    @staticmethod
+    def __are_net_levels_valid(position: Position, order: Order, price: float) -> bool:
+        # The order's levels replace the position's ones, so they are checked
+        # against the average open price after the order is added
+        total_size = position.size + order.size
+        open_price = (position.open_price * position.size + price * order.size) / (
+            total_size
+        )
+
+        return Position.is_stop_loss_valid(
+            position.position_type, open_price, order.stop_loss
+        ) and Position.is_take_profit_valid(
+            position.position_type, open_price, order.take_profit
         )
 
-    def __process_close_order(self, order: Order, price: float) -> None:
+    def __process_close_order(self, order: Order, price: float) -> List[Trade]:
         if order.position_to_close is not None:
-            self.__process_close_order_specified_position(order, price)
-        else:
-            self.__process_close_order_fifo_positions(order, price)
+            if order.position_to_close not in self.__positions:
+                if self.__strategy is not None:
+                    self.__strategy.on_order_rejected(
+                        order, OrderRejectionReason.POSITION_NOT_FOUND
+                    )
+                return []
+
+            return [self.__process_close_order_specified_position(order, price)]
+
+        close_trades = self.__process_close_order_fifo_positions(order, price)
+        if self.__strategy is not None and close_trades == []:
+            self.__strategy.on_order_rejected(
+                order, OrderRejectionReason.NO_POSITION_TO_CLOSE
+            )
 
-    def __process_close_order_fifo_positions(self, order: Order, price: float) -> None:
+        return close_trades
+
+    def __process_close_order_fifo_positions(
+        self, order: Order, price: float
+    ) -> List[Trade]:
         size_to_reduce_left = order.size
-        positions_to_close: List[Position] = []
+        close_trades: List[Trade] = []
 
-        for i, position in enumerate(self.__positions):
-            if position.position_type != order.position_type:
-                continue
+        while size_to_reduce_left > 0:
+            position = self.__positions.get_first(order.position_type)
+            if position is None:
+                break
 
             reduce_size = min(size_to_reduce_left, position.size)
 
             if reduce_size < position.size:
-
-                self.__positions[i] = position.replace(size=position.size - reduce_size)
+                self.__positions.reduce(position, reduce_size)
             else:
-                positions_to_close.append(position)
+                self.__positions.remove(position)
 
-            self.__account.update_money(
+            self.__update_money(
                 self.__calc_money_from_close(position, price, reduce_size)
             )
             commission = self.__commission.calc_commission_value(price) * reduce_size
             self.__statistics.add_commission(commission)
-            self.__account.update_money(-commission)
+            self.__update_money(-commission)
 
             size_to_reduce_left -= reduce_size
 
-            self.__trades_log.append(
-                CloseTrade(
-                    order.position_type,
-                    position.open_datetime,
-                    position.open_price,
-                    self.__data.get_current_numpy_datetime(),
-                    price,
-                    reduce_size,
-                    market_order=(order.limit_price is None),
-                )
+            close_trade = CloseTrade(
+                order.position_type,
+                position.open_datetime,
+                position.open_price,
+                self.__data.get_current_numpy_datetime(),
+                price,
+                reduce_size,
+                market_order=(order.limit_price is None),
+                strategy_id=self.__strategy_id,
             )
+            self.__trades_log.append(close_trade)
+            self.__statistics.record_trade(close_trade)
+            close_trades.append(close_trade)
 
-            if size_to_reduce_left == 0:
-                break
-
-        for position in positions_to_close:
-            self.__positions.remove(position)
+        return close_trades
 
     def __process_close_order_specified_position(
         self, order: Order, price: float
-    ) -> None:
+    ) -> Trade:
         assert order.position_to_close is not None
 
         if order.size > order.position_to_close.size:
@@ -289,32 +403,36 @@ class Broker:
                 "if order.position_to_close is specified, order.size must be less than or equal to order.position_to_close.size"
             )
 
-        self.__account.update_money(
+        self.__update_money(
             self.__calc_money_from_close(order.position_to_close, price, order.size)
         )
-        self.__account.update_money(
+        self.__update_money(
             -self.__commission.calc_commission_value(price) * order.size
         )
 
         if order.size == order.position_to_close.size:
             self.__positions.remove(order.position_to_close)
         else:
-            position_index = self.__positions.index(order.position_to_close)
-            self.__positions[position_index] = order.position_to_close.replace(
-                size=order.position_to_close.size - order.size
-            )
-
-        self.__trades_log.append(
-            CloseTrade(
-                order.position_type,
-                order.position_to_close.open_datetime,
-                order.position_to_close.open_price,
-                self.__data.get_current_numpy_datetime(),
-                price,
-                order.size,
-                market_order=(order.limit_price is None),
-            )
+            self.__positions.reduce(order.position_to_close, order.size)
+
+        close_trade = CloseTrade(
+            order.position_type,
+            order.position_to_close.open_datetime,
+            order.position_to_close.open_price,
+            self.__data.get_current_numpy_datetime(),
+            price,
+            order.size,
+            market_order=(order.limit_price is None),
+            strategy_id=self.__strategy_id,
         )
+        self.__trades_log.append(close_trade)
+        self.__statistics.record_trade(close_trade)
+
+        return close_trade
+
+    def __update_money(self, amount: float) -> None:
+        self.__account.update_money(amount)
+        self.__cash_flow += amount
 
     def __adjust_open_price_by_spread(
         self, price: float, position_type: PositionType
@@ -337,49 +455,19 @@ class Broker:
             else size * (2 * position.open_price - current_price)
         )
 
-    def __check_limit_price(
-        self, limit_price: float, price: float, position_type: PositionType
-    ) -> bool:
-        price = self.__adjust_open_price_by_spread(price, position_type)
-        return (
-            limit_price >= price
-            if position_type == PositionType.LONG
-            else limit_price <= price
-        )
-
     def __get_limit_order_price(
         self,
         limit_price: float,
         low_price: float,
         high_price: float,
-        position_type: PositionType,
+        is_buy_order: bool,
     ) -> float:
         return (
             min(high_price, limit_price)
-            if position_type == PositionType.LONG
+            if is_buy_order
             else max(low_price, limit_price)
         )
 
-    def __check_stop_loss_price(
-        self,
-        stop_loss_price: float,
-        low_price: float,
-        high_price: float,
-        position_type: PositionType,
-    ) -> bool:
-        adjusted_low_price = self.__adjust_close_price_by_spread(
-            low_price, position_type
-        )
-        adjusted_high_price = self.__adjust_close_price_by_spread(
-            high_price, position_type
-        )
-
-        return (
-            stop_loss_price >= adjusted_low_price
-            if position_type == PositionType.LONG
-            else stop_loss_price <= adjusted_high_price
-        )
-
     def __get_stop_loss_order_price(
         self,
         stop_loss_price: float,
@@ -393,26 +481,6 @@ class Broker:
             else max(low_price, stop_loss_price)
         )
 
-    def __check_take_profit_price(
-        self,
-        take_profit_price: float,
-        low_price: float,
-        high_price: float,
-        position_type: PositionType,
-    ) -> bool:
-        adjusted_low_price = self.__adjust_close_price_by_spread(
-            low_price, position_type
-        )
-        adjusted_high_price = self.__adjust_close_price_by_spread(
-            high_price, position_type
-        )
-
-        return (
-            take_profit_price <= adjusted_high_price
-            if position_type == PositionType.LONG
-            else take_profit_price >= adjusted_low_price
-        )
-
     def __get_take_profit_order_price(
         self,
         take_profit_price: float,
@@ -1,3 +1,4 @@
+import hashlib
 from datetime import datetime
 from enum import Enum
 from typing import Any, List, Optional, Tuple
@@ -46,6 +47,7 @@ class Data:
         self.__data = data
         self.__current_data_index = 0
         self.__candlestick_phase = CandlestickPhase.OPEN
+        self.__fingerprint: Optional[str] = None
 
     def __getitem__(self, index: int) -> Any:
         """Returns the data at the specified index.
@@ -117,6 +119,23 @@ class Data:
 
         return self.__data[key] if key else self.__data
 
+    def get_fingerprint(self) -> str:
+        """Returns the fingerprint of the dataset.
+
+        The fingerprint is a hash of the whole dataset, so identical datasets have identical fingerprints.
+        It is calculated once and then reused.
+
+        Returns:
+            str: The fingerprint of the dataset.
+        """
+
+        if self.__fingerprint is None:
+            digest = hashlib.sha256(str(self.__data.dtype.descr).encode("utf-8"))
+            digest.update(np.ascontiguousarray(self.__data).tobytes())
+            self.__fingerprint = digest.hexdigest()
+
+        return self.__fingerprint
+
     def get_current_data_index(self) -> int:
         """Returns the current data index.
 
@@ -0,0 +1,19 @@
+import numpy as np
+
+# EXPOSURE_LOG_TYPE defines the structured dtype of a single entry of the exposure log,
+# recorded after every candlestick and aligned with the equity log.
+# Fields:
+#     cash (float): The money on the account.
+#     gross_exposure (float): The market value of long and short positions together.
+#     net_exposure (float): The market value of long positions minus the market value of short positions.
+#     open_positions (int64): The number of open positions.
+#     margin_used (float): The money locked in open positions (their value at open prices).
+EXPOSURE_LOG_TYPE = np.dtype(
+    [
+        ("cash", "f8"),
+        ("gross_exposure", "f8"),
+        ("net_exposure", "f8"),
+        ("open_positions", "i8"),
+        ("margin_used", "f8"),
+    ]
+)
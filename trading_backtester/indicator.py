@@ -1,9 +1,10 @@
 from abc import ABC, abstractmethod
-from typing import Any, List
+from typing import Any, List, Optional
 
 import numpy as np
 
 from .data import Data
+from .indicator_store import IndicatorStore
 
 
 class Indicator(ABC):
@@ -12,11 +13,21 @@ class Indicator(ABC):
     Should be subclassed by the user to implement specific trading strategies.
     """
 
-    def __init__(self):
-        """Initializes an Indicator object."""
+    def __init__(self, warm_up_period: Optional[int] = None):
+        """Initializes an Indicator object.
+
+        Args:
+            warm_up_period (Optional[int]): The number of candlesticks the indicator needs before its values are valid.
+                Optional, if not provided, it is detected from the calculated values (leading rows containing NaN).
+        """
+
+        if warm_up_period is not None and warm_up_period < 0:
+            raise ValueError("warm_up_period must be greater than or equal to 0.")
 
         self.__data: Data
         self.__indicator_values: np.ndarray[Any, np.dtype[Any]]
+        self.__warm_up_period = warm_up_period
+        self.__candlesticks_to_skip: Optional[int] = None
 
     def __getitem__(self, index: int) -> float | List[float] | Any:
         """Returns the indicator value at the specified index.
@@ -40,15 +51,58 @@ class Indicator(ABC):
 
         return self.get_current_indicator_value()
 
-    def prepare_indicator(self, data: Data) -> None:
+    def prepare_indicator(
+        self, data: Data, indicator_store: Optional[IndicatorStore] = None
+    ) -> None:
         """Prepares the indicator with the provided data.
 
+        If the indicator store is provided and the indicator is cacheable (see `get_cache_key`),
+        values are read from the store, or calculated and saved to the store if they are not there yet.
+
         Args:
             data (Data): The data object containing market data.
+            indicator_store (Optional[IndicatorStore]): The store of already calculated indicator values. Optional.
         """
 
         self.__data = data
-        self.__indicator_values = self._calc_indicator_values(self.__data)
+        self.__candlesticks_to_skip = None
+
+        cache_key = self.get_cache_key() if indicator_store is not None else None
+        if indicator_store is None or cache_key is None:
+            self.__indicator_values = self._calc_indicator_values(self.__data)
+            return
+
+        store_key = f"{cache_key}@{self.__data.get_fingerprint()}"
+        indicator_values = indicator_store.get(store_key)
+        if indicator_values is None:
+            indicator_values = self._calc_indicator_values(self.__data)
+            indicator_store.put(store_key, indicator_values)
+
+        self.__indicator_values = indicator_values
+
+    def get_cache_key(self) -> Optional[str]:
+        """Returns the key identifying the indicator's values for the indicator store.
+
+        By default the key is built from the indicator's class and its attributes (parameters).
+        Indicators with attributes other than plain values (bool, int, float, str, None) are not cacheable.
+        Should be overridden by subclasses whose values depend on anything else.
+
+        Returns:
+            Optional[str]: The key identifying the indicator's values. None if the indicator is not cacheable.
+        """
+
+        params: List[str] = []
+        for name, value in sorted(vars(self).items()):
+            if name.startswith("_Indicator__"):
+                continue
+
+            if value is not None and not isinstance(value, (bool, int, float, str)):
+                return None
+
+            params.append(f"{name}={value!r}")
+
+        indicator_class = type(self)
+        return f"{indicator_class.__module__}.{indicator_class.__qualname__}({', '.join(params)})"
 
     def get_indicator_values(self) -> np.ndarray[Any, np.dtype[Any]]:
         """Returns the indicator values.
@@ -72,15 +126,42 @@ class Indicator(ABC):
         """Returns the number of candlesticks to skip.
 
         Some indicators may require a certain number of candlesticks to be available before they can be calculated.
+        If the warm-up period was not declared, it is the index of the first row without NaN values.
 
         Returns:
             int: The number of candlesticks to skip.
         """
 
-        for index, indicator in enumerate(self.__indicator_values):
-            if not np.isnan(indicator).any():
-                return index
-        return 0
+        if self.__warm_up_period is not None:
+            return self.__warm_up_period
+
+        if self.__candlesticks_to_skip is None:
+            self.__candlesticks_to_skip = self.__detect_warm_up_period()
+
+        return self.__candlesticks_to_skip
+
+    def __detect_warm_up_period(self) -> int:
+        indicator_values = np.asarray(self.__indicator_values)
+        if len(indicator_values) == 0:
+            return 0
+
+        if not np.issubdtype(indicator_values.dtype, np.inexact):
+            # Values of other dtypes (e.g. object arrays of floats) are checked for NaN as floats if possible
+            try:
+                indicator_values = np.asarray(indicator_values, dtype=float)
+            except (TypeError, ValueError):
+                return 0
+
+        rows_with_nan = np.isnan(
+            indicator_values.reshape(len(indicator_values), -1)
+        ).any(axis=1)
+        first_valid_row = int(np.argmin(rows_with_nan))
+
+        if rows_with_nan[first_valid_row]:
+            # There are no valid rows at all
+            return 0
+
+        return first_valid_row
 
     @abstractmethod
     def _calc_indicator_values(self, data: Data) -> np.ndarray[Any, np.dtype[Any]]:
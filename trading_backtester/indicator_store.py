@@ -0,0 +1,149 @@
+import hashlib
+import os
+import tempfile
+from typing import Any, List, Optional, Tuple
+
+import numpy as np
+
+
+class IndicatorStore:
+    """Persistent on-disk store for calculated indicator values.
+
+    Indicator values are saved as `.npy` files in the store's directory
+    and are memory-mapped when read, so expensive indicators are calculated once
+    and then shared between subsequent runs and worker processes.
+    The store may be limited in size, in which case the least recently used entries are evicted first.
+    """
+
+    __FILE_EXTENSION = ".npy"
+
+    def __init__(self, directory: str, max_size: Optional[int] = None):
+        """Initializes an IndicatorStore object.
+
+        Args:
+            directory (str): The directory where indicator values are stored. Created if it does not exist.
+            max_size (Optional[int]): The maximum total size of the stored values in bytes. Optional, if not provided, the store is not limited.
+        """
+
+        if max_size is not None and max_size <= 0:
+            raise ValueError("max_size must be greater than 0.")
+
+        os.makedirs(directory, exist_ok=True)
+        self.__directory = directory
+        self.__max_size = max_size
+
+    @property
+    def directory(self) -> str:
+        """Returns the directory where indicator values are stored.
+
+        Returns:
+            str: The directory of the store.
+        """
+
+        return self.__directory
+
+    def get(self, key: str) -> Optional[np.ndarray[Any, np.dtype[Any]]]:
+        """Returns the stored values for the given key.
+
+        Values are memory-mapped in read-only mode.
+        Reading an entry marks it as recently used.
+
+        Args:
+            key (str): The key identifying the values.
+
+        Returns:
+            Optional[np.ndarray[Any, np.dtype[Any]]]: The stored values. None if there are no values for the key.
+        """
+
+        path = self.__get_path(key)
+        try:
+            values = np.load(path, mmap_mode="r", allow_pickle=False)
+            os.utime(path)
+        except (OSError, ValueError):
+            return None
+
+        return values
+
+    def put(self, key: str, values: np.ndarray[Any, np.dtype[Any]]) -> None:
+        """Stores the values under the given key.
+
+        Values of object dtype can't be memory-mapped, so they are not stored.
+        If the store is limited in size, the least recently used entries are evicted afterwards.
+
+        Args:
+            key (str): The key identifying the values.
+            values (np.ndarray[Any, np.dtype[Any]]): The values to store.
+        """
+
+        values = np.asarray(values)
+        if values.dtype.hasobject:
+            return
+
+        # Write to a temporary file first, so other processes never read a partially written entry.
+        file_descriptor, temp_path = tempfile.mkstemp(
+            dir=self.__directory, suffix=".tmp"
+        )
+        try:
+            with os.fdopen(file_descriptor, "wb") as file:
+                np.save(file, values, allow_pickle=False)
+            os.replace(temp_path, self.__get_path(key))
+        except BaseException:
+            os.remove(temp_path)
+            raise
+
+        self.__evict()
+
+    def clear(self) -> None:
+        """Removes all entries from the store."""
+
+        for _, _, path in self.__list_entries():
+            self.__remove_file(path)
+
+    def get_size(self) -> int:
+        """Returns the total size of the stored values.
+
+        Returns:
+            int: The total size of the stored values in bytes.
+        """
+
+        return sum(size for _, size, _ in self.__list_entries())
+
+    def __get_path(self, key: str) -> str:
+        file_name = hashlib.sha256(key.encode("utf-8")).hexdigest()
+        return os.path.join(self.__directory, file_name + self.__FILE_EXTENSION)
+
+    def __list_entries(self) -> List[Tuple[float, int, str]]:
+        entries: List[Tuple[float, int, str]] = []
+        for file_name in os.listdir(self.__directory):
+            if not file_name.endswith(self.__FILE_EXTENSION):
+                continue
+
+            path = os.path.join(self.__directory, file_name)
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+
+        return entries
+
+    def __evict(self) -> None:
+        if self.__max_size is None:
+            return
+
+        entries = self.__list_entries()
+        total_size = sum(size for _, size, _ in entries)
+
+        for _, size, path in sorted(entries):
+            if total_size <= self.__max_size:
+                break
+
+            self.__remove_file(path)
+            total_size -= size
+
+    def __remove_file(self, path: str) -> None:
+        try:
+            os.remove(path)
+        except OSError:
+            # Already removed by another process or still memory-mapped (on some platforms).
+            pass
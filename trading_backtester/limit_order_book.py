@@ -0,0 +1,163 @@
+import bisect
+from typing import Dict, Iterator, List, Tuple
+
+from .order import Order, OrderAction
+from .position import PositionType
+
+
+class LimitOrderBook:
+    """Represents the book of pending limit orders.
+
+    Orders are split into the buy side (opening long and closing short positions)
+    and the sell side (opening short and closing long positions).
+    Each side is kept sorted by limit price, so that orders triggered at a given price are found by binary search,
+    and triggered orders are returned in the order they were placed.
+    Cancelled orders are removed from the sorted sides lazily, so cancelling is O(1).
+    """
+
+    def __init__(self):
+        """Initializes an empty LimitOrderBook object."""
+
+        self.__next_handle = 0
+        self.__orders: Dict[int, Order] = {}
+        self.__handles: Dict[Order, int] = {}
+        # Buy side keys are limit prices, sell side keys are negated limit prices,
+        # so on both sides triggered orders are at the end of the sorted list.
+        self.__buy_keys: List[Tuple[float, int]] = []
+        self.__sell_keys: List[Tuple[float, int]] = []
+
+    def __len__(self) -> int:
+        return len(self.__orders)
+
+    def __iter__(self) -> Iterator[Order]:
+        return iter(self.__orders.values())
+
+    def __contains__(self, order: object) -> bool:
+        return order in self.__handles
+
+    @staticmethod
+    def is_buy_order(order: Order) -> bool:
+        """Checks whether the order buys the asset (opens long or closes short position).
+
+        Args:
+            order (Order): The order to check.
+
+        Returns:
+            bool: True if the order buys the asset, False if it sells it.
+        """
+
+        return (order.action == OrderAction.OPEN) == (
+            order.position_type == PositionType.LONG
+        )
+
+    def add(self, order: Order) -> None:
+        """Adds the limit order to the book.
+
+        Args:
+            order (Order): The order to add. Must have the limit price.
+        """
+
+        assert order.limit_price is not None
+
+        handle = self.__next_handle
+        self.__next_handle += 1
+
+        self.__orders[handle] = order
+        self.__handles[order] = handle
+        if self.is_buy_order(order):
+            bisect.insort(self.__buy_keys, (order.limit_price, handle))
+        else:
+            bisect.insort(self.__sell_keys, (-order.limit_price, handle))
+
+    def cancel(self, order: Order) -> bool:
+        """Cancels the pending limit order.
+
+        Args:
+            order (Order): The order to cancel.
+
+        Returns:
+            bool: True if the order was cancelled, False if it is not pending (already executed or cancelled).
+        """
+
+        handle = self.__handles.pop(order, None)
+        if handle is None:
+            return False
+
+        del self.__orders[handle]
+
+        # Drop cancelled orders once they outnumber the pending ones, so the sides don't grow unbounded
+        for keys in (self.__buy_keys, self.__sell_keys):
+            if len(keys) > 2 * len(self.__orders) + 32:
+                keys[:] = [key for key in keys if key[1] in self.__orders]
+
+        return True
+
+    def pop_triggered(self, buy_price: float, sell_price: float) -> List[Order]:
+        """Removes and returns the triggered orders, in the order they were placed.
+
+        A buy order is triggered if its limit price is greater than or equal to the buy price,
+        a sell order if its limit price is less than or equal to the sell price.
+
+        Args:
+            buy_price (float): The price (with spread) at which the asset can be bought.
+            sell_price (float): The price (with spread) at which the asset can be sold.
+
+        Returns:
+            List[Order]: The triggered orders.
+        """
+
+        handles: List[int] = []
+
+        for keys, bound in (
+            (self.__buy_keys, buy_price),
+            (self.__sell_keys, -sell_price),
+        ):
+            start = bisect.bisect_left(keys, (bound, -1))
+            handles.extend(
+                handle for _, handle in keys[start:] if handle in self.__orders
+            )
+            del keys[start:]
+
+        handles.sort()
+
+        triggered_orders: List[Order] = []
+        for handle in handles:
+            order = self.__orders.pop(handle)
+            del self.__handles[order]
+            triggered_orders.append(order)
+
+        return triggered_orders
+
+
+class LimitOrdersView:
+    """Represents a view of the pending limit orders, that allows only cancelling them."""
+
+    def __init__(self, limit_order_book: LimitOrderBook):
+        """Initializes a LimitOrdersView object.
+
+        Args:
+            limit_order_book (LimitOrderBook): The book of pending limit orders.
+        """
+
+        self.__limit_order_book = limit_order_book
+
+    def __len__(self) -> int:
+        return len(self.__limit_order_book)
+
+    def __iter__(self) -> Iterator[Order]:
+        return iter(self.__limit_order_book)
+
+    def __contains__(self, order: object) -> bool:
+        return order in self.__limit_order_book
+
+    def cancel(self, order: Order) -> bool:
+        """Cancels the pending limit order.
+
+        Args:
+            order (Order): The order to cancel.
+
+        Returns:
+            bool: True if the order was cancelled, False if it is not pending (already executed or cancelled).
+        """
+
+        return self.__limit_order_book.cancel(order)
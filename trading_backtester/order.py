@@ -14,6 +14,19 @@ class OrderAction(Enum):
     """Order to close a position."""
 
 
+class OrderRejectionReason(Enum):
+    """Represents the reason why the broker rejected an order."""
+
+    INSUFFICIENT_MONEY = 1
+    """There is not enough money in the account to open the position."""
+    NO_POSITION_TO_CLOSE = 2
+    """There is no open position of the order's type to close."""
+    POSITION_NOT_FOUND = 3
+    """The position to close is no longer open (it was fully closed)."""
+    INVALID_LEVELS = 4
+    """The stop loss or take profit is invalid for the position the order adds to (netting mode)."""
+
+
 class Order(ABC):
     """Base class for orders.
 
@@ -155,6 +168,7 @@ class CloseOrder(Order):
         size: int,
         position_type: Optional[PositionType] = None,
         position_to_close: Optional[Position] = None,
+        limit_price: Optional[float] = None,
     ):
         """Initializes a CloseOrder object.
 
@@ -162,6 +176,7 @@ class CloseOrder(Order):
             size (int): The size of the order.
             position_type (Optional[PositionType]): The type of position (long or short). Optional, if not provided, the position will be closed in FIFO order.
             position_to_close (Optional[Position]): The position to close. Optional, if not provided, the position will be closed in FIFO order.
+            limit_price (Optional[float]): The limit price for the order. Optional, if not provided, the order will be a market order.
         """
 
         if position_to_close is None and position_type is None:
@@ -179,4 +194,5 @@ class CloseOrder(Order):
             action=OrderAction.CLOSE,
             position_type=position_type,
             position_to_close=position_to_close,
+            limit_price=limit_price,
         )
@@ -0,0 +1,155 @@
+from enum import Enum
+from typing import Any, List, Optional
+
+import numpy as np
+
+from .data import CandlestickPhase
+from .order import CloseOrder, OpenOrder, Order, OrderAction
+from .position import PositionType
+
+
+class OrderArrays:
+    """Represents orders for the whole history as NumPy arrays.
+
+    Each row is a single order placed at the given candlestick (index of the data) and its phase.
+    Phase, action and position type are stored as values of the `CandlestickPhase`, `OrderAction`
+    and `PositionType` enums. Missing prices (limit, stop loss, take profit) are stored as NaN.
+    Rows are kept sorted by candlestick and phase, so orders for a phase are found by binary search.
+    """
+
+    def __init__(
+        self,
+        index: Any,
+        phase: Any,
+        action: Any,
+        position_type: Any,
+        size: Any,
+        limit_price: Any = None,
+        stop_loss: Any = None,
+        take_profit: Any = None,
+    ):
+        """Initializes an OrderArrays object.
+
+        Every argument may be an array or a scalar (enum members are accepted), scalars are broadcast to the length of `index`.
+
+        Args:
+            index (Any): The indexes of candlesticks at which orders are placed.
+            phase (Any): The candlestick phases (`CandlestickPhase` values) at which orders are placed.
+            action (Any): The actions (`OrderAction` values) of orders.
+            position_type (Any): The position types (`PositionType` values) of orders.
+            size (Any): The sizes of orders.
+            limit_price (Any): The limit prices of orders. Optional, NaN (or None) for market orders.
+            stop_loss (Any): The stop loss prices of opened positions. Optional, NaN (or None) if not set.
+            take_profit (Any): The take profit prices of opened positions. Optional, NaN (or None) if not set.
+        """
+
+        index_array = np.asarray(index, dtype=np.int64).reshape(-1)
+        length = len(index_array)
+
+        phase_array = self.__to_array(phase, length, np.int8)
+        action_array = self.__to_array(action, length, np.int8)
+        position_type_array = self.__to_array(position_type, length, np.int8)
+        size_array = self.__to_array(size, length, np.int64)
+        limit_price_array = self.__to_array(limit_price, length, float)
+        stop_loss_array = self.__to_array(stop_loss, length, float)
+        take_profit_array = self.__to_array(take_profit, length, float)
+
+        if (index_array < 0).any():
+            raise ValueError("Order indexes must be greater than or equal to 0.")
+        if not np.isin(
+            phase_array, (CandlestickPhase.OPEN.value, CandlestickPhase.CLOSE.value)
+        ).all():
+            raise ValueError("Unknown candlestick phase.")
+        if not np.isin(
+            action_array, (OrderAction.OPEN.value, OrderAction.CLOSE.value)
+        ).all():
+            raise ValueError("Unknown order action.")
+        if not np.isin(
+            position_type_array, (PositionType.LONG.value, PositionType.SHORT.value)
+        ).all():
+            raise ValueError("Unknown position type.")
+        if (size_array <= 0).any():
+            raise ValueError("Order sizes must be greater than 0.")
+
+        close_orders = action_array == OrderAction.CLOSE.value
+        if (
+            ~np.isnan(stop_loss_array[close_orders])
+            | ~np.isnan(take_profit_array[close_orders])
+        ).any():
+            raise ValueError("Close orders can't have stop loss or take profit.")
+
+        keys = index_array * 2 + (phase_array - CandlestickPhase.OPEN.value)
+        order = np.argsort(keys, kind="stable")
+
+        self.__keys = keys[order]
+        self.__action = action_array[order]
+        self.__position_type = position_type_array[order]
+        self.__size = size_array[order]
+        self.__limit_price = limit_price_array[order]
+        self.__stop_loss = stop_loss_array[order]
+        self.__take_profit = take_profit_array[order]
+
+    def __len__(self) -> int:
+        """Returns the number of orders.
+
+        Returns:
+            int: The number of orders.
+        """
+
+        return len(self.__keys)
+
+    def get_orders(self, data_index: int, phase: CandlestickPhase) -> List[Order]:
+        """Returns the orders placed at the given candlestick and its phase.
+
+        Args:
+            data_index (int): The index of the candlestick.
+            phase (CandlestickPhase): The phase of the candlestick.
+
+        Returns:
+            List[Order]: The orders placed at the given candlestick and phase.
+        """
+
+        key = data_index * 2 + (phase.value - CandlestickPhase.OPEN.value)
+        start = int(np.searchsorted(self.__keys, key, side="left"))
+        stop = int(np.searchsorted(self.__keys, key, side="right"))
+
+        return [self.__create_order(row) for row in range(start, stop)]
+
+    def __create_order(self, row: int) -> Order:
+        position_type = PositionType(int(self.__position_type[row]))
+        size = int(self.__size[row])
+
+        if self.__action[row] == OrderAction.CLOSE.value:
+            return CloseOrder(
+                size=size,
+                position_type=position_type,
+                limit_price=self.__to_optional_price(self.__limit_price[row]),
+            )
+
+        return OpenOrder(
+            size=size,
+            position_type=position_type,
+            stop_loss=self.__to_optional_price(self.__stop_loss[row]),
+            take_profit=self.__to_optional_price(self.__take_profit[row]),
+            limit_price=self.__to_optional_price(self.__limit_price[row]),
+        )
+
+    @staticmethod
+    def __to_array(values: Any, length: int, dtype: Any) -> np.ndarray[Any, Any]:
+        if values is None:
+            values = np.nan
+        elif isinstance(values, Enum):
+            values = values.value
+
+        array = np.asarray(values, dtype=dtype).reshape(-1)
+        if len(array) == 1:
+            return np.full(length, array[0], dtype=dtype)
+
+        if len(array) != length:
+            raise ValueError("All order arrays must have the same length.")
+
+        return array
+
+    @staticmethod
+    def __to_optional_price(price: float) -> Optional[float]:
+        return None if np.isnan(price) else float(price)
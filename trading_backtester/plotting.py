@@ -1,4 +1,4 @@
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Sequence
 
 import numpy as np
 from matplotlib import pyplot as plt
@@ -40,7 +40,7 @@ class Plotting:
     def __init__(
         self,
         data: Data,
-        trades: List[Trade],
+        trades: Sequence[Trade],
         equity_log: np.ndarray[Any, np.dtype[Any]],
     ):
         """Initializes the Plotting object.
@@ -49,7 +49,7 @@ class Plotting:
 
         Args:
             data (Data): The data used for the backtest.
-            trades (List[Trade]): List of trades made during the backtest.
+            trades (Sequence[Trade]): Trades made during the backtest (a list or a `TradeLog`).
             equity_log (np.ndarray): Array containing the equity log of the backtest.
         """
 
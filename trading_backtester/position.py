@@ -1,5 +1,5 @@
 from enum import Enum
-from typing import Optional
+from typing import Callable, Iterator, Optional, Sequence, overload
 
 import numpy as np
 
@@ -13,9 +13,28 @@ class PositionType(Enum):
     """Short position."""
 
 
+class PositionMode(Enum):
+    """Represents how the broker keeps positions opened by subsequent orders."""
+
+    HEDGING = 1
+    """Every filled open order creates a separate position."""
+    NETTING = 2
+    """Filled open orders are merged into a single position per position type, with the weighted average open price."""
+
+
 class Position:
     """Represents an open position in the market."""
 
+    __slots__ = (
+        "__position_type",
+        "__open_price",
+        "__open_datetime",
+        "__size",
+        "__stop_loss",
+        "__take_profit",
+        "__levels_update_listener",
+    )
+
     def __init__(
         self,
         position_type: PositionType,
@@ -45,6 +64,7 @@ class Position:
         self.__validate_take_profit(take_profit)
         self.__stop_loss = stop_loss
         self.__take_profit = take_profit
+        self.__levels_update_listener: Optional[Callable[["Position"], None]] = None
 
     @property
     def position_type(self) -> PositionType:
@@ -120,6 +140,9 @@ class Position:
         self.__validate_stop_loss(stop_loss)
         self.__stop_loss = stop_loss
 
+        if self.__levels_update_listener is not None:
+            self.__levels_update_listener(self)
+
     def update_take_profit(self, take_profit: Optional[float]) -> None:
         """Updates the take profit price.
 
@@ -130,6 +153,55 @@ class Position:
         self.__validate_take_profit(take_profit)
         self.__take_profit = take_profit
 
+        if self.__levels_update_listener is not None:
+            self.__levels_update_listener(self)
+
+    def _increase(self, price: float, size: int) -> None:
+        """Increases the position in place, the open price becomes the weighted average of both prices.
+
+        Internal to the package, only the position book should call it, as it keeps its aggregates up to date.
+
+        Args:
+            price (float): The price at which the size is added.
+            size (int): The size to add.
+        """
+
+        total_size = self.__size + size
+        self.__open_price = (
+            self.__open_price * self.__size + price * size
+        ) / total_size
+        self.__size = total_size
+
+    def _reduce(self, size: int) -> None:
+        """Reduces the size of the position in place.
+
+        Internal to the package, only the position book should call it, as it keeps its aggregates up to date.
+
+        Args:
+            size (int): The size to remove. Must be less than the size of the position.
+
+        Raises:
+            ValueError: If the size is not less than the size of the position.
+        """
+
+        if size >= self.__size:
+            raise ValueError("Size to reduce must be less than the size of position.")
+
+        self.__size -= size
+
+    def set_levels_update_listener(
+        self, listener: Optional[Callable[["Position"], None]]
+    ) -> None:
+        """Sets the function called after the stop loss or take profit price is updated.
+
+        Used by the position book to keep its stop loss and take profit indexes up to date.
+
+        Args:
+            listener (Optional[Callable[[Position], None]]): The function called with the updated position. None to remove the listener.
+        """
+
+        self.__levels_update_listener = listener
+
     def calc_value(self, current_price: float) -> float:
         """Calculates the current value of the position.
 
@@ -158,32 +230,238 @@ class Position:
             take_profit=kwargs.get("take_profit", self.__take_profit),
         )
 
-    def __validate_stop_loss(self, stop_loss: Optional[float]) -> None:
+    @staticmethod
+    def is_stop_loss_valid(
+        position_type: PositionType, open_price: float, stop_loss: Optional[float]
+    ) -> bool:
+        """Checks whether the stop loss price is valid for a position.
+
+        Args:
+            position_type (PositionType): The type of the position.
+            open_price (float): The open price of the position.
+            stop_loss (Optional[float]): The stop loss price. None is always valid.
+
+        Returns:
+            bool: True if the stop loss is not above (long) or below (short) the open price.
+        """
+
         if stop_loss is None:
+            return True
+
+        if position_type == PositionType.LONG:
+            return stop_loss <= open_price
+        return stop_loss >= open_price
+
+    @staticmethod
+    def is_take_profit_valid(
+        position_type: PositionType, open_price: float, take_profit: Optional[float]
+    ) -> bool:
+        """Checks whether the take profit price is valid for a position.
+
+        Args:
+            position_type (PositionType): The type of the position.
+            open_price (float): The open price of the position.
+            take_profit (Optional[float]): The take profit price. None is always valid.
+
+        Returns:
+            bool: True if the take profit is not below (long) or above (short) the open price.
+        """
+
+        if take_profit is None:
+            return True
+
+        if position_type == PositionType.LONG:
+            return take_profit >= open_price
+        return take_profit <= open_price
+
+    def __validate_stop_loss(self, stop_loss: Optional[float]) -> None:
+        if self.is_stop_loss_valid(self.__position_type, self.__open_price, stop_loss):
             return
 
         if self.__position_type == PositionType.LONG:
-            if stop_loss > self.__open_price:
-                raise ValueError(
-                    "Stop loss must be lower than open price for long position"
-                )
-        elif self.__position_type == PositionType.SHORT:
-            if stop_loss < self.__open_price:
-                raise ValueError(
-                    "Stop loss must be higher than open price for short position"
-                )
+            raise ValueError(
+                "Stop loss must be lower than open price for long position"
+            )
+        raise ValueError("Stop loss must be higher than open price for short position")
 
     def __validate_take_profit(self, take_profit: Optional[float]) -> None:
-        if take_profit is None:
+        if self.is_take_profit_valid(
+            self.__position_type, self.__open_price, take_profit
+        ):
             return
 
         if self.__position_type == PositionType.LONG:
-            if take_profit < self.__open_price:
-                raise ValueError(
-                    "Take profit must be higher than open price for long position"
-                )
-        elif self.__position_type == PositionType.SHORT:
-            if take_profit > self.__open_price:
-                raise ValueError(
-                    "Take profit must be lower than open price for short position"
-                )
+            raise ValueError(
+                "Take profit must be higher than open price for long position"
+            )
+        raise ValueError("Take profit must be lower than open price for short position")
+
+
+class PositionsAggregates:
+    """Represents aggregates of the open positions, per position type.
+
+    Kept up to date by the broker when positions are opened and closed,
+    so the aggregates are available without iterating over positions.
+    """
+
+    def __init__(self):
+        """Initializes a PositionsAggregates object with no positions."""
+
+        self.__sizes = {PositionType.LONG: 0, PositionType.SHORT: 0}
+        self.__open_values = {PositionType.LONG: 0.0, PositionType.SHORT: 0.0}
+
+    def get_size(self, position_type: PositionType) -> int:
+        """Returns the total size of the open positions of the given type.
+
+        Args:
+            position_type (PositionType): The type of positions.
+
+        Returns:
+            int: The total size of the positions.
+        """
+
+        return self.__sizes[position_type]
+
+    def get_open_value(self, position_type: PositionType) -> float:
+        """Returns the total value of the open positions of the given type at their open prices.
+
+        Args:
+            position_type (PositionType): The type of positions.
+
+        Returns:
+            float: The sum of open price multiplied by size of the positions.
+        """
+
+        return self.__open_values[position_type]
+
+    def calc_value(self, price: float) -> float:
+        """Calculates the total value of the open positions at the given price.
+
+        Equal to the sum of `Position.calc_value` of all positions, calculated in O(1).
+
+        Args:
+            price (float): The price at which to calculate the value.
+
+        Returns:
+            float: The total value of the positions.
+        """
+
+        return (
+            self.__sizes[PositionType.LONG] * price
+            + 2 * self.__open_values[PositionType.SHORT]
+            - self.__sizes[PositionType.SHORT] * price
+        )
+
+    def add(self, position_type: PositionType, open_price: float, size: int) -> None:
+        """Adds the opened size to the aggregates.
+
+        Args:
+            position_type (PositionType): The type of the position.
+            open_price (float): The price at which the position was opened.
+            size (int): The opened size.
+        """
+
+        self.__sizes[position_type] += size
+        self.__open_values[position_type] += open_price * size
+
+    def reduce(self, position_type: PositionType, open_price: float, size: int) -> None:
+        """Removes the closed size from the aggregates.
+
+        Args:
+            position_type (PositionType): The type of the position.
+            open_price (float): The price at which the position was opened.
+            size (int): The closed size.
+        """
+
+        self.__sizes[position_type] -= size
+        if self.__sizes[position_type] == 0:
+            # Avoid accumulating floating point errors once all positions of the type are closed
+            self.__open_values[position_type] = 0.0
+        else:
+            self.__open_values[position_type] -= open_price * size
+
+
+class PositionsView(Sequence[Position]):
+    """Read-only view of the open positions.
+
+    Doesn't copy the positions, it always reflects the current positions held by the broker.
+    Additionally provides aggregates of the positions, which don't require iterating over them.
+    Indexing is O(n) except for the first and the last position, iterate over the view
+    (or over `reversed(view)`) instead of indexing it in a loop.
+    """
+
+    def __init__(self, positions: Sequence[Position], aggregates: PositionsAggregates):
+        """Initializes a PositionsView object.
+
+        Args:
+            positions (Sequence[Position]): The positions held by the broker.
+            aggregates (PositionsAggregates): The aggregates of the positions kept up to date by the broker.
+        """
+
+        self.__positions = positions
+        self.__aggregates = aggregates
+
+    @overload
+    def __getitem__(self, index: int) -> Position: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> Sequence[Position]: ...
+
+    def __getitem__(self, index):
+        return self.__positions[index]
+
+    def __len__(self) -> int:
+        return len(self.__positions)
+
+    def __iter__(self) -> Iterator[Position]:
+        return iter(self.__positions)
+
+    def __reversed__(self) -> Iterator[Position]:
+        return reversed(self.__positions)
+
+    @property
+    def long_size(self) -> int:
+        """Returns the total size of the open long positions.
+
+        Returns:
+            int: The total size of the long positions.
+        """
+
+        return self.__aggregates.get_size(PositionType.LONG)
+
+    @property
+    def short_size(self) -> int:
+        """Returns the total size of the open short positions.
+
+        Returns:
+            int: The total size of the short positions.
+        """
+
+        return self.__aggregates.get_size(PositionType.SHORT)
+
+    @property
+    def average_long_open_price(self) -> Optional[float]:
+        """Returns the size-weighted average open price of the long positions.
+
+        Returns:
+            Optional[float]: The average open price. None if there are no long positions.
+        """
+
+        return self.__calc_average_open_price(PositionType.LONG)
+
+    @property
+    def average_short_open_price(self) -> Optional[float]:
+        """Returns the size-weighted average open price of the short positions.
+
+        Returns:
+            Optional[float]: The average open price. None if there are no short positions.
+        """
+
+        return self.__calc_average_open_price(PositionType.SHORT)
+
+    def __calc_average_open_price(self, position_type: PositionType) -> Optional[float]:
+        size = self.__aggregates.get_size(position_type)
+        if size == 0:
+            return None
+
+        return self.__aggregates.get_open_value(position_type) / size
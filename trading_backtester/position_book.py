@@ -0,0 +1,408 @@
+import heapq
+from collections import OrderedDict
+from itertools import islice
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+    overload,
+)
+
+import numpy as np
+
+from .position import Position, PositionsAggregates, PositionType
+
+
+class PositionBook(Sequence[Position]):
+    """Represents the book of open positions.
+
+    Positions are kept in the order they were opened, both all together and separately for each position type,
+    so the first (oldest) position of a type is found or removed in O(1).
+    Aggregates of the positions are kept up to date with every change of the book.
+    Positions are reduced in place on partial closes, so a position keeps its identity and handle until it is fully closed.
+    Iterating over the positions (also in reverse) is O(n), but indexing is O(n) except for the first
+    and the last position, so positions should be iterated over rather than indexed in a loop.
+
+    Stop loss and take profit prices are indexed in heaps (one per position type), ordered so the position
+    closest to being triggered is on top, so triggered positions are found in O((k + s) log n),
+    where k is the number of triggered positions and s the number of outdated heap entries.
+    Outdated entries (closed positions, updated prices) are removed lazily.
+    """
+
+    # Heap keys are prices multiplied by the sign, so that a position is triggered
+    # if its key is less than or equal to the threshold multiplied by the sign.
+    __STOP_LOSS_SIGNS = {PositionType.LONG: -1.0, PositionType.SHORT: 1.0}
+    __TAKE_PROFIT_SIGNS = {PositionType.LONG: 1.0, PositionType.SHORT: -1.0}
+
+    def __init__(self):
+        """Initializes an empty PositionBook object."""
+
+        self.__next_handle = 0
+        self.__positions: "OrderedDict[int, Position]" = OrderedDict()
+        self.__positions_by_type: Dict[PositionType, "OrderedDict[int, Position]"] = {
+            PositionType.LONG: OrderedDict(),
+            PositionType.SHORT: OrderedDict(),
+        }
+        self.__handles: Dict[Position, int] = {}
+        self.__aggregates = PositionsAggregates()
+        self.__stop_losses: Dict[PositionType, List[Tuple[float, int, float]]] = {
+            PositionType.LONG: [],
+            PositionType.SHORT: [],
+        }
+        self.__take_profits: Dict[PositionType, List[Tuple[float, int, float]]] = {
+            PositionType.LONG: [],
+            PositionType.SHORT: [],
+        }
+
+    @overload
+    def __getitem__(self, index: int) -> Position: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> List[Position]: ...
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[Position, List[Position]]:
+        """Returns the position at the given index (in opening order).
+
+        The first and the last positions are returned in O(1), others in O(n) (slices always in O(n)),
+        so random indexing in a loop is quadratic, iterate over the book (or `reversed(book)`) instead.
+
+        Args:
+            index (Union[int, slice]): The index of the position.
+
+        Returns:
+            Union[Position, List[Position]]: The position at the index, or a list of positions for a slice.
+        """
+
+        if isinstance(index, slice):
+            return list(self.__positions.values())[index]
+
+        length = len(self.__positions)
+        if index < 0:
+            index += length
+        if index < 0 or index >= length:
+            raise IndexError("Position index out of range.")
+
+        if index == 0:
+            return next(iter(self.__positions.values()))
+        if index == length - 1:
+            return next(reversed(self.__positions.values()))
+
+        return next(islice(self.__positions.values(), index, None))
+
+    def __len__(self) -> int:
+        return len(self.__positions)
+
+    def __iter__(self) -> Iterator[Position]:
+        return iter(self.__positions.values())
+
+    def __reversed__(self) -> Iterator[Position]:
+        return reversed(self.__positions.values())
+
+    def __contains__(self, position: object) -> bool:
+        return position in self.__handles
+
+    @property
+    def aggregates(self) -> PositionsAggregates:
+        """Returns the aggregates of the positions in the book.
+
+        Returns:
+            PositionsAggregates: The aggregates of the positions.
+        """
+
+        return self.__aggregates
+
+    def add(self, position: Position) -> None:
+        """Adds the newly opened position to the end of the book.
+
+        Args:
+            position (Position): The position to add.
+        """
+
+        handle = self.__next_handle
+        self.__next_handle += 1
+
+        self.__handles[position] = handle
+        self.__positions[handle] = position
+        self.__positions_by_type[position.position_type][handle] = position
+        self.__aggregates.add(
+            position.position_type, position.open_price, position.size
+        )
+        position.set_levels_update_listener(self.__on_levels_update)
+        self.__index_levels(handle, position)
+
+    def remove(self, position: Position) -> None:
+        """Removes the position from the book.
+
+        Args:
+            position (Position): The position to remove.
+
+        Raises:
+            ValueError: If the position is not in the book.
+        """
+
+        handle = self.__pop_handle(position)
+        del self.__positions[handle]
+        del self.__positions_by_type[position.position_type][handle]
+        self.__aggregates.reduce(
+            position.position_type, position.open_price, position.size
+        )
+        position.set_levels_update_listener(None)
+
+    def increase(self, position: Position, price: float, size: int) -> None:
+        """Increases the position in place, keeping its place in the book.
+
+        Args:
+            position (Position): The position to increase.
+            price (float): The price at which the size is added.
+            size (int): The size to add.
+
+        Raises:
+            ValueError: If the position is not in the book.
+        """
+
+        if position not in self.__handles:
+            raise ValueError("Position is not in the book.")
+
+        position._increase(price, size)
+        self.__aggregates.add(position.position_type, price, size)
+
+    def reduce(self, position: Position, size: int) -> None:
+        """Reduces the size of the position in place, keeping its place in the book.
+
+        Args:
+            position (Position): The position to reduce.
+            size (int): The size to remove. Must be less than the size of the position.
+
+        Raises:
+            ValueError: If the position is not in the book.
+        """
+
+        if position not in self.__handles:
+            raise ValueError("Position is not in the book.")
+
+        position._reduce(size)
+        self.__aggregates.reduce(position.position_type, position.open_price, size)
+
+    def get_first(self, position_type: PositionType) -> Optional[Position]:
+        """Returns the first (oldest) position of the given type.
+
+        Args:
+            position_type (PositionType): The type of the position.
+
+        Returns:
+            Optional[Position]: The oldest position of the type. None if there are no positions of the type.
+        """
+
+        positions = self.__positions_by_type[position_type]
+        if not positions:
+            return None
+
+        return next(iter(positions.values()))
+
+    def to_list(self) -> List[Position]:
+        """Returns the positions as a list, in opening order.
+
+        Returns:
+            List[Position]: The open positions.
+        """
+
+        return list(self.__positions.values())
+
+    def to_arrays(self) -> Dict[str, np.ndarray[Any, np.dtype[Any]]]:
+        """Returns the positions as NumPy arrays (one array per field), in opening order.
+
+        Position types are stored as values of the `PositionType` enum, missing stop loss
+        and take profit prices as NaN. Useful for vectorized calculations over all positions.
+
+        Returns:
+            Dict[str, np.ndarray]: The arrays with keys "position_type", "open_price", "open_datetime",
+                "size", "stop_loss" and "take_profit".
+        """
+
+        positions = self.__positions.values()
+        count = len(positions)
+
+        return {
+            "position_type": np.fromiter(
+                (position.position_type.value for position in positions),
+                dtype=np.int8,
+                count=count,
+            ),
+            "open_price": np.fromiter(
+                (position.open_price for position in positions),
+                dtype=float,
+                count=count,
+            ),
+            "open_datetime": np.array(
+                [position.open_datetime for position in positions],
+                dtype="datetime64[ns]",
+            ),
+            "size": np.fromiter(
+                (position.size for position in positions),
+                dtype=np.int64,
+                count=count,
+            ),
+            "stop_loss": np.fromiter(
+                (
+                    np.nan if position.stop_loss is None else position.stop_loss
+                    for position in positions
+                ),
+                dtype=float,
+                count=count,
+            ),
+            "take_profit": np.fromiter(
+                (
+                    np.nan if position.take_profit is None else position.take_profit
+                    for position in positions
+                ),
+                dtype=float,
+                count=count,
+            ),
+        }
+
+    def pop_triggered_stop_losses(
+        self, long_threshold: float, short_threshold: float
+    ) -> List[Position]:
+        """Returns positions whose stop loss is triggered, in the order they were opened.
+
+        A long position is triggered if its stop loss is greater than or equal to the long threshold,
+        a short position if its stop loss is less than or equal to the short threshold.
+        Returned positions are expected to be closed, they are removed from the stop loss index.
+
+        Args:
+            long_threshold (float): The price (with spread) at which long positions are closed.
+            short_threshold (float): The price (with spread) at which short positions are closed.
+
+        Returns:
+            List[Position]: The triggered positions.
+        """
+
+        return self.__pop_triggered(
+            self.__stop_losses,
+            self.__STOP_LOSS_SIGNS,
+            self.__get_stop_loss,
+            long_threshold,
+            short_threshold,
+        )
+
+    def pop_triggered_take_profits(
+        self, long_threshold: float, short_threshold: float
+    ) -> List[Position]:
+        """Returns positions whose take profit is triggered, in the order they were opened.
+
+        A long position is triggered if its take profit is less than or equal to the long threshold,
+        a short position if its take profit is greater than or equal to the short threshold.
+        Returned positions are expected to be closed, they are removed from the take profit index.
+
+        Args:
+            long_threshold (float): The price (with spread) at which long positions are closed.
+            short_threshold (float): The price (with spread) at which short positions are closed.
+
+        Returns:
+            List[Position]: The triggered positions.
+        """
+
+        return self.__pop_triggered(
+            self.__take_profits,
+            self.__TAKE_PROFIT_SIGNS,
+            self.__get_take_profit,
+            long_threshold,
+            short_threshold,
+        )
+
+    def __pop_triggered(
+        self,
+        heaps: Dict[PositionType, List[Tuple[float, int, float]]],
+        signs: Dict[PositionType, float],
+        get_level: Callable[[Position], Optional[float]],
+        long_threshold: float,
+        short_threshold: float,
+    ) -> List[Position]:
+        triggered: Dict[int, Position] = {}
+
+        for position_type, threshold in (
+            (PositionType.LONG, long_threshold),
+            (PositionType.SHORT, short_threshold),
+        ):
+            heap = heaps[position_type]
+            bound = signs[position_type] * threshold
+            while heap and heap[0][0] <= bound:
+                _, handle, level = heapq.heappop(heap)
+                if self.__is_entry_valid(handle, level, get_level):
+                    triggered[handle] = self.__positions[handle]
+
+        return [triggered[handle] for handle in sorted(triggered)]
+
+    def __on_levels_update(self, position: Position) -> None:
+        handle = self.__handles.get(position)
+        if handle is not None:
+            self.__index_levels(handle, position)
+
+    def __index_levels(self, handle: int, position: Position) -> None:
+        position_type = position.position_type
+
+        if position.stop_loss is not None:
+            self.__push(
+                self.__stop_losses[position_type],
+                self.__STOP_LOSS_SIGNS[position_type],
+                handle,
+                position.stop_loss,
+                self.__get_stop_loss,
+            )
+        if position.take_profit is not None:
+            self.__push(
+                self.__take_profits[position_type],
+                self.__TAKE_PROFIT_SIGNS[position_type],
+                handle,
+                position.take_profit,
+                self.__get_take_profit,
+            )
+
+    def __push(
+        self,
+        heap: List[Tuple[float, int, float]],
+        sign: float,
+        handle: int,
+        level: float,
+        get_level: Callable[[Position], Optional[float]],
+    ) -> None:
+        heapq.heappush(heap, (sign * level, handle, level))
+
+        # Drop outdated entries once they outnumber the open positions, so the heap doesn't grow unbounded
+        if len(heap) > 2 * len(self.__positions) + 32:
+            heap[:] = [
+                entry
+                for entry in heap
+                if self.__is_entry_valid(entry[1], entry[2], get_level)
+            ]
+            heapq.heapify(heap)
+
+    def __is_entry_valid(
+        self,
+        handle: int,
+        level: float,
+        get_level: Callable[[Position], Optional[float]],
+    ) -> bool:
+        position = self.__positions.get(handle)
+        return position is not None and get_level(position) == level
+
+    @staticmethod
+    def __get_stop_loss(position: Position) -> Optional[float]:
+        return position.stop_loss
+
+    @staticmethod
+    def __get_take_profit(position: Position) -> Optional[float]:
+        return position.take_profit
+
+    def __pop_handle(self, position: Position) -> int:
+        handle = self.__handles.pop(position, None)
+        if handle is None:
+            raise ValueError("Position is not in the book.")
+
+        return handle
@@ -1,12 +1,24 @@
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional, Tuple
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+    Union,
+)
 
 import numpy as np
 
 from .account import Account
+from .bootstrap import BOOTSTRAP_METRICS, resample_metrics
 from .data import Data
 from .position import PositionType
 from .trade import Trade, TradeType
+from .trade_log import TradeLog
 
 
 class Statistics:
@@ -15,8 +27,39 @@ class Statistics:
     This class calculates various statistics related to the backtest,
     including the number of trades, final money, final asset value, final total equity,
     and key indicators such as maximum drawdown, beta, alpha, and the strategy's return.
+
+    Risk-adjusted metrics (volatility, CAGR, Sharpe, Sortino, Calmar, Omega and tail ratios) are calculated
+    from per-period returns of the equity log. They are annualized with the number of periods per year,
+    inferred from the data's datetimes as the number of candlesticks per elapsed year (252 if it can't be inferred),
+    so gaps such as weekends or closed sessions are accounted for.
+
+    Metrics are calculated lazily, only when requested, and cached until the backtest advances
+    (see `invalidate`) or new trades are made.
+
+    Benchmarks are aligned with the equity log by datetime of the data, either forward-filling the last
+    benchmark price ("ffill") or using only datetimes present in both the data and the benchmark ("intersection").
+    If datetimes are not available, the benchmark is aligned by position and must have the same length as the data.
+    Several benchmarks can be compared at once; `get_stats` reports the first of them.
+
+    Rolling metrics (return, drawdown, Sharpe ratio, beta) over a sliding window of the equity log
+    are calculated with `rolling` in O(n), using cumulative sums and a block-wise running maximum.
+
+    Robustness of the results is estimated with `bootstrap`, resampling returns of the equity log
+    or of closed trades and calculating confidence intervals of return, maximum drawdown and Sharpe ratio.
+
+    Given the exposure log recorded during the backtest, time in the market and average gross and net exposures
+    are calculated as well. Turnover (value of all trades relative to the average equity) is calculated from trades.
+
+    Running metrics (peak equity, drawdowns, trades counters, win rate) can be updated incrementally
+    with `update_equity` and `record_trade` while the backtest runs, and are read with `get_running_stats`.
+    Once the whole equity log and all trades have been streamed, `get_stats` uses the running metrics
+    instead of recalculating them from the equity log and trades.
     """
 
+    __DEFAULT_PERIODS_PER_YEAR = 252.0
+    __YEAR_NANOSECONDS = 365.25 * 24 * 60 * 60 * 1e9
+    __ROLLING_EPSILON = 1e-12
+
     @dataclass
     class __TradesCounters:
         total_open_trades: int = 0
@@ -28,29 +71,127 @@ class Statistics:
 
     def __init__(
         self,
-        trades: List[Trade],
+        trades: Union[List[Trade], TradeLog],
         equity_log: np.ndarray[Any, np.dtype[Any]],
         account: Account,
-        benchmark: Optional[Data] = None,
+        benchmark: Optional[Union[Data, Mapping[str, Data]]] = None,
+        data: Optional[Data] = None,
+        periods_per_year: Optional[float] = None,
+        benchmark_alignment: str = "ffill",
+        exposure_log: Optional[np.ndarray[Any, np.dtype[Any]]] = None,
     ):
         """Initializes the Statistics object.
 
         Should be used after the backtest is completed.
 
         Args:
-            trades (List[Trade]): List of trades made during the backtest.
+            trades (Union[List[Trade], TradeLog]): Trades made during the backtest.
             equity_log (np.ndarray): Array containing the equity log of the backtest.
             account (Account): The account used for the backtest.
-            benchmark (Optional[Data]): Optional benchmark data for calculating beta and alpha.
+            benchmark (Optional[Union[Data, Mapping[str, Data]]]): Optional benchmark data for calculating beta and alpha,
+                or several benchmarks by name.
+            data (Optional[Data]): Optional data the backtest was run on, used to infer the number of periods per year.
+            periods_per_year (Optional[float]): Optional number of periods (candlesticks) per year
+                used to annualize metrics. If not provided, it is inferred from the data.
+            benchmark_alignment (str): How benchmarks are aligned by datetime, "ffill" or "intersection".
+                Default is "ffill".
+            exposure_log (Optional[np.ndarray]): Optional exposure log of the backtest (see `EXPOSURE_LOG_TYPE`),
+                aligned with the equity log, for calculating exposure metrics.
+
+        Raises:
+            ValueError: If the benchmark alignment is unknown or a benchmark can't be aligned with the data.
         """
 
+        if benchmark_alignment not in ("ffill", "intersection"):
+            raise ValueError(f"Unknown benchmark alignment: {benchmark_alignment}.")
+
         self.__account = account
         self.__trades = trades
         self.__equity_log = equity_log
-        self.__benchmark = benchmark
+        self.__data = data
+        self.__periods_per_year = periods_per_year
+        self.__benchmark_alignment = benchmark_alignment
+        self.__exposure_log = exposure_log
+
+        if benchmark is None:
+            benchmarks: Dict[str, Data] = {}
+        elif isinstance(benchmark, Data):
+            benchmarks = {"benchmark": benchmark}
+        else:
+            benchmarks = dict(benchmark)
+        self.__benchmarks_prices = {
+            name: self.__calc_benchmark_prices(benchmark_data)
+            for name, benchmark_data in benchmarks.items()
+        }
 
         self.__total_commission = 0.0
 
+        self.__streamed_equity_count = 0
+        self.__equity = 0.0
+        self.__peak_equity = 0.0
+        self.__current_drawdown = 0.0
+        self.__max_drawdown = 0.0
+        self.__max_drawdown_peak = 0.0
+        self.__current_drawdown_duration = 0
+        self.__max_drawdown_duration = 0
+        self.__recorded_trades_count = 0
+        self.__recorded_trades_counters = self.__TradesCounters()
+        self.__profitable_trades_num = 0
+        self.__best_trade_return_percentage = 0.0
+        self.__worst_trade_return_percentage = 0.0
+
+        self.__version = 0
+        self.__cache: Dict[str, Any] = {}
+        self.__cache_token: Tuple[int, int] = (-1, -1)
+        counters = self.__get_trades_counters
+        self.__metrics: Dict[str, Callable[[], Any]] = {
+            "total_trades": lambda: len(self.__get_trades()),
+            "total_open_trades": lambda: counters().total_open_trades,
+            "total_close_trades": lambda: counters().total_close_trades,
+            "total_open_long_trades": lambda: counters().total_open_long_trades,
+            "total_close_long_trades": lambda: counters().total_close_long_trades,
+            "total_open_short_trades": lambda: counters().total_open_short_trades,
+            "total_close_short_trades": lambda: counters().total_close_short_trades,
+            "final_money": lambda: self.__account.current_money,
+            "final_assets_value": self.__calc_final_assets_value,
+            "final_total_equity": lambda: self.__equity_log[-1],
+            "peak_equity": self.__calc_peak_equity,
+            "return": self.__calc_return,
+            "return_percentage": self.__calc_return_percentage,
+            "max_drawdown": lambda: self.__get_max_drawdown()[0],
+            "max_drawdown_percentage": lambda: self.__get_max_drawdown()[1],
+            "max_drawdown_duration": self.__get_max_drawdown_duration,
+            "volatility_percentage": self.__calc_volatility_percentage,
+            "cagr_percentage": self.__calc_cagr_percentage,
+            "sharpe_ratio": self.__calc_sharpe_ratio,
+            "sortino_ratio": self.__calc_sortino_ratio,
+            "calmar_ratio": self.__calc_calmar_ratio,
+            "omega_ratio": self.__calc_omega_ratio,
+            "tail_ratio": self.__calc_tail_ratio,
+            "profitable_trades_num": self.__calc_profitable_trades_number,
+            "profitable_trades_percentage": self.__calc_profitable_trades_percentage,
+            "best_trade_return_percentage": self.__calc_best_trade_return_percentage,
+            "worst_trade_return_percentage": self.__calc_worst_trade_return_percentage,
+            "average_mae_percentage": lambda: self.__calc_excursion_stat(0, np.mean),
+            "max_mae_percentage": lambda: self.__calc_excursion_stat(0, np.max),
+            "average_mfe_percentage": lambda: self.__calc_excursion_stat(1, np.mean),
+            "max_mfe_percentage": lambda: self.__calc_excursion_stat(1, np.max),
+            "beta": lambda: self.__get_primary_benchmark_stats()["beta"],
+            "alpha": lambda: self.__get_primary_benchmark_stats()["alpha"],
+            "buy_and_hold_return_percentage": lambda: (
+                self.__get_primary_benchmark_stats()["buy_and_hold_return_percentage"]
+            ),
+            "exposure_time_percentage": self.__calc_exposure_time_percentage,
+            "average_gross_exposure_percentage": lambda: self.__calc_average_exposure_percentage(
+                "gross_exposure"
+            ),
+            "average_net_exposure_percentage": lambda: self.__calc_average_exposure_percentage(
+                "net_exposure"
+            ),
+            "turnover": self.__calc_turnover,
+            "total_commission": lambda: self.__total_commission,
+        }
+
     def add_commission(self, commission: float) -> None:
         """Adds the paid commission to the total commission.
 
@@ -59,55 +200,337 @@ class Statistics:
         """
 
         self.__total_commission += commission
+        self.invalidate()
+
+    def update_equity(self, equity: float, count: int = 1) -> None:
+        """Updates the running metrics with the next values of the equity log.
+
+        Should be called with every value written to the equity log, in order. Runs in O(1).
+
+        Args:
+            equity (float): The total equity.
+            count (int): The number of consecutive equity log entries with this value. Default is 1.
+        """
+
+        if count <= 0:
+            return
+
+        if self.__streamed_equity_count == 0 or equity > self.__peak_equity:
+            self.__peak_equity = equity
+
+        self.__equity = equity
+        self.__current_drawdown = self.__peak_equity - equity
+        if self.__streamed_equity_count == 0 or (
+            self.__current_drawdown > self.__max_drawdown
+        ):
+            self.__max_drawdown = self.__current_drawdown
+            self.__max_drawdown_peak = self.__peak_equity
+
+        if equity < self.__peak_equity:
+            self.__current_drawdown_duration += count
+            self.__max_drawdown_duration = max(
+                self.__max_drawdown_duration, self.__current_drawdown_duration
+            )
+        else:
+            self.__current_drawdown_duration = 0
+
+        self.__streamed_equity_count += count
+        self.invalidate()
+
+    def record_trade(self, trade: Trade) -> None:
+        """Updates the running trades' metrics with the trade appended to the trades log.
+
+        Should be called with every trade appended to the trades log, in order. Runs in O(1).
+
+        Args:
+            trade (Trade): The trade made.
+        """
+
+        counters = self.__recorded_trades_counters
+        is_long = trade.position_type == PositionType.LONG
+
+        if trade.trade_type == TradeType.OPEN:
+            counters.total_open_trades += 1
+            if is_long:
+                counters.total_open_long_trades += 1
+            else:
+                counters.total_open_short_trades += 1
+        else:
+            assert trade.close_price is not None
+            counters.total_close_trades += 1
+            if is_long:
+                counters.total_close_long_trades += 1
+            else:
+                counters.total_close_short_trades += 1
+
+            trade_return_percentage = (
+                (trade.close_price - trade.open_price) / trade.open_price * 100
+            )
+            if not is_long:
+                trade_return_percentage = -trade_return_percentage
+
+            if trade_return_percentage > 0:
+                self.__profitable_trades_num += 1
+            self.__best_trade_return_percentage = max(
+                self.__best_trade_return_percentage, trade_return_percentage
+            )
+            self.__worst_trade_return_percentage = min(
+                self.__worst_trade_return_percentage, trade_return_percentage
+            )
+
+        self.__recorded_trades_count += 1
+
+    def get_running_stats(self) -> Dict[str, Any]:
+        """Returns the running metrics updated with `update_equity` and `record_trade`.
+
+        Available while the backtest runs, without recalculating anything from the equity log or trades.
+
+        Returns:
+            Dict[str, Any]: A dictionary containing the running metrics.
+        """
+
+        counters = self.__recorded_trades_counters
+
+        return {
+            "equity": self.__equity,
+            "peak_equity": self.__peak_equity,
+            "current_drawdown": self.__current_drawdown,
+            "max_drawdown": self.__max_drawdown,
+            "max_drawdown_percentage": (
+                self.__max_drawdown / self.__max_drawdown_peak * 100
+                if self.__max_drawdown_peak > 0
+                else 0.0
+            ),
+            "current_drawdown_duration": self.__current_drawdown_duration,
+            "max_drawdown_duration": self.__max_drawdown_duration,
+            "total_trades": self.__recorded_trades_count,
+            "total_open_trades": counters.total_open_trades,
+            "total_close_trades": counters.total_close_trades,
+            "profitable_trades_num": self.__profitable_trades_num,
+            "profitable_trades_percentage": (
+                self.__profitable_trades_num / counters.total_close_trades * 100
+                if counters.total_close_trades > 0
+                else 0.0
+            ),
+        }
+
+    def invalidate(self) -> None:
+        """Invalidates the cached metrics.
+
+        Should be called whenever the equity log or the account change,
+        new trades are detected automatically.
+        """
+
+        self.__version += 1
 
-    def get_stats(self) -> Dict[str, Any]:
+    def get_metrics_names(self) -> List[str]:
+        """Returns the names of all available metrics, in the order they are returned by `get_stats`.
+
+        Returns:
+            List[str]: The names of the metrics.
+        """
+
+        return list(self.__metrics)
+
+    def get_stats(self, metrics: Optional[Iterable[str]] = None) -> Dict[str, Any]:
         """Calculates and returns various statistics related to the backtest.
 
+        Args:
+            metrics (Optional[Iterable[str]]): The names of metrics to calculate (see `get_metrics_names`).
+                Optional, if not provided, all metrics are calculated.
+
         Returns:
             Dict[str, Any]: A dictionary containing various statistics related to the backtest.
+
+        Raises:
+            ValueError: If an unknown metric is requested.
+        """
+
+        names = list(self.__metrics) if metrics is None else list(metrics)
+        unknown_names = [name for name in names if name not in self.__metrics]
+        if unknown_names:
+            raise ValueError(f"Unknown metrics: {', '.join(unknown_names)}.")
+
+        return {name: self.__get_cached(name, self.__metrics[name]) for name in names}
+
+    def get_trades_excursions(self) -> Tuple[
+        np.ndarray[Any, np.dtype[Any]],
+        np.ndarray[Any, np.dtype[Any]],
+    ]:
+        """Returns the maximum adverse and favorable excursions (MAE, MFE) of trades (see `TradeLog.calc_excursions`).
+
+        Returns:
+            Tuple[np.ndarray[Any, np.dtype[Any]], np.ndarray[Any, np.dtype[Any]]]: The MAE and MFE percentages
+                for every trade, NaN for open trades.
+
+        Raises:
+            ValueError: If the data is not provided or has no datetimes.
         """
 
-        peaks = np.maximum.accumulate(self.__equity_log)
-        max_drowdown, max_drawdown_percentage = self.__calc_max_drawndown(peaks)
-        max_drawdown_duration = self.__calc_max_drawdown_duration(peaks)
-        beta = self.__calc_beta()
-        trades_counters = self.__get_trades_counters()
-        return_value = self.__equity_log[-1] - self.__equity_log[0]
-        return_value_percentage = return_value / self.__equity_log[0] * 100
-        profitable_trades_num = self.__calc_profitable_trades_number()
-        profitable_trades_percentage = (
-            profitable_trades_num / trades_counters.total_close_trades * 100
-            if trades_counters.total_close_trades > 0
-            else 0.0
+        if self.__data is None:
+            raise ValueError("Data is required to calculate excursions.")
+
+        return self.__get_cached(
+            "_excursions", lambda: self.__get_trades().calc_excursions(self.__data)
         )
-        peak_equity = self.__equity_log.max()
+
+    def get_benchmarks_names(self) -> List[str]:
+        """Returns the names of benchmarks. A single benchmark is named "benchmark".
+
+        Returns:
+            List[str]: The names of benchmarks.
+        """
+
+        return list(self.__benchmarks_prices)
+
+    def get_benchmarks_stats(self) -> Dict[str, Dict[str, Optional[float]]]:
+        """Calculates beta, alpha and buy and hold return percentage against every benchmark.
+
+        Returns:
+            Dict[str, Dict[str, Optional[float]]]: The statistics of each benchmark by its name,
+                with keys "beta", "alpha" and "buy_and_hold_return_percentage".
+        """
 
         return {
-            "total_trades": len(self.__trades),
-            "total_open_trades": trades_counters.total_open_trades,
-            "total_close_trades": trades_counters.total_close_trades,
-            "total_open_long_trades": trades_counters.total_open_long_trades,
-            "total_close_long_trades": trades_counters.total_close_long_trades,
-            "total_open_short_trades": trades_counters.total_open_short_trades,
-            "total_close_short_trades": trades_counters.total_close_short_trades,
-            "final_money": self.__account.current_money,
-            "final_assets_value": self.__equity_log[-1] - self.__account.current_money,
-            "final_total_equity": self.__equity_log[-1],
-            "peak_equity": peak_equity,
-            "return": return_value,
-            "return_percentage": return_value_percentage,
-            "max_drawdown": max_drowdown,
-            "max_drawdown_percentage": max_drawdown_percentage,
-            "max_drawdown_duration": max_drawdown_duration,
-            "profitable_trades_num": profitable_trades_num,
-            "profitable_trades_percentage": profitable_trades_percentage,
-            "best_trade_return_percentage": self.__get_best_trade_return_percentage(),
-            "worst_trade_return_percentage": self.__get_worst_trade_return_percentage(),
-            "beta": beta,
-            "alpha": self.__calc_alpha(beta),
-            "buy_and_hold_return_percentage": self.__get_buy_and_hold_return_percentage(),
-            "total_commission": self.__total_commission,
+            name: self.__get_benchmark_stats(name) for name in self.__benchmarks_prices
+        }
+
+    def rolling(
+        self, metric: str, window: int, benchmark: Optional[str] = None
+    ) -> np.ndarray[Any, np.dtype[Any]]:
+        """Calculates the metric over a sliding window of the equity log.
+
+        The value at index i is calculated from the equity log entries i - window to i (window periods),
+        so the result is aligned with the equity log and its first window values are NaN.
+        For beta, the window counts only periods where the benchmark is available,
+        values are placed at the ends of such periods, other values are NaN.
+        Runs in O(n) regardless of the window size.
+
+        Available metrics:
+            "return_percentage": Return over the window.
+            "drawdown_percentage": Drawdown from the highest equity within the window.
+            "sharpe_ratio": Annualized Sharpe ratio of returns within the window (NaN if returns are constant).
+            "beta": Beta of returns within the window against the benchmark (NaN if the benchmark is constant).
+
+        Args:
+            metric (str): The name of the metric.
+            window (int): The number of periods in the window. Must be at least 2 for "sharpe_ratio" and "beta".
+            benchmark (Optional[str]): The name of the benchmark for beta. Optional, the first benchmark by default.
+
+        Returns:
+            np.ndarray[Any, np.dtype[Any]]: The values of the metric, one for each entry of the equity log.
+
+        Raises:
+            ValueError: If the metric is unknown, the window is too small
+                or the benchmark is required but not provided.
+        """
+
+        rolling_metrics: Dict[str, Callable[[int], np.ndarray[Any, np.dtype[Any]]]] = {
+            "return_percentage": self.__calc_rolling_return_percentage,
+            "drawdown_percentage": self.__calc_rolling_drawdown_percentage,
+            "sharpe_ratio": self.__calc_rolling_sharpe_ratio,
         }
+        if metric not in rolling_metrics and metric != "beta":
+            raise ValueError(f"Unknown rolling metric: {metric}.")
+
+        min_window = 2 if metric in ("sharpe_ratio", "beta") else 1
+        if window < min_window:
+            raise ValueError(
+                f"Window of rolling {metric} must be at least {min_window}."
+            )
+
+        result = np.full(len(self.__equity_log), np.nan)
+        if metric == "beta":
+            name = self.__get_benchmark_name(benchmark)
+            indices, returns, benchmark_returns = self.__get_benchmark_returns(name)
+            if window <= len(returns):
+                result[indices[window:]] = self.__calc_rolling_beta(
+                    returns, benchmark_returns, window
+                )
+        elif window < len(self.__equity_log):
+            result[window:] = rolling_metrics[metric](window)
+
+        return result
+
+    def bootstrap(
+        self,
+        n: int = 10000,
+        method: str = "returns",
+        confidence: float = 0.95,
+        block_size: Optional[int] = None,
+        seed: Optional[int] = None,
+        processes: Optional[int] = None,
+    ) -> Dict[str, Tuple[float, float]]:
+        """Estimates confidence intervals of the results by bootstrap (Monte Carlo resampling).
+
+        Available methods:
+            "returns": Resamples per-period returns of the equity log one by one.
+            "block": Resamples blocks of consecutive per-period returns, preserving their autocorrelation.
+            "trades": Resamples profits/losses of closed trades, added to the initial equity.
+
+        Args:
+            n (int): The number of resampled paths. Default is 10000.
+            method (str): The resampling method. Default is "returns".
+            confidence (float): The confidence level of intervals. Default is 0.95.
+            block_size (Optional[int]): The length of blocks for the "block" method.
+                Optional, if not provided, the square root of the number of returns is used.
+            seed (Optional[int]): The seed of random generators. Optional, if not provided, results are not reproducible.
+            processes (Optional[int]): The number of processes to split the resampling across.
+                Optional, if not provided, runs in the current process.
+
+        Returns:
+            Dict[str, Tuple[float, float]]: The lower and upper bounds of the confidence interval of
+                "return_percentage", "max_drawdown_percentage" and "sharpe_ratio".
+
+        Raises:
+            ValueError: If the method is unknown, the arguments are out of range or there is nothing to resample.
+        """
+
+        if method not in ("returns", "block", "trades"):
+            raise ValueError(f"Unknown bootstrap method: {method}.")
+        if n < 1:
+            raise ValueError("Number of resampled paths must be positive.")
+        if not 0 < confidence < 1:
+            raise ValueError("Confidence must be between 0 and 1.")
+
+        periods_per_year = self.__get_periods_per_year()
+        initial_equity: Optional[float] = None
+        if method == "trades":
+            samples = self.__calc_close_trades_profit_loss(self.__get_trades())
+            initial_equity = float(self.__equity_log[0])
+            years = self.__calc_elapsed_years()
+            periods_per_year = len(samples) / years if years > 0 else 0.0
+        else:
+            samples = self.__get_returns()
+
+        if len(samples) == 0:
+            raise ValueError(f"Nothing to resample with the {method} method.")
+
+        if method == "block" and block_size is None:
+            block_size = max(1, round(np.sqrt(len(samples))))
+
+        metrics = resample_metrics(
+            samples,
+            n,
+            periods_per_year,
+            block_size=block_size if method == "block" else None,
+            seed=seed,
+            processes=processes,
+            initial_equity=initial_equity,
+        )
+
+        tail = (1 - confidence) / 2 * 100
+        intervals: Dict[str, Tuple[float, float]] = {}
+        for name, values in zip(BOOTSTRAP_METRICS, metrics.T):
+            values = values[~np.isnan(values)]
+            if len(values) == 0:
+                intervals[name] = (np.nan, np.nan)
+                continue
+
+            lower, upper = np.percentile(values, [tail, 100 - tail])
+            intervals[name] = (float(lower), float(upper))
+
+        return intervals
 
     def __str__(self) -> str:
         """Returns a string representation of the statistics in a human-readable format.
@@ -131,16 +554,180 @@ class Statistics:
                 f"Return: {stats['return']:.2f} ({(stats['return_percentage']):.2f}%)",
                 f"Max drawdown: {stats['max_drawdown']:.2f} ({stats['max_drawdown_percentage']:.2f}%)",
                 f"Max drawdown duration: {stats['max_drawdown_duration']}",
+                f"Volatility (annualized): {self.__format_optional(stats['volatility_percentage'])}%",
+                f"CAGR: {self.__format_optional(stats['cagr_percentage'])}%",
+                f"Sharpe ratio: {self.__format_optional(stats['sharpe_ratio'])}",
+                f"Sortino ratio: {self.__format_optional(stats['sortino_ratio'])}",
+                f"Calmar ratio: {self.__format_optional(stats['calmar_ratio'])}",
+                f"Omega ratio: {self.__format_optional(stats['omega_ratio'])}",
+                f"Tail ratio: {self.__format_optional(stats['tail_ratio'])}",
                 f"Winning trades: {stats['profitable_trades_num']} ({stats['profitable_trades_percentage']:.2f}%)",
                 f"Best trade return: {stats['best_trade_return_percentage']:.2f}%",
                 f"Worst trade return: {stats['worst_trade_return_percentage']:.2f}%",
-                f"Beta: {stats['beta']:.2f}",
-                f"Alpha: {stats['alpha']:.2f}",
-                f"Buy and hold return: {stats['buy_and_hold_return_percentage']:.2f}%",
+                f"Average trade MAE: {self.__format_optional(stats['average_mae_percentage'])}%",
+                f"Average trade MFE: {self.__format_optional(stats['average_mfe_percentage'])}%",
+                f"Beta: {self.__format_optional(stats['beta'])}",
+                f"Alpha: {self.__format_optional(stats['alpha'])}",
+                f"Exposure time: {self.__format_optional(stats['exposure_time_percentage'])}%",
+                f"Turnover: {self.__format_optional(stats['turnover'])}",
+                f"Buy and hold return: {self.__format_optional(stats['buy_and_hold_return_percentage'])}%",
                 f"Total commission paid: {stats['total_commission']:.2f}",
             ]
         )
 
+    @staticmethod
+    def __format_optional(value: Optional[float]) -> str:
+        return "N/A" if value is None else f"{value:.2f}"
+
+    def __get_cached(self, key: str, calc: Callable[[], Any]) -> Any:
+        token = (self.__version, len(self.__trades))
+        if token != self.__cache_token:
+            self.__cache.clear()
+            self.__cache_token = token
+
+        if key not in self.__cache:
+            self.__cache[key] = calc()
+
+        return self.__cache[key]
+
+    def __get_trades(self) -> TradeLog:
+        return self.__get_cached("_trades", self.__to_trade_log)
+
+    def __get_peaks(self) -> np.ndarray[Any, np.dtype[Any]]:
+        return self.__get_cached(
+            "_peaks", lambda: np.maximum.accumulate(self.__equity_log)
+        )
+
+    def __get_returns(self) -> np.ndarray[Any, np.dtype[Any]]:
+        return self.__get_cached("_returns", self.__calc_returns)
+
+    def __get_periods_per_year(self) -> float:
+        return self.__get_cached("_periods_per_year", self.__calc_periods_per_year)
+
+    def __is_equity_streamed(self) -> bool:
+        return self.__streamed_equity_count == len(self.__equity_log)
+
+    def __are_trades_recorded(self) -> bool:
+        return self.__recorded_trades_count == len(self.__trades)
+
+    def __get_max_drawdown(self) -> Tuple[float, float]:
+        if self.__is_equity_streamed():
+            return (
+                self.__max_drawdown,
+                np.float64(self.__max_drawdown) / self.__max_drawdown_peak * 100,
+            )
+
+        return self.__get_cached(
+            "_max_drawdown", lambda: self.__calc_max_drawndown(self.__get_peaks())
+        )
+
+    def __get_max_drawdown_duration(self) -> int:
+        if self.__is_equity_streamed():
+            return self.__max_drawdown_duration
+
+        return self.__calc_max_drawdown_duration(self.__get_peaks())
+
+    def __get_trades_counters(self) -> __TradesCounters:
+        if self.__are_trades_recorded():
+            return self.__recorded_trades_counters
+
+        return self.__get_cached(
+            "_trades_counters", lambda: self.__calc_trades_counters(self.__get_trades())
+        )
+
+    def __get_trades_returns_percentage(self) -> np.ndarray[Any, np.dtype[Any]]:
+        return self.__get_cached(
+            "_trades_returns_percentage",
+            lambda: self.__calc_close_trades_returns_percentage(self.__get_trades()),
+        )
+
+    def __calc_final_assets_value(self) -> float:
+        return self.__equity_log[-1] - self.__account.current_money
+
+    def __calc_return(self) -> float:
+        return self.__equity_log[-1] - self.__equity_log[0]
+
+    def __calc_return_percentage(self) -> float:
+        return self.__calc_return() / self.__equity_log[0] * 100
+
+    def __calc_peak_equity(self) -> float:
+        if self.__is_equity_streamed():
+            return self.__peak_equity
+
+        return self.__equity_log.max()
+
+    def __calc_profitable_trades_number(self) -> int:
+        if self.__are_trades_recorded():
+            return self.__profitable_trades_num
+
+        return int(np.count_nonzero(self.__get_trades_returns_percentage() > 0))
+
+    def __calc_best_trade_return_percentage(self) -> float:
+        if self.__are_trades_recorded():
+            return self.__best_trade_return_percentage
+
+        return float(self.__get_trades_returns_percentage().max(initial=0.0))
+
+    def __calc_worst_trade_return_percentage(self) -> float:
+        if self.__are_trades_recorded():
+            return self.__worst_trade_return_percentage
+
+        return float(self.__get_trades_returns_percentage().min(initial=0.0))
+
+    def __calc_excursion_stat(
+        self,
+        excursion_index: int,
+        reduce: Callable[[np.ndarray[Any, np.dtype[Any]]], Any],
+    ) -> Optional[float]:
+        if self.__data is None or np.isnat(self.__data.datetime).any():
+            return None
+
+        excursions = self.get_trades_excursions()[excursion_index]
+        excursions = excursions[~np.isnan(excursions)]
+        if len(excursions) == 0:
+            return None
+
+        return float(reduce(excursions))
+
+    def __calc_exposure_time_percentage(self) -> Optional[float]:
+        if self.__exposure_log is None or len(self.__exposure_log) < 2:
+            return None
+
+        # The first entry is before the first candlestick, when no positions are open
+        open_positions = self.__exposure_log["open_positions"][1:]
+        return float(np.count_nonzero(open_positions > 0) / len(open_positions) * 100)
+
+    def __calc_average_exposure_percentage(self, field: str) -> Optional[float]:
+        if self.__exposure_log is None or len(self.__exposure_log) < 2:
+            return None
+
+        equity_log = np.asarray(self.__equity_log[1:], dtype=float)
+        exposures = self.__exposure_log[field][1:]
+        solvent = equity_log > 0
+        if not solvent.any():
+            return None
+
+        return float(np.mean(exposures[solvent] / equity_log[solvent]) * 100)
+
+    def __calc_turnover(self) -> Optional[float]:
+        average_equity = np.mean(self.__equity_log)
+        if average_equity <= 0:
+            return None
+
+        trades = self.__get_trades()
+        traded_value = np.nansum(trades.open_price * trades.open_size) + np.nansum(
+            trades.close_price * trades.close_size
+        )
+
+        return float(traded_value / average_equity)
+
+    def __calc_profitable_trades_percentage(self) -> float:
+        total_close_trades = self.__get_trades_counters().total_close_trades
+        if total_close_trades == 0:
+            return 0.0
+
+        return self.__calc_profitable_trades_number() / total_close_trades * 100
+
     def __calc_max_drawndown(
         self, peaks: np.ndarray[Any, np.dtype[Any]]
     ) -> Tuple[float, float]:
@@ -155,156 +742,387 @@ class Statistics:
         self, peaks: np.ndarray[Any, np.dtype[Any]]
     ) -> int:
         drawdowns_occurred = self.__equity_log < peaks
+        if not drawdowns_occurred.any():
+            return 0
 
-        longest_drawdown_duration = 0
-        current_drawdown_duration = 0
-        for is_drawdown in drawdowns_occurred:
-            if is_drawdown:
-                current_drawdown_duration += 1
-            else:
-                longest_drawdown_duration = max(
-                    longest_drawdown_duration, current_drawdown_duration
-                )
-                current_drawdown_duration = 0
-        longest_drawdown_duration = max(
-            longest_drawdown_duration, current_drawdown_duration
+        # Run-length encoding of drawdowns: starts and ends of consecutive drawdown periods
+        changes = np.diff(
+            np.concatenate(([False], drawdowns_occurred, [False])).astype(np.int8)
         )
-        return longest_drawdown_duration
+        starts = np.flatnonzero(changes == 1)
+        ends = np.flatnonzero(changes == -1)
+
+        return int((ends - starts).max())
+
+    def __calc_returns(self) -> np.ndarray[Any, np.dtype[Any]]:
+        equity_log = np.asarray(self.__equity_log, dtype=float)
+        previous_equity = equity_log[:-1]
+
+        # Returns after bankruptcy (equity dropped to zero) are zero instead of undefined
+        with np.errstate(divide="ignore", invalid="ignore"):
+            returns = np.diff(equity_log) / previous_equity
+
+        return np.where(previous_equity > 0, returns, 0.0)
 
-    def __calc_beta(self) -> Optional[float]:
-        if self.__benchmark is None:
+    def __calc_periods_per_year(self) -> float:
+        if self.__periods_per_year is not None:
+            return self.__periods_per_year
+        if self.__data is None:
+            return self.__DEFAULT_PERIODS_PER_YEAR
+
+        datetimes = self.__data.datetime.astype("datetime64[ns]")
+        datetimes = datetimes[~np.isnat(datetimes)]
+        if len(datetimes) < 2:
+            return self.__DEFAULT_PERIODS_PER_YEAR
+
+        span = (datetimes[-1] - datetimes[0]).astype(np.int64)
+        if span <= 0:
+            return self.__DEFAULT_PERIODS_PER_YEAR
+
+        return (len(datetimes) - 1) / (span / self.__YEAR_NANOSECONDS)
+
+    def __calc_elapsed_years(self) -> float:
+        # The equity log starts before the first candlestick, so with inferred periods per year
+        # this is the span of the data's datetimes extended by the duration of an average candlestick
+        return (len(self.__equity_log) - 1) / self.__get_periods_per_year()
+
+    def __calc_volatility_percentage(self) -> Optional[float]:
+        returns = self.__get_returns()
+        if len(returns) < 2:
             return None
 
-        benchmark_data = np.insert(
-            self.__benchmark.close, 0, self.__benchmark.open[0], axis=0
+        return float(
+            np.std(returns, ddof=1) * np.sqrt(self.__get_periods_per_year()) * 100
         )
-        benchmark_returns = np.diff(benchmark_data) / benchmark_data[:-1]
 
-        equity_returns = np.diff(self.__equity_log) / self.__equity_log[:-1]
+    def __calc_cagr_percentage(self) -> Optional[float]:
+        returns_num = len(self.__equity_log) - 1
+        if returns_num < 1 or self.__equity_log[0] <= 0:
+            return None
 
-        if len(benchmark_returns) < 2 or len(equity_returns) < 2:
+        total_growth = self.__equity_log[-1] / self.__equity_log[0]
+        if total_growth <= 0:
+            return -100.0
+
+        return float((total_growth ** (1 / self.__calc_elapsed_years()) - 1) * 100)
+
+    def __calc_sharpe_ratio(self) -> Optional[float]:
+        returns = self.__get_returns()
+        if len(returns) < 2:
             return None
 
-        covariance = np.cov(equity_returns, benchmark_returns)[0, 1]
-        market_variance = np.var(benchmark_returns, ddof=1)
+        std = np.std(returns, ddof=1)
+        if std == 0:
+            return None
 
-        if market_variance == 0:
+        return float(np.mean(returns) / std * np.sqrt(self.__get_periods_per_year()))
+
+    def __calc_sortino_ratio(self) -> Optional[float]:
+        returns = self.__get_returns()
+        if len(returns) < 2:
             return None
 
-        return covariance / market_variance
+        downside_deviation = np.sqrt(np.mean(np.minimum(returns, 0.0) ** 2))
+        if downside_deviation == 0:
+            return None
 
-    def __calc_alpha(
-        self, beta: Optional[float], risk_free_rate: float = 0.0
-    ) -> Optional[float]:
-        if beta is None or self.__benchmark is None:
+        return float(
+            np.mean(returns)
+            / downside_deviation
+            * np.sqrt(self.__get_periods_per_year())
+        )
+
+    def __calc_calmar_ratio(self) -> Optional[float]:
+        cagr_percentage = self.__get_cached(
+            "cagr_percentage", self.__calc_cagr_percentage
+        )
+        max_drawdown_percentage = self.__get_max_drawdown()[1]
+        if cagr_percentage is None or max_drawdown_percentage == 0:
             return None
 
-        equity_return = (
-            self.__equity_log[-1] - self.__equity_log[0]
-        ) / self.__equity_log[0]
-        benchmark_return = (
-            self.__benchmark.close[-1] - self.__benchmark.open[0]
-        ) / self.__benchmark.open[0]
+        return float(cagr_percentage / max_drawdown_percentage)
 
-        return (
-            equity_return - risk_free_rate - beta * (benchmark_return - risk_free_rate)
+    def __calc_omega_ratio(self) -> Optional[float]:
+        returns = self.__get_returns()
+        losses = -np.minimum(returns, 0.0).sum()
+        if losses == 0:
+            return None
+
+        return float(np.maximum(returns, 0.0).sum() / losses)
+
+    def __calc_tail_ratio(self) -> Optional[float]:
+        returns = self.__get_returns()
+        if len(returns) == 0:
+            return None
+
+        right_tail, left_tail = np.percentile(returns, [95, 5])
+        if left_tail == 0:
+            return None
+
+        return float(abs(right_tail) / abs(left_tail))
+
+    def __calc_rolling_return_percentage(
+        self, window: int
+    ) -> np.ndarray[Any, np.dtype[Any]]:
+        equity_log = np.asarray(self.__equity_log, dtype=float)
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return (equity_log[window:] / equity_log[:-window] - 1) * 100
+
+    def __calc_rolling_drawdown_percentage(
+        self, window: int
+    ) -> np.ndarray[Any, np.dtype[Any]]:
+        equity_log = np.asarray(self.__equity_log, dtype=float)
+        peaks = self.__rolling_max(equity_log, window + 1)
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return (peaks - equity_log[window:]) / peaks * 100
+
+    def __calc_rolling_sharpe_ratio(
+        self, window: int
+    ) -> np.ndarray[Any, np.dtype[Any]]:
+        returns = self.__get_returns()
+        # Centering keeps the cumulative sums small, so differences of them don't lose precision
+        mean = returns.mean()
+        centered_returns = returns - mean
+
+        sums = self.__rolling_sum(centered_returns, window)
+        squares_sums = self.__rolling_sum(centered_returns**2, window)
+        variances = np.maximum(squares_sums - sums**2 / window, 0.0) / (window - 1)
+        stds = np.sqrt(variances)
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            sharpe_ratios = (sums / window + mean) / stds
+
+        return np.where(
+            stds > self.__ROLLING_EPSILON,
+            sharpe_ratios * np.sqrt(self.__get_periods_per_year()),
+            np.nan,
         )
 
-    def __get_trades_counters(self) -> __TradesCounters:
-        counters = self.__TradesCounters()
-        for trade in self.__trades:
-            if trade.trade_type == TradeType.OPEN:
-                counters.total_open_trades += 1
-                if trade.position_type == PositionType.LONG:
-                    counters.total_open_long_trades += 1
-                else:
-                    counters.total_open_short_trades += 1
-            else:
-                counters.total_close_trades += 1
-                if trade.position_type == PositionType.LONG:
-                    counters.total_close_long_trades += 1
-                else:
-                    counters.total_close_short_trades += 1
+    def __calc_rolling_beta(
+        self,
+        returns: np.ndarray[Any, np.dtype[Any]],
+        benchmark_returns: np.ndarray[Any, np.dtype[Any]],
+        window: int,
+    ) -> np.ndarray[Any, np.dtype[Any]]:
+        centered_returns = returns - returns.mean()
+        centered_benchmark_returns = benchmark_returns - benchmark_returns.mean()
+
+        returns_sums = self.__rolling_sum(centered_returns, window)
+        benchmark_sums = self.__rolling_sum(centered_benchmark_returns, window)
+        products_sums = self.__rolling_sum(
+            centered_returns * centered_benchmark_returns, window
+        )
+        benchmark_squares_sums = self.__rolling_sum(
+            centered_benchmark_returns**2, window
+        )
 
-        return counters
+        covariances = products_sums - returns_sums * benchmark_sums / window
+        benchmark_variances = benchmark_squares_sums - benchmark_sums**2 / window
 
-    def __calc_profitable_trades_number(self) -> int:
-        """Calculates the number of winning trades.
+        with np.errstate(divide="ignore", invalid="ignore"):
+            betas = covariances / benchmark_variances
 
-        Returns:
-            int: The number of winning trades.
-        """
+        return np.where(benchmark_variances > self.__ROLLING_EPSILON, betas, np.nan)
 
-        winning_trades = 0
-        for trade in self.__trades:
-            if trade.trade_type != TradeType.CLOSE:
-                continue
+    @staticmethod
+    def __rolling_sum(
+        values: np.ndarray[Any, np.dtype[Any]], window: int
+    ) -> np.ndarray[Any, np.dtype[Any]]:
+        cumulative_sums = np.concatenate(([0.0], np.cumsum(values)))
+        return cumulative_sums[window:] - cumulative_sums[:-window]
 
-            if trade.position_type == PositionType.LONG:
-                assert trade.close_price is not None
-                if trade.close_price > trade.open_price:
-                    winning_trades += 1
-            elif trade.position_type == PositionType.SHORT:
-                assert trade.close_price is not None
-                if trade.close_price < trade.open_price:
-                    winning_trades += 1
-
-        return winning_trades
-
-    def __get_best_trade_return_percentage(self) -> float:
-        best_winning_trade_return_percentage = 0.0
-        for trade in self.__trades:
-            if trade.trade_type != TradeType.CLOSE:
-                continue
+    @staticmethod
+    def __rolling_max(
+        values: np.ndarray[Any, np.dtype[Any]], window: int
+    ) -> np.ndarray[Any, np.dtype[Any]]:
+        # van Herk/Gil-Werman algorithm: the maximum of a window is the maximum of the suffix maximum
+        # of the block where the window starts and the prefix maximum of the block where it ends.
+        blocks_num = -(-len(values) // window)
+        padded_values = np.full(blocks_num * window, -np.inf)
+        padded_values[: len(values)] = values
+        blocks = padded_values.reshape(blocks_num, window)
 
-            trade_return_percentage = 0.0
-            if trade.position_type == PositionType.LONG:
-                assert trade.close_price is not None
-                trade_return_percentage = (
-                    (trade.close_price - trade.open_price) / trade.open_price * 100
-                )
-            elif trade.position_type == PositionType.SHORT:
-                assert trade.close_price is not None
-                trade_return_percentage = (
-                    (trade.open_price - trade.close_price) / trade.open_price * 100
+        prefix_max = np.maximum.accumulate(blocks, axis=1).ravel()
+        suffix_max = np.maximum.accumulate(blocks[:, ::-1], axis=1)[:, ::-1].ravel()
+
+        return np.maximum(
+            suffix_max[: len(values) - window + 1], prefix_max[window - 1 : len(values)]
+        )
+
+    def __calc_benchmark_prices(
+        self, benchmark: Data
+    ) -> np.ndarray[Any, np.dtype[Any]]:
+        # Benchmark prices at each entry of the equity log: the first entry is before the first candlestick opens,
+        # the others are at closes of candlesticks. NaN where the benchmark price isn't available.
+        if not self.__can_align_by_datetime(benchmark):
+            if len(benchmark) != len(self.__equity_log) - 1:
+                raise ValueError(
+                    "Benchmark without datetimes must have the same length as the data."
                 )
 
-            best_winning_trade_return_percentage = max(
-                best_winning_trade_return_percentage, trade_return_percentage
-            )
+            return np.insert(benchmark.close.astype(float), 0, benchmark.open[0])
 
-        return best_winning_trade_return_percentage
+        assert self.__data is not None
+        datetimes = self.__data.datetime.astype("datetime64[ns]")
+        benchmark_datetimes = benchmark.datetime.astype("datetime64[ns]")
+        if np.any(benchmark_datetimes[1:] < benchmark_datetimes[:-1]):
+            raise ValueError("Benchmark datetimes must be sorted.")
 
-    def __get_worst_trade_return_percentage(self) -> float:
-        worst_losing_trade_return_percentage = 0.0
-        for trade in self.__trades:
-            if trade.trade_type != TradeType.CLOSE:
-                continue
+        # Index of the last benchmark candlestick at or before each candlestick of the data
+        indices = np.searchsorted(benchmark_datetimes, datetimes, side="right") - 1
+        found = indices >= 0
+        indices = np.maximum(indices, 0)
+        exact = found & (benchmark_datetimes[indices] == datetimes)
+        available = exact if self.__benchmark_alignment == "intersection" else found
 
-            trade_return_percentage = 0.0
-            if trade.position_type == PositionType.LONG:
-                assert trade.close_price is not None
-                trade_return_percentage = (
-                    (trade.close_price - trade.open_price) / trade.open_price * 100
-                )
-            elif trade.position_type == PositionType.SHORT:
-                assert trade.close_price is not None
-                trade_return_percentage = (
-                    (trade.open_price - trade.close_price) / trade.open_price * 100
-                )
+        closes = np.where(available, benchmark.close[indices], np.nan)
+        if exact[0]:
+            first_price = benchmark.open[indices[0]]
+        elif available[0]:
+            first_price = benchmark.close[indices[0]]
+        else:
+            first_price = np.nan
 
-            worst_losing_trade_return_percentage = min(
-                worst_losing_trade_return_percentage, trade_return_percentage
-            )
+        return np.insert(closes.astype(float), 0, first_price)
 
-        return worst_losing_trade_return_percentage
+    def __can_align_by_datetime(self, benchmark: Data) -> bool:
+        if self.__data is None or len(self.__data) != len(self.__equity_log) - 1:
+            return False
 
-    def __get_buy_and_hold_return_percentage(self) -> Optional[float]:
-        if self.__benchmark is None:
-            return 0.0
+        return len(benchmark) > 0 and not (
+            np.isnat(self.__data.datetime.astype("datetime64[ns]")).any()
+            or np.isnat(benchmark.datetime.astype("datetime64[ns]")).any()
+        )
+
+    def __get_benchmark_name(self, name: Optional[str]) -> str:
+        if not self.__benchmarks_prices:
+            raise ValueError("Benchmark is required.")
+        if name is None:
+            return next(iter(self.__benchmarks_prices))
+        if name not in self.__benchmarks_prices:
+            raise ValueError(f"Unknown benchmark: {name}.")
+
+        return name
+
+    def __get_benchmark_returns(self, name: str) -> Tuple[
+        np.ndarray[Any, np.dtype[Any]],
+        np.ndarray[Any, np.dtype[Any]],
+        np.ndarray[Any, np.dtype[Any]],
+    ]:
+        # Indices of the equity log entries where the benchmark is available,
+        # and returns of the equity and the benchmark between consecutive such entries
+        prices = self.__benchmarks_prices[name]
+        indices = np.flatnonzero(~np.isnan(prices))
+        equity_log = np.asarray(self.__equity_log, dtype=float)[indices]
+        prices = prices[indices]
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            returns = np.diff(equity_log) / equity_log[:-1]
+            benchmark_returns = np.diff(prices) / prices[:-1]
+
+        return indices, np.where(equity_log[:-1] > 0, returns, 0.0), benchmark_returns
+
+    def __get_primary_benchmark_stats(self) -> Dict[str, Optional[float]]:
+        if not self.__benchmarks_prices:
+            return {"beta": None, "alpha": None, "buy_and_hold_return_percentage": 0.0}
+
+        return self.__get_benchmark_stats(next(iter(self.__benchmarks_prices)))
+
+    def __get_benchmark_stats(self, name: str) -> Dict[str, Optional[float]]:
+        return self.__get_cached(
+            f"_benchmark_stats_{name}", lambda: self.__calc_benchmark_stats(name)
+        )
+
+    def __calc_benchmark_stats(self, name: str) -> Dict[str, Optional[float]]:
+        indices, equity_returns, benchmark_returns = self.__get_benchmark_returns(name)
+        if len(indices) < 2:
+            return {"beta": None, "alpha": None, "buy_and_hold_return_percentage": None}
+
+        prices = self.__benchmarks_prices[name]
+        equity_return = (
+            self.__equity_log[indices[-1]] - self.__equity_log[indices[0]]
+        ) / self.__equity_log[indices[0]]
+        benchmark_return = (prices[indices[-1]] - prices[indices[0]]) / prices[
+            indices[0]
+        ]
+        beta = self.__calc_beta(equity_returns, benchmark_returns)
+
+        return {
+            "beta": beta,
+            "alpha": self.__calc_alpha(beta, equity_return, benchmark_return),
+            "buy_and_hold_return_percentage": benchmark_return * 100,
+        }
+
+    def __calc_beta(
+        self,
+        equity_returns: np.ndarray[Any, np.dtype[Any]],
+        benchmark_returns: np.ndarray[Any, np.dtype[Any]],
+    ) -> Optional[float]:
+        if len(benchmark_returns) < 2 or len(equity_returns) < 2:
+            return None
+
+        covariance = np.cov(equity_returns, benchmark_returns)[0, 1]
+        market_variance = np.var(benchmark_returns, ddof=1)
+
+        if market_variance == 0:
+            return None
+
+        return covariance / market_variance
+
+    def __calc_alpha(
+        self,
+        beta: Optional[float],
+        equity_return: float,
+        benchmark_return: float,
+        risk_free_rate: float = 0.0,
+    ) -> Optional[float]:
+        if beta is None:
+            return None
 
         return (
-            (self.__benchmark.close[-1] - self.__benchmark.open[0])
-            / self.__benchmark.open[0]
-            * 100
+            equity_return - risk_free_rate - beta * (benchmark_return - risk_free_rate)
         )
+
+    def __calc_trades_counters(self, trades: TradeLog) -> __TradesCounters:
+        open_trades = trades.trade_type == TradeType.OPEN.value
+        long_trades = trades.position_type == PositionType.LONG.value
+
+        return self.__TradesCounters(
+            total_open_trades=int(np.count_nonzero(open_trades)),
+            total_close_trades=int(np.count_nonzero(~open_trades)),
+            total_open_long_trades=int(np.count_nonzero(open_trades & long_trades)),
+            total_close_long_trades=int(np.count_nonzero(~open_trades & long_trades)),
+            total_open_short_trades=int(np.count_nonzero(open_trades & ~long_trades)),
+            total_close_short_trades=int(np.count_nonzero(~open_trades & ~long_trades)),
+        )
+
+    def __calc_close_trades_returns_percentage(
+        self, trades: TradeLog
+    ) -> np.ndarray[Any, np.dtype[Any]]:
+        close_trades = trades.trade_type == TradeType.CLOSE.value
+        open_prices = trades.open_price[close_trades]
+        close_prices = trades.close_price[close_trades]
+
+        returns = (close_prices - open_prices) / open_prices * 100
+        short_trades = trades.position_type[close_trades] == PositionType.SHORT.value
+
+        return np.where(short_trades, -returns, returns)
+
+    def __calc_close_trades_profit_loss(
+        self, trades: TradeLog
+    ) -> np.ndarray[Any, np.dtype[Any]]:
+        close_trades = trades.trade_type == TradeType.CLOSE.value
+        profit_loss = (
+            trades.close_price[close_trades] - trades.open_price[close_trades]
+        ) * trades.close_size[close_trades]
+        short_trades = trades.position_type[close_trades] == PositionType.SHORT.value
+
+        return np.where(short_trades, -profit_loss, profit_loss)
+
+    def __to_trade_log(self) -> TradeLog:
+        if isinstance(self.__trades, TradeLog):
+            return self.__trades
+
+        return TradeLog.from_trades(self.__trades)
@@ -0,0 +1,83 @@
+from typing import Callable
+
+from .stats import Statistics
+
+StopCondition = Callable[[Statistics, int], bool]
+"""Predicate deciding whether the backtest should be stopped early (pruned).
+
+Called after every processed candlestick with the statistics (see `Statistics.get_running_stats`)
+and the index of the candlestick. Returns True to stop the backtest.
+"""
+
+
+def max_drawdown_above(max_drawdown: float, percentage: bool = False) -> StopCondition:
+    """Stops the backtest once the maximum drawdown exceeds the given value.
+
+    Args:
+        max_drawdown (float): The maximum allowed drawdown.
+        percentage (bool): Whether the value is a percentage of the peak equity. Default is False (absolute value).
+
+    Returns:
+        StopCondition: The stop condition.
+    """
+
+    key = "max_drawdown_percentage" if percentage else "max_drawdown"
+
+    def condition(statistics: Statistics, data_index: int) -> bool:
+        return statistics.get_running_stats()[key] > max_drawdown
+
+    return condition
+
+
+def equity_below(equity: float) -> StopCondition:
+    """Stops the backtest once the total equity falls below the given value.
+
+    Args:
+        equity (float): The minimum allowed equity.
+
+    Returns:
+        StopCondition: The stop condition.
+    """
+
+    def condition(statistics: Statistics, data_index: int) -> bool:
+        return statistics.get_running_stats()["equity"] < equity
+
+    return condition
+
+
+def too_few_trades(min_trades: int, by_data_index: int) -> StopCondition:
+    """Stops the backtest if fewer trades than required have been made by the given candlestick.
+
+    Args:
+        min_trades (int): The minimum number of trades.
+        by_data_index (int): The index of the candlestick by which the trades should be made.
+
+    Returns:
+        StopCondition: The stop condition.
+    """
+
+    def condition(statistics: Statistics, data_index: int) -> bool:
+        return (
+            data_index >= by_data_index
+            and statistics.get_running_stats()["total_trades"] < min_trades
+        )
+
+    return condition
+
+
+def any_of(*conditions: StopCondition) -> StopCondition:
+    """Stops the backtest once any of the given conditions is met.
+
+    Args:
+        *conditions (StopCondition): The stop conditions.
+
+    Returns:
+        StopCondition: The stop condition.
+    """
+
+    def condition(statistics: Statistics, data_index: int) -> bool:
+        return any(
+            stop_condition(statistics, data_index) for stop_condition in conditions
+        )
+
+    return condition
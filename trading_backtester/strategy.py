@@ -1,12 +1,62 @@
 from datetime import datetime
-from typing import List, Sequence
+from numbers import Integral, Real
+from typing import Any, Dict, Iterator, List, Mapping, Optional, Tuple
 
 from .account import Account
 from .data import CandlestickPhase, Data
 from .indicator import Indicator
+from .indicator_store import IndicatorStore
+from .limit_order_book import LimitOrdersView
 from .market import Market
-from .order import Order
-from .position import Position
+from .order import Order, OrderRejectionReason
+from .order_arrays import OrderArrays
+from .position import PositionsView
+from .trade import Trade
+
+
+class StrategyParams(Mapping[str, Any]):
+    """Represents the resolved parameters of a strategy.
+
+    Immutable and hashable mapping, so it can be used as a cache key
+    and sent to worker processes together with the strategy's class.
+    The hash is calculated lazily and isn't pickled, as hashes of strings differ between processes.
+    """
+
+    def __init__(self, params: Mapping[str, Any]):
+        """Initializes a StrategyParams object.
+
+        Args:
+            params (Mapping[str, Any]): The parameters' names and values. Values must be hashable.
+        """
+
+        self.__params = dict(params)
+        self.__hash: Optional[int] = None
+
+    def __getitem__(self, name: str) -> Any:
+        return self.__params[name]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.__params)
+
+    def __len__(self) -> int:
+        return len(self.__params)
+
+    def __hash__(self) -> int:
+        if self.__hash is None:
+            self.__hash = hash(tuple(sorted(self.__params.items())))
+        return self.__hash
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, StrategyParams):
+            return self.__params == other.__params
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"StrategyParams({self.__params!r})"
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        # Rebuilt from the parameters only, so the hash is recalculated in the receiving process
+        return (StrategyParams, (self.__params,))
 
 
 class Strategy:
@@ -15,8 +65,25 @@ class Strategy:
     Should be subclassed by the user to implement specific trading strategies.
     """
 
-    def __init__(self):
-        self.__positions: List[Position]
+    params: Dict[str, Any] = {}
+    """Parameters declared by the strategy, with their default values.
+
+    Values passed for parameters must be of the same type as the default value,
+    any type is accepted if the default value is None. Any integral number (e.g. NumPy integers) is accepted
+    for int parameters and any real number for float parameters, they are converted to int and float respectively.
+    Subclasses declaring parameters should accept them as keyword arguments and pass them to `Strategy.__init__`.
+    """
+
+    def __init__(self, **params: Any):
+        """Initializes a Strategy object.
+
+        Args:
+            **params: Values of the parameters declared in `params`. Missing parameters take their default values.
+        """
+
+        self.__params = self.resolve_params(params)
+        self.__positions: PositionsView
+        self.__limit_orders: LimitOrdersView
         self.__candlesticks_to_skip = 0
         self.__account: Account
         self.__market: Market
@@ -28,6 +95,7 @@ class Strategy:
 
         This method is intended to be implemented by the user to define their own strategy's order logic.
         It should be overridden in subclasses to provide specific order logic.
+        It may be implemented as a coroutine (`async def`), then the backtest must be run with `Backtester.run_async`.
 
         Args:
             candlestick_phase (CandlestickPhase): The current candlestick phase (open or close).
@@ -39,15 +107,163 @@ class Strategy:
         """
         raise NotImplementedError("This method should be implemented in subclasses.")
 
-    def prepare_indicators(self, data: Data) -> None:
+    def generate_orders(self, data: Data) -> Optional[OrderArrays]:
+        """Generates the user's orders for the whole history at once.
+
+        Alternative to `collect_orders` for strategies that don't depend on the state of the backtest
+        (e.g. orders are derived from indicators only). If it returns orders,
+        `collect_orders` is not called at all and the orders are passed to the broker at their candlestick and phase.
+        Orders placed at candlesticks skipped for indicators' warm-up are ignored.
+
+        Called once, after the indicators are prepared.
+
+        Args:
+            data (Data): The data object containing market data.
+
+        Returns:
+            Optional[OrderArrays]: The orders for the whole history. None (default) if `collect_orders` should be used instead.
+        """
+
+        return None
+
+    def on_fill(self, trade: Trade) -> None:
+        """Handles a filled open order (both market and limit).
+
+        Called by the broker right after the position is opened.
+        Does nothing by default, may be overridden in subclasses to track the strategy's state incrementally.
+
+        Args:
+            trade (Trade): The open trade of the filled order.
+        """
+
+        pass
+
+    def on_close(self, trade: Trade) -> None:
+        """Handles a position (or its part) closed by a close order.
+
+        Called by the broker right after the position is closed.
+        Positions closed by stop loss or take profit are handled by `on_stop_loss` and `on_take_profit`.
+        Does nothing by default, may be overridden in subclasses.
+
+        Args:
+            trade (Trade): The close trade.
+        """
+
+        pass
+
+    def on_stop_loss(self, trade: Trade) -> None:
+        """Handles a position closed by its stop loss.
+
+        Does nothing by default, may be overridden in subclasses.
+
+        Args:
+            trade (Trade): The close trade.
+        """
+
+        pass
+
+    def on_take_profit(self, trade: Trade) -> None:
+        """Handles a position closed by its take profit.
+
+        Does nothing by default, may be overridden in subclasses.
+
+        Args:
+            trade (Trade): The close trade.
+        """
+
+        pass
+
+    def on_order_rejected(self, order: Order, reason: OrderRejectionReason) -> None:
+        """Handles an order rejected by the broker.
+
+        Does nothing by default, may be overridden in subclasses.
+
+        Args:
+            order (Order): The rejected order.
+            reason (OrderRejectionReason): The reason of the rejection.
+        """
+
+        pass
+
+    def prepare_indicators(
+        self, data: Data, indicator_store: Optional[IndicatorStore] = None
+    ) -> None:
         for member_name in dir(self):
             member = getattr(self, member_name)
             if isinstance(member, Indicator):
-                member.prepare_indicator(data)
+                member.prepare_indicator(data, indicator_store)
                 self.__candlesticks_to_skip = max(
                     self.__candlesticks_to_skip, member.candlesticks_to_skip()
                 )
 
+    @classmethod
+    def resolve_params(
+        cls, params: Optional[Mapping[str, Any]] = None
+    ) -> StrategyParams:
+        """Validates the given parameters against the declared ones and fills in the default values.
+
+        Args:
+            params (Optional[Mapping[str, Any]]): The parameters' values. Optional.
+
+        Returns:
+            StrategyParams: The resolved parameters of the strategy.
+
+        Raises:
+            ValueError: If a parameter is not declared by the strategy.
+            TypeError: If a parameter's value is of a wrong type or is not hashable.
+        """
+
+        params = params if params is not None else {}
+
+        for name in params:
+            if name not in cls.params:
+                raise ValueError(
+                    f"Unknown parameter '{name}' of strategy {cls.__name__}."
+                )
+
+        resolved_params: Dict[str, Any] = {}
+        for name, default_value in cls.params.items():
+            value = params.get(name, default_value)
+
+            if default_value is not None and value is not None:
+                # Numbers (e.g. values of NumPy grids) are converted to built-in types, so equal parameters hash the same
+                if type(default_value) is int and cls.__is_number(value, Integral):
+                    value = int(value)
+                elif type(default_value) is float and cls.__is_number(value, Real):
+                    value = float(value)
+
+                if type(value) is not type(default_value) and not (
+                    isinstance(value, type(default_value))
+                    and not isinstance(value, bool)
+                ):
+                    raise TypeError(
+                        f"Parameter '{name}' of strategy {cls.__name__} must be of type {type(default_value).__name__}."
+                    )
+
+            try:
+                hash(value)
+            except TypeError:
+                raise TypeError(
+                    f"Parameter '{name}' of strategy {cls.__name__} must be hashable."
+                ) from None
+
+            resolved_params[name] = value
+
+        return StrategyParams(resolved_params)
+
+    @staticmethod
+    def __is_number(value: Any, number_type: type) -> bool:
+        return isinstance(value, number_type) and not isinstance(value, bool)
+
+    @property
+    def _params(self) -> StrategyParams:
+        """Returns the resolved parameters of the strategy.
+
+        Provides the user with a way to read the strategy's parameters (declared in `params`).
+        """
+
+        return self.__params
+
     @property
     def _market(self) -> Market:
         """Returns the market object.
@@ -59,15 +275,27 @@ class Strategy:
         return self.__market
 
     @property
-    def _positions(self) -> Sequence[Position]:
+    def _positions(self) -> PositionsView:
         """Returns the current positions.
 
         Provides the user with a way to check the current positions in the account.
-        This includes all open positions.
+        This includes all open positions. The returned view is read-only and is not a copy,
+        it also provides aggregates of the positions (e.g. total long size, average open price).
         """
 
         assert self.__positions is not None, "Positions have not been set."
-        return tuple(self.__positions)
+        return self.__positions
+
+    @property
+    def _limit_orders(self) -> LimitOrdersView:
+        """Returns the pending limit orders.
+
+        Provides the user with a way to check and cancel limit orders that have not been executed yet.
+        The returned view is not a copy, it always reflects the current pending orders.
+        """
+
+        assert self.__limit_orders is not None, "Limit orders have not been set."
+        return self.__limit_orders
 
     @property
     def _current_money(self) -> float:
@@ -94,11 +322,16 @@ class Strategy:
 
         return self.__candlesticks_to_skip
 
-    def set_positions(self, positions: List[Position]) -> None:
-        """Sets reference to the positions' list."""
+    def set_positions(self, positions: PositionsView) -> None:
+        """Sets reference to the positions' view."""
 
         self.__positions = positions
 
+    def set_limit_orders(self, limit_orders: LimitOrdersView) -> None:
+        """Sets reference to the pending limit orders' view."""
+
+        self.__limit_orders = limit_orders
+
     def set_account(self, account: Account) -> None:
         """Sets reference to the account object."""
 
@@ -32,6 +32,7 @@ class Trade:
         close_price (Optional[float]): The price at which the trade was closed. Optional for open trades.
         close_size (Optional[float]): The size of the trade when closed. Optional for open trades.
         market_order (bool): Indicates whether the trade was a market order or a limit order.
+        strategy_id (Optional[int]): The identifier of the strategy that made the trade. Optional.
     """
 
     def __init__(
@@ -45,6 +46,7 @@ class Trade:
         close_price: Optional[float] = None,
         close_size: Optional[float] = None,
         market_order: bool = False,
+        strategy_id: Optional[int] = None,
     ):
         """Initializes a Trade object.
 
@@ -58,6 +60,7 @@ class Trade:
             close_price (Optional[float]): The price at which the trade was closed. Optional for open trades.
             close_size (Optional[float]): The size of the trade when closed. Optional for open trades.
             market_order (bool): Indicates whether the trade was a market order or a limit order.
+            strategy_id (Optional[int]): The identifier of the strategy that made the trade. Optional.
         """
 
         assert not (
@@ -77,6 +80,7 @@ class Trade:
         self.close_price = close_price
         self.close_size = close_size
         self.market_order = market_order
+        self.strategy_id = strategy_id
 
     def calc_profit_loss(self) -> float:
         """Calculates the profit/loss of the completed trade.
@@ -111,6 +115,7 @@ class OpenTrade(Trade):
         price: float,
         size: float,
         market_order: bool,
+        strategy_id: Optional[int] = None,
     ):
         """Initializes an OpenTrade object.
         Args:
@@ -119,6 +124,7 @@ class OpenTrade(Trade):
             price (float): The price at which the trade was opened.
             size (float): The size of the trade when opened.
             market_order (bool): Indicates whether the trade was a market order or a limit order.
+            strategy_id (Optional[int]): The identifier of the strategy that made the trade. Optional.
         """
 
         super().__init__(
@@ -128,6 +134,7 @@ class OpenTrade(Trade):
             open_price=price,
             open_size=size,
             market_order=market_order,
+            strategy_id=strategy_id,
         )
 
 
@@ -146,6 +153,7 @@ class CloseTrade(Trade):
         close_price: float,
         close_size: float,
         market_order: bool,
+        strategy_id: Optional[int] = None,
     ):
         """Initializes a CloseTrade object.
 
@@ -157,6 +165,7 @@ class CloseTrade(Trade):
             close_price (float): The price at which the trade was closed.
             close_size (float): The size of the trade when closed.
             market_order (bool): Indicates whether the trade was a market order or a limit order.
+            strategy_id (Optional[int]): The identifier of the strategy that made the trade. Optional.
         """
         super().__init__(
             trade_type=TradeType.CLOSE,
@@ -167,4 +176,5 @@ class CloseTrade(Trade):
             close_price=close_price,
             close_size=close_size,
             market_order=market_order,
+            strategy_id=strategy_id,
         )
@@ -0,0 +1,344 @@
+from typing import (
+    Any,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+    overload,
+)
+
+import numpy as np
+
+from .data import Data
+from .position import PositionType
+from .trade import Trade, TradeType
+
+# TRADE_LOG_TYPE defines the structured dtype of a single row of the trade log.
+# Fields:
+#     trade_type (int8): Value of the `TradeType` enum.
+#     position_type (int8): Value of the `PositionType` enum.
+#     open_datetime (datetime64[ns]): The datetime when the trade was opened.
+#     open_price (float): The price at which the trade was opened.
+#     open_size (float): The size of the trade when opened. NaN for close trades.
+#     close_datetime (datetime64[ns]): The datetime when the trade was closed. NaT for open trades.
+#     close_price (float): The price at which the trade was closed. NaN for open trades.
+#     close_size (float): The size of the trade when closed. NaN for open trades.
+#     market_order (bool): Whether the trade was a market order or a limit order.
+#     strategy_id (int64): The identifier of the strategy that made the trade. -1 if not set.
+TRADE_LOG_TYPE = np.dtype(
+    [
+        ("trade_type", "i1"),
+        ("position_type", "i1"),
+        ("open_datetime", "datetime64[ns]"),
+        ("open_price", "f8"),
+        ("open_size", "f8"),
+        ("close_datetime", "datetime64[ns]"),
+        ("close_price", "f8"),
+        ("close_size", "f8"),
+        ("market_order", "?"),
+        ("strategy_id", "i8"),
+    ]
+)
+
+
+class TradeLog(Sequence[Trade]):
+    """Represents the log of trades made during the backtest, stored column-wise in NumPy arrays.
+
+    Trades are appended one by one, the underlying array doubles its capacity when full.
+    Columns are available as NumPy arrays for vectorized calculations,
+    and single trades as `Trade` objects created on access, for compatibility with the list of trades.
+    """
+
+    def __init__(self, capacity: int = 64):
+        """Initializes an empty TradeLog object.
+
+        Args:
+            capacity (int): The initial number of trades the log can hold without growing. Default is 64.
+        """
+
+        self.__trades = np.zeros(max(capacity, 1), dtype=TRADE_LOG_TYPE)
+        self.__length = 0
+
+    @classmethod
+    def from_trades(cls, trades: Iterable[Trade]) -> "TradeLog":
+        """Creates a trade log from trades.
+
+        Args:
+            trades (Iterable[Trade]): The trades to put in the log.
+
+        Returns:
+            TradeLog: The trade log containing the trades.
+        """
+
+        trades = list(trades)
+        trade_log = cls(capacity=len(trades))
+        for trade in trades:
+            trade_log.append(trade)
+
+        return trade_log
+
+    @overload
+    def __getitem__(self, index: int) -> Trade: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> List[Trade]: ...
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[Trade, List[Trade]]:
+        """Returns the trade at the given index.
+
+        Args:
+            index (Union[int, slice]): The index of the trade.
+
+        Returns:
+            Union[Trade, List[Trade]]: The trade at the index, or a list of trades for a slice.
+        """
+
+        if isinstance(index, slice):
+            return [self.__create_trade(row) for row in range(self.__length)[index]]
+
+        if index < 0:
+            index += self.__length
+        if index < 0 or index >= self.__length:
+            raise IndexError("Trade index out of range.")
+
+        return self.__create_trade(index)
+
+    def __len__(self) -> int:
+        return self.__length
+
+    def __iter__(self) -> Iterator[Trade]:
+        for row in range(self.__length):
+            yield self.__create_trade(row)
+
+    def append(self, trade: Trade) -> None:
+        """Appends the trade to the end of the log.
+
+        Args:
+            trade (Trade): The trade to append.
+        """
+
+        if self.__length == len(self.__trades):
+            self.__grow()
+
+        row = self.__trades[self.__length]
+        row["trade_type"] = trade.trade_type.value
+        row["position_type"] = trade.position_type.value
+        row["open_datetime"] = trade.open_datetime
+        row["open_price"] = trade.open_price
+        row["open_size"] = np.nan if trade.open_size is None else trade.open_size
+        row["close_datetime"] = (
+            np.datetime64("NaT", "ns")
+            if trade.close_datetime is None
+            else trade.close_datetime
+        )
+        row["close_price"] = np.nan if trade.close_price is None else trade.close_price
+        row["close_size"] = np.nan if trade.close_size is None else trade.close_size
+        row["market_order"] = trade.market_order
+        row["strategy_id"] = -1 if trade.strategy_id is None else trade.strategy_id
+
+        self.__length += 1
+
+    def get_data(self) -> np.ndarray[Any, np.dtype[Any]]:
+        """Returns the trades as a structured array (see `TRADE_LOG_TYPE`).
+
+        The returned array is a view, valid until the next trade is appended.
+
+        Returns:
+            np.ndarray[Any, np.dtype[Any]]: The trades.
+        """
+
+        return self.__trades[: self.__length]
+
+    @property
+    def trade_type(self) -> np.ndarray[Any, np.dtype[Any]]:
+        """Returns the types of trades (values of the `TradeType` enum).
+
+        Returns:
+            np.ndarray[Any, np.dtype[Any]]: The types of trades.
+        """
+
+        return self.get_data()["trade_type"]
+
+    @property
+    def position_type(self) -> np.ndarray[Any, np.dtype[Any]]:
+        """Returns the types of positions (values of the `PositionType` enum).
+
+        Returns:
+            np.ndarray[Any, np.dtype[Any]]: The types of positions.
+        """
+
+        return self.get_data()["position_type"]
+
+    @property
+    def open_datetime(self) -> np.ndarray[Any, np.dtype[Any]]:
+        """Returns the datetimes when trades were opened.
+
+        Returns:
+            np.ndarray[Any, np.dtype[Any]]: The open datetimes.
+        """
+
+        return self.get_data()["open_datetime"]
+
+    @property
+    def open_price(self) -> np.ndarray[Any, np.dtype[Any]]:
+        """Returns the prices at which trades were opened.
+
+        Returns:
+            np.ndarray[Any, np.dtype[Any]]: The open prices.
+        """
+
+        return self.get_data()["open_price"]
+
+    @property
+    def open_size(self) -> np.ndarray[Any, np.dtype[Any]]:
+        """Returns the sizes of open trades, NaN for close trades.
+
+        Returns:
+            np.ndarray[Any, np.dtype[Any]]: The open sizes.
+        """
+
+        return self.get_data()["open_size"]
+
+    @property
+    def close_datetime(self) -> np.ndarray[Any, np.dtype[Any]]:
+        """Returns the datetimes when trades were closed, NaT for open trades.
+
+        Returns:
+            np.ndarray[Any, np.dtype[Any]]: The close datetimes.
+        """
+
+        return self.get_data()["close_datetime"]
+
+    @property
+    def close_price(self) -> np.ndarray[Any, np.dtype[Any]]:
+        """Returns the prices at which trades were closed, NaN for open trades.
+
+        Returns:
+            np.ndarray[Any, np.dtype[Any]]: The close prices.
+        """
+
+        return self.get_data()["close_price"]
+
+    @property
+    def close_size(self) -> np.ndarray[Any, np.dtype[Any]]:
+        """Returns the sizes of close trades, NaN for open trades.
+
+        Returns:
+            np.ndarray[Any, np.dtype[Any]]: The close sizes.
+        """
+
+        return self.get_data()["close_size"]
+
+    @property
+    def market_order(self) -> np.ndarray[Any, np.dtype[Any]]:
+        """Returns whether trades were market orders.
+
+        Returns:
+            np.ndarray[Any, np.dtype[Any]]: The market order flags.
+        """
+
+        return self.get_data()["market_order"]
+
+    @property
+    def strategy_id(self) -> np.ndarray[Any, np.dtype[Any]]:
+        """Returns the identifiers of strategies that made trades, -1 if not set.
+
+        Returns:
+            np.ndarray[Any, np.dtype[Any]]: The strategies' identifiers.
+        """
+
+        return self.get_data()["strategy_id"]
+
+    def calc_excursions(self, data: Data) -> Tuple[
+        np.ndarray[Any, np.dtype[Any]],
+        np.ndarray[Any, np.dtype[Any]],
+    ]:
+        """Calculates the maximum adverse and favorable excursions (MAE, MFE) of close trades.
+
+        Excursions are the largest moves of the price against and in favor of the trade while it was open,
+        taken from lows and highs of candlesticks between the trade's open and close candlesticks (both included),
+        as percentages of the open price. Candlesticks are found by datetime, so the data must have datetimes.
+
+        Args:
+            data (Data): The data the trades were made on.
+
+        Returns:
+            Tuple[np.ndarray[Any, np.dtype[Any]], np.ndarray[Any, np.dtype[Any]]]: The MAE and MFE percentages
+                for every trade in the log, NaN for open trades.
+
+        Raises:
+            ValueError: If the data has no datetimes.
+        """
+
+        datetimes = data.datetime.astype("datetime64[ns]")
+        if np.isnat(datetimes).any():
+            raise ValueError("Data must have datetimes to calculate excursions.")
+
+        mae_percentage = np.full(self.__length, np.nan)
+        mfe_percentage = np.full(self.__length, np.nan)
+        close_trades = np.flatnonzero(self.trade_type == TradeType.CLOSE.value)
+        if len(close_trades) == 0 or len(datetimes) == 0:
+            return mae_percentage, mfe_percentage
+
+        trades = self.get_data()[close_trades]
+        open_indices = np.searchsorted(datetimes, trades["open_datetime"])
+        close_indices = np.searchsorted(datetimes, trades["close_datetime"])
+        open_indices = np.minimum(open_indices, len(datetimes) - 1)
+        close_indices = np.clip(close_indices, open_indices, len(datetimes) - 1)
+
+        # reduceat reduces between consecutive indices, so every trade's range is followed by its end,
+        # and every other result (between the end of one trade and the start of the next one) is dropped.
+        # The appended element makes the end of the last candlestick a valid index.
+        bounds = np.column_stack([open_indices, close_indices + 1]).ravel()
+        lows = np.minimum.reduceat(np.append(data.low, np.inf), bounds)[::2]
+        highs = np.maximum.reduceat(np.append(data.high, -np.inf), bounds)[::2]
+
+        open_prices = trades["open_price"]
+        long_trades = trades["position_type"] == PositionType.LONG.value
+        signs = np.where(long_trades, 1.0, -1.0)
+        adverse_moves = signs * (open_prices - np.where(long_trades, lows, highs))
+        favorable_moves = signs * (np.where(long_trades, highs, lows) - open_prices)
+
+        mae_percentage[close_trades] = (
+            np.maximum(adverse_moves, 0.0) / open_prices * 100
+        )
+        mfe_percentage[close_trades] = (
+            np.maximum(favorable_moves, 0.0) / open_prices * 100
+        )
+
+        return mae_percentage, mfe_percentage
+
+    def __grow(self) -> None:
+        trades = np.zeros(2 * len(self.__trades), dtype=TRADE_LOG_TYPE)
+        trades[: self.__length] = self.__trades[: self.__length]
+        self.__trades = trades
+
+    def __create_trade(self, row: int) -> Trade:
+        trade = self.__trades[row]
+        trade_type = TradeType(int(trade["trade_type"]))
+        is_close_trade = trade_type == TradeType.CLOSE
+        strategy_id = int(trade["strategy_id"])
+
+        return Trade(
+            trade_type=trade_type,
+            position_type=PositionType(int(trade["position_type"])),
+            open_datetime=trade["open_datetime"],
+            open_price=float(trade["open_price"]),
+            open_size=None if is_close_trade else self.__to_size(trade["open_size"]),
+            close_datetime=trade["close_datetime"] if is_close_trade else None,
+            close_price=float(trade["close_price"]) if is_close_trade else None,
+            close_size=self.__to_size(trade["close_size"]) if is_close_trade else None,
+            market_order=bool(trade["market_order"]),
+            strategy_id=None if strategy_id < 0 else strategy_id,
+        )
+
+    @staticmethod
+    def __to_size(size: float) -> Optional[float]:
+        if np.isnan(size):
+            return None
+
+        size = float(size)
+        return int(size) if size.is_integer() else size